@@ -6,7 +6,6 @@ IQR法と統計的手法を使用して、支出を定期的/不定期的に分
 
 from __future__ import annotations
 
-from statistics import mean, stdev
 from typing import NamedTuple
 
 import numpy as np
@@ -20,6 +19,52 @@ class ClassificationResult(NamedTuple):
     reasoning: dict  # 分類根拠の詳細情報
 
 
+class IQRResult(NamedTuple):
+    """IQR法による分析結果"""
+
+    has_outliers: bool
+    outlier_count: int
+    outlier_ratio: float
+    iqr: float
+    q1: float
+    q3: float
+    lower_bound: float
+    upper_bound: float
+
+
+class OccurrenceResult(NamedTuple):
+    """発生頻度による分析結果"""
+
+    occurrence_rate: float
+    is_regular: bool
+    occurrences: int
+    months: int
+    interpretation: str
+
+    def as_dict(self) -> dict:
+        """表示用に丸めた辞書へ変換"""
+        return {**self._asdict(), "occurrence_rate": round(self.occurrence_rate, 3)}
+
+
+class CVResult(NamedTuple):
+    """変動係数による分析結果"""
+
+    cv: float
+    is_stable: bool
+    mean: float
+    std: float
+    interpretation: str
+
+    def as_dict(self) -> dict:
+        """表示用に丸めた辞書へ変換"""
+        return {
+            **self._asdict(),
+            "cv": round(self.cv, 3),
+            "mean": round(self.mean, 2),
+            "std": round(self.std, 2),
+        }
+
+
 class ExpenseClassifier:
     """
     支出分類クラス
@@ -51,35 +96,68 @@ class ExpenseClassifier:
             - q1, q3: 第1四分位数、第3四分位数
 
         """
-        if len(amounts) < 4:
-            return {
-                "has_outliers": False,
-                "outlier_count": 0,
-                "outlier_ratio": 0.0,
-                "iqr": 0.0,
-                "q1": 0.0,
-                "q3": 0.0,
-            }
-
-        q1 = np.percentile(amounts, 25)
-        q3 = np.percentile(amounts, 75)
+        return ExpenseClassifier._classify_by_iqr_arr(
+            np.asarray(amounts, dtype=np.float64), threshold
+        )._asdict()
+
+    @staticmethod
+    def _classify_by_iqr_arr(
+        arr: np.ndarray, threshold: float = IQR_THRESHOLD
+    ) -> IQRResult:
+        """変換済みの float64 配列に対する classify_by_iqr 本体"""
+        if arr.size < 4:
+            return IQRResult(
+                has_outliers=False,
+                outlier_count=0,
+                outlier_ratio=0.0,
+                iqr=0.0,
+                q1=0.0,
+                q3=0.0,
+                lower_bound=0.0,
+                upper_bound=0.0,
+            )
+
+        q1, q3 = ExpenseClassifier._quartiles(arr)
         iqr = q3 - q1
 
         lower_bound = q1 - threshold * iqr
         upper_bound = q3 + threshold * iqr
 
-        outliers = [a for a in amounts if a < lower_bound or a > upper_bound]
+        outlier_count = int(((arr < lower_bound) | (arr > upper_bound)).sum())
+
+        return IQRResult(
+            has_outliers=outlier_count > 0,
+            outlier_count=outlier_count,
+            outlier_ratio=outlier_count / arr.size,
+            iqr=float(iqr),
+            q1=float(q1),
+            q3=float(q3),
+            lower_bound=float(lower_bound),
+            upper_bound=float(upper_bound),
+        )
 
-        return {
-            "has_outliers": len(outliers) > 0,
-            "outlier_count": len(outliers),
-            "outlier_ratio": len(outliers) / len(amounts),
-            "iqr": float(iqr),
-            "q1": float(q1),
-            "q3": float(q3),
-            "lower_bound": float(lower_bound),
-            "upper_bound": float(upper_bound),
-        }
+    @staticmethod
+    def _quartiles(arr: np.ndarray) -> tuple[float, float]:
+        """
+        第1・第3四分位数を1回の部分ソートで計算
+
+        np.percentile の既定（linear 補間）と同じ値を返す。
+
+        Args:
+            arr: 要素数4以上の float64 配列
+
+        Returns:
+            (q1, q3)
+
+        """
+        pos1 = (arr.size - 1) * 0.25
+        pos3 = (arr.size - 1) * 0.75
+        lo1, lo3 = int(pos1), int(pos3)
+        part = np.partition(arr, sorted({lo1, lo1 + 1, lo3, lo3 + 1}))
+
+        q1 = part[lo1] + (pos1 - lo1) * (part[lo1 + 1] - part[lo1])
+        q3 = part[lo3] + (pos3 - lo3) * (part[lo3 + 1] - part[lo3])
+        return float(q1), float(q3)
 
     @staticmethod
     def classify_by_occurrence(
@@ -100,20 +178,29 @@ class ExpenseClassifier:
             - interpretation: 解釈テキスト
 
         """
+        return ExpenseClassifier._classify_by_occurrence(
+            months, occurrences, threshold
+        ).as_dict()
+
+    @staticmethod
+    def _classify_by_occurrence(
+        months: int, occurrences: int, threshold: float = OCCURRENCE_RATE_THRESHOLD
+    ) -> OccurrenceResult:
+        """classify_by_occurrence 本体"""
         if months <= 0:
             raise ValueError(f"月数は正の数である必要があります: {months}")
 
         occurrence_rate = occurrences / months
 
-        return {
-            "occurrence_rate": round(occurrence_rate, 3),
-            "is_regular": occurrence_rate >= threshold,
-            "occurrences": occurrences,
-            "months": months,
-            "interpretation": (
+        return OccurrenceResult(
+            occurrence_rate=occurrence_rate,
+            is_regular=occurrence_rate >= threshold,
+            occurrences=occurrences,
+            months=months,
+            interpretation=(
                 f"対象{months}ヶ月中{occurrences}ヶ月に発生（{occurrence_rate * 100:.1f}%）"
             ),
-        }
+        )
 
     @staticmethod
     def classify_by_cv(amounts: list[float], threshold: float = CV_THRESHOLD) -> dict:
@@ -132,32 +219,41 @@ class ExpenseClassifier:
             - std: 標準偏差
 
         """
-        if len(amounts) < 2:
-            return {
-                "cv": 0.0,
-                "is_stable": True,
-                "mean": float(amounts[0]) if amounts else 0.0,
-                "std": 0.0,
-                "interpretation": "データポイント数が不足",
-            }
+        return ExpenseClassifier._classify_by_cv_arr(
+            np.asarray(amounts, dtype=np.float64), threshold
+        ).as_dict()
 
-        mean_val = mean(amounts)
+    @staticmethod
+    def _classify_by_cv_arr(
+        arr: np.ndarray, threshold: float = CV_THRESHOLD
+    ) -> CVResult:
+        """変換済みの float64 配列に対する classify_by_cv 本体"""
+        if arr.size < 2:
+            return CVResult(
+                cv=0.0,
+                is_stable=True,
+                mean=float(arr[0]) if arr.size else 0.0,
+                std=0.0,
+                interpretation="データポイント数が不足",
+            )
+
+        mean_val = float(arr.mean())
 
         if mean_val == 0:
             raise ValueError("平均値が0のため変動係数を計算できません")
 
-        std_val = stdev(amounts)
+        std_val = float(arr.std(ddof=1))
         cv = std_val / abs(mean_val)
 
-        return {
-            "cv": round(cv, 3),
-            "is_stable": cv <= threshold,
-            "mean": round(mean_val, 2),
-            "std": round(std_val, 2),
-            "interpretation": (
+        return CVResult(
+            cv=cv,
+            is_stable=cv <= threshold,
+            mean=mean_val,
+            std=std_val,
+            interpretation=(
                 f"変動係数: {cv:.3f} ({'安定' if cv <= threshold else '変動'})"
             ),
-        }
+        )
 
     @staticmethod
     def calculate_confidence(
@@ -180,37 +276,43 @@ class ExpenseClassifier:
             信頼度（0.0-1.0）
 
         """
-        confidence = 0.0
-
-        # IQR スコア
-        if not iqr_result.get("has_outliers", True):
-            confidence += 0.3
-        else:
-            # 異常値割合が少ない場合は部分的にスコア
-            outlier_ratio = iqr_result.get("outlier_ratio", 1.0)
-            confidence += max(0, 0.3 * (1 - outlier_ratio))
-
-        # 発生頻度 スコア
-        if occurrence_result.get("is_regular", False):
-            confidence += 0.35
-        else:
-            occurrence_rate = occurrence_result.get("occurrence_rate", 0.0)
-            confidence += max(0, 0.35 * occurrence_rate)
-
-        # 変動係数 スコア
-        if cv_result.get("is_stable", False):
-            confidence += 0.35
-        else:
-            cv = cv_result.get("cv", 1.0)
-            # CV が大きいほど信頼度は低下
-            confidence += max(0, 0.35 * max(0, 1 - cv))
+        return ExpenseClassifier._confidence_score(
+            has_outliers=iqr_result.get("has_outliers", True),
+            outlier_ratio=iqr_result.get("outlier_ratio", 1.0),
+            is_regular=occurrence_result.get("is_regular", False),
+            occurrence_rate=occurrence_result.get("occurrence_rate", 0.0),
+            is_stable=cv_result.get("is_stable", False),
+            cv=cv_result.get("cv", 1.0),
+        )
+
+    @staticmethod
+    def _confidence_score(
+        has_outliers: bool,
+        outlier_ratio: float,
+        is_regular: bool,
+        occurrence_rate: float,
+        is_stable: bool,
+        cv: float,
+    ) -> float:
+        """calculate_confidence 本体（指標値を直接受け取る）"""
+        # 判定フラグ（0/1）で満点と部分点を切り替え、分岐なしで合算する
+        # IQR スコア: 異常値なしなら満点、ありなら異常値割合に応じて部分点
+        iqr_score = 0.3 * max(0.0, 1.0 - has_outliers * outlier_ratio)
+        # 発生頻度 スコア: 定期的なら満点、それ以外は発生頻度に比例
+        occurrence_score = 0.35 * max(
+            0.0, occurrence_rate + is_regular * (1.0 - occurrence_rate)
+        )
+        # 変動係数 スコア: 安定なら満点、CV が大きいほど信頼度は低下
+        cv_score = 0.35 * max(0.0, 1.0 - (1.0 - is_stable) * cv)
+
+        confidence = iqr_score + occurrence_score + cv_score
 
         return round(min(1.0, confidence), 3)
 
     @classmethod
     def classify(
         cls,
-        amounts: list[float],
+        amounts: list[float] | np.ndarray,
         months: int,
         occurrences: int,
         use_default_thresholds: bool = True,
@@ -219,7 +321,7 @@ class ExpenseClassifier:
         総合的な支出分類を実行
 
         Args:
-            amounts: 発生した月の支出額リスト
+            amounts: 発生した月の支出額リスト（float64 配列ならそのまま使用）
             months: 分析対象月数
             occurrences: 実際の発生月数
             use_default_thresholds: デフォルト閾値を使用するか
@@ -240,20 +342,26 @@ class ExpenseClassifier:
                 reasoning={"reason": "発生なし", "iqr": {}, "occurrence": {}, "cv": {}},
             )
 
-        # 3つの指標を計算
-        iqr_result = cls.classify_by_iqr(amounts)
-        occurrence_result = cls.classify_by_occurrence(months, occurrences)
-        cv_result = cls.classify_by_cv(amounts)
+        # 3つの指標を計算（配列変換は1回だけ行い、IQR/CV で共有）
+        arr = np.asarray(amounts, dtype=np.float64)
+        iqr_result = cls._classify_by_iqr_arr(arr)
+        occurrence_result = cls._classify_by_occurrence(months, occurrences)
+        cv_result = cls._classify_by_cv_arr(arr)
 
         # 信頼度を計算
-        confidence = cls.calculate_confidence(iqr_result, occurrence_result, cv_result)
+        confidence = cls._confidence_score(
+            has_outliers=iqr_result.has_outliers,
+            outlier_ratio=iqr_result.outlier_ratio,
+            is_regular=occurrence_result.is_regular,
+            occurrence_rate=occurrence_result.occurrence_rate,
+            is_stable=cv_result.is_stable,
+            cv=cv_result.cv,
+        )
 
         # 分類ロジック：
         # - 発生頻度 >= 60% かつ 変動係数 <= 30% → 定期的
         # - その他 → 不定期的
-        is_regular = occurrence_result.get("is_regular", False) and cv_result.get(
-            "is_stable", False
-        )
+        is_regular = occurrence_result.is_regular and cv_result.is_stable
 
         classification = "regular" if is_regular else "irregular"
 
@@ -261,8 +369,8 @@ class ExpenseClassifier:
             classification=classification,
             confidence=confidence,
             reasoning={
-                "iqr": iqr_result,
-                "occurrence": occurrence_result,
-                "cv": cv_result,
+                "iqr": iqr_result._asdict(),
+                "occurrence": occurrence_result.as_dict(),
+                "cv": cv_result.as_dict(),
             },
         )
@@ -6,13 +6,13 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from decimal import Decimal
-from statistics import mean, stdev
+from functools import lru_cache
+from itertools import chain
 from typing import Literal
 
 import numpy as np
-from scipy import stats
 
 
 @dataclass
@@ -57,6 +57,26 @@ class ExpensePatternResult:
     seasonality: list[SeasonalityAnalysis]
     trends: list[TrendAnalysis]
     analysis_period_months: int
+    anomalies: dict[str, list[int]] = field(default_factory=dict)  # 平均+2σ超の月
+
+
+@lru_cache(maxsize=32)
+def _trend_basis(length: int) -> tuple[float, np.ndarray, float]:
+    """
+    月インデックス x = 0..length-1 の回帰用定数を計算（系列長ごとにキャッシュ）
+
+    Args:
+        length: 系列長（月数）
+
+    Returns:
+        (x の平均, 中心化した x（読み取り専用）, 中心化した x の二乗和)
+
+    """
+    x = np.arange(length, dtype=np.float64)
+    x_mean = float(x.mean())
+    x_centered = x - x_mean
+    x_centered.flags.writeable = False
+    return x_mean, x_centered, float(x_centered @ x_centered)
 
 
 class ExpensePatternAnalyzer:
@@ -84,55 +104,184 @@ class ExpensePatternAnalyzer:
             支出パターン分析結果
 
         """
-        classifications = []
-        seasonality_list = []
-        trends = []
-
-        for category, amounts in expense_data.items():
-            if len(amounts) < self.MIN_DATA_POINTS:
-                # データ不足
-                continue
-
-            # 分類
-            classification = self._classify_expense(category, amounts)
-            classifications.append(classification)
-
-            # 季節性分析
-            if len(amounts) >= 12:
-                season = self._analyze_seasonality(category, amounts)
-                seasonality_list.append(season)
+        valid_items = [
+            (category, amounts)
+            for category, amounts in expense_data.items()
+            if len(amounts) >= self.MIN_DATA_POINTS  # データ不足はスキップ
+        ]
 
-            # トレンド分析
-            if len(amounts) >= 3:
-                trend = self._analyze_trend(category, amounts)
-                trends.append(trend)
+        classification_slots: list[ExpenseClassification | None] = [None] * len(
+            valid_items
+        )
+        trend_slots: list[TrendAnalysis | None] = [None] * len(valid_items)
+        anomaly_slots: dict[int, list[int]] = {}
+
+        # 同じ長さの系列を (K, M) 行列にまとめ、統計量を一括計算
+        for indices, matrix in self._stack_by_length(valid_items):
+            length = matrix.shape[1]
+            means, stds, sigma_mask = self._scan(matrix, self.ANOMALY_THRESHOLD_SIGMA)
+            slopes, intercepts, r_squared = self._fit_trends(matrix, means)
+
+            # 行ごとの結果は tolist() でまとめて Python float に変換し、
+            # カテゴリ単位のループでは数値演算を行わない
+            row_stats = zip(
+                means.tolist(),
+                stds.tolist(),
+                slopes.tolist(),
+                intercepts.tolist(),
+                r_squared.tolist(),
+                strict=True,
+            )
+            row_anomalies = self._mask_rows_to_indices(sigma_mask)
+
+            for idx, (mean_value, std_value, slope, intercept, r2), months in zip(
+                indices, row_stats, row_anomalies, strict=True
+            ):
+                category = valid_items[idx][0]
+                # 分類
+                classification_slots[idx] = self._classify_expense(
+                    category, mean_value, std_value, length
+                )
+                # トレンド分析
+                trend_slots[idx] = self._analyze_trend(category, slope, intercept, r2)
+                # 異常月（同じ走査結果を再利用）
+                if months:
+                    anomaly_slots[idx] = months
+
+        # 季節性分析
+        seasonality_list = [
+            self._analyze_seasonality(category, amounts)
+            for category, amounts in valid_items
+            if len(amounts) >= 12
+        ]
 
         return ExpensePatternResult(
-            classifications=classifications,
+            classifications=[c for c in classification_slots if c is not None],
             seasonality=seasonality_list,
-            trends=trends,
+            trends=[t for t in trend_slots if t is not None],
             analysis_period_months=len(next(iter(expense_data.values()))),
+            anomalies={
+                valid_items[idx][0]: anomaly_slots[idx] for idx in sorted(anomaly_slots)
+            },
         )
 
+    @staticmethod
+    def _stack_by_length(
+        items: list[tuple[str, list[Decimal]]],
+    ) -> list[tuple[list[int], np.ndarray]]:
+        """
+        同じ長さの系列をまとめて行列化
+
+        Args:
+            items: (カテゴリ名, 月別支出額) のリスト
+
+        Returns:
+            (items内のインデックス, (K, M) の float64 行列) のリスト
+
+        """
+        rows_by_length: dict[int, list[int]] = {}
+        for idx, (_, amounts) in enumerate(items):
+            rows_by_length.setdefault(len(amounts), []).append(idx)
+
+        # Decimal → float64 は中間リストを作らず連続バッファへ直接書き込む
+        return [
+            (
+                indices,
+                np.fromiter(
+                    map(float, chain.from_iterable(items[i][1] for i in indices)),
+                    dtype=np.float64,
+                    count=len(indices) * length,
+                ).reshape(len(indices), length),
+            )
+            for length, indices in rows_by_length.items()
+        ]
+
+    @staticmethod
+    def _scan(
+        matrix: np.ndarray, sigma_threshold: float
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        行ごとの平均・標準偏差と、平均 + σ閾値を超える要素のマスクを一括計算
+
+        Args:
+            matrix: (カテゴリ数, 月数) の支出行列
+            sigma_threshold: シグマ閾値
+
+        Returns:
+            (平均, 不偏標準偏差, 異常値マスク) のタプル
+
+        """
+        means = matrix.mean(axis=1)
+        stds = matrix.std(axis=1, ddof=1)
+        sigma_mask = matrix > (means + sigma_threshold * stds)[:, None]
+        return means, stds, sigma_mask
+
+    @staticmethod
+    def _mask_rows_to_indices(mask: np.ndarray) -> list[list[int]]:
+        """
+        2次元マスクを行ごとの True 列インデックスのリストに変換
+
+        Args:
+            mask: (カテゴリ数, 月数) の真偽値行列
+
+        Returns:
+            行ごとの列インデックスリスト
+
+        """
+        rows, cols = np.nonzero(mask)
+        boundaries = np.searchsorted(rows, np.arange(1, mask.shape[0]))
+        return [part.tolist() for part in np.split(cols, boundaries)]
+
+    @staticmethod
+    def _fit_trends(
+        matrix: np.ndarray, means: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        複数系列の線形回帰を一括計算
+
+        Args:
+            matrix: (カテゴリ数, 月数) の支出行列
+            means: 各系列の平均
+
+        Returns:
+            (傾き, 切片, R二乗値) の配列タプル
+
+        """
+        # 閉形式の最小二乗: 中心化した x, y の内積だけで傾き・切片・R二乗を求める
+        x_mean, x_centered, sxx = _trend_basis(matrix.shape[1])
+        y_centered = matrix - means[:, None]
+
+        sxy = y_centered @ x_centered
+        syy = np.einsum("ij,ij->i", y_centered, y_centered)
+
+        slopes = sxy / sxx
+        intercepts = means - slopes * x_mean
+
+        # 定数系列（syy == 0）は決定係数 0 とする
+        r_squared = np.zeros_like(syy)
+        np.divide(sxy * sxy, sxx * syy, out=r_squared, where=syy > 0)
+
+        return slopes, intercepts, r_squared
+
     def _classify_expense(
-        self, category: str, amounts: list[Decimal]
+        self, category: str, mean_value: float, std_value: float, data_points: int
     ) -> ExpenseClassification:
         """
         支出を分類（定期/変動/異常）
 
         Args:
             category: カテゴリ名
-            amounts: 月別支出額
+            mean_value: 月別支出額の平均
+            std_value: 月別支出額の標準偏差（不偏）
+            data_points: データポイント数
 
         Returns:
             分類結果
 
         """
-        amounts_float = [float(a) for a in amounts]
-
-        avg = Decimal(str(mean(amounts_float)))
-        if len(amounts_float) > 1:
-            std = Decimal(str(stdev(amounts_float)))
+        avg = Decimal(str(mean_value))
+        if data_points > 1:
+            std = Decimal(str(std_value))
         else:
             std = Decimal("0")
 
@@ -154,7 +303,7 @@ class ExpensePatternAnalyzer:
             average_amount=avg,
             variance=variance_pct,
             std_deviation=std,
-            data_points=len(amounts),
+            data_points=data_points,
         )
 
     def _analyze_seasonality(
@@ -171,49 +320,36 @@ class ExpensePatternAnalyzer:
             季節性分析結果
 
         """
-        # 12ヶ月単位での平均を計算
-        monthly_sums = [Decimal("0")] * 12
-        monthly_counts = [0] * 12
-
-        for i, amount in enumerate(amounts):
-            month_idx = i % 12
-            monthly_sums[month_idx] += amount
-            monthly_counts[month_idx] += 1
+        # 12ヶ月単位での平均を計算（float64 で集計し Decimal 演算を避ける）
+        values = np.fromiter(map(float, amounts), dtype=np.float64, count=len(amounts))
+        month_idx = np.arange(values.size) % 12
+        monthly_sums = np.bincount(month_idx, weights=values, minlength=12)
+        monthly_counts = np.bincount(month_idx, minlength=12)
 
         # 月別平均
-        monthly_averages = [
-            (
-                monthly_sums[i] / monthly_counts[i]
-                if monthly_counts[i] > 0
-                else Decimal("0")
-            )
-            for i in range(12)
-        ]
+        monthly_averages = np.zeros(12)
+        np.divide(
+            monthly_sums, monthly_counts, out=monthly_averages, where=monthly_counts > 0
+        )
 
         # 全体平均
-        overall_avg = sum(monthly_averages) / Decimal(12)
+        overall_avg = monthly_averages.mean()
 
         # 月別指数（100 = 平均）
-        monthly_indices = {}
-        for i, avg in enumerate(monthly_averages):
-            if overall_avg > 0:
-                index = (avg / overall_avg) * 100
-            else:
-                index = 100
-            monthly_indices[i + 1] = float(index)
+        if overall_avg > 0:
+            indices = monthly_averages / overall_avg * 100
+        else:
+            indices = np.full(12, 100.0)
+        monthly_indices = dict(enumerate(indices.tolist(), start=1))
 
         # 季節性判定（最大値と最小値の差が20%以上）
-        indices_values = list(monthly_indices.values())
-        max_idx = max(indices_values)
-        min_idx = min(indices_values)
-        seasonality_range = max_idx - min_idx
+        seasonality_range = float(indices.max() - indices.min())
 
         has_seasonality = seasonality_range >= 20
 
-        # ピークと谷
-        get_func = monthly_indices.get
-        peak_month = max(monthly_indices, key=get_func)  # type: ignore
-        trough_month = min(monthly_indices, key=get_func)  # type: ignore
+        # ピークと谷（同値の場合は最も早い月）
+        peak_month = int(indices.argmax()) + 1
+        trough_month = int(indices.argmin()) + 1
 
         return SeasonalityAnalysis(
             category=category,
@@ -223,42 +359,35 @@ class ExpensePatternAnalyzer:
             trough_month=trough_month,
         )
 
-    def _analyze_trend(self, category: str, amounts: list[Decimal]) -> TrendAnalysis:
+    def _analyze_trend(
+        self, category: str, slope: float, intercept: float, r_squared: float
+    ) -> TrendAnalysis:
         """
-        トレンド分析（線形回帰）
+        トレンド分析（線形回帰結果の判定）
 
         Args:
             category: カテゴリ名
-            amounts: 月別支出額
+            slope: 回帰直線の傾き
+            intercept: 回帰直線の切片
+            r_squared: 決定係数
 
         Returns:
             トレンド分析結果
 
         """
-        amounts_float = np.array([float(a) for a in amounts])
-        x = np.arange(len(amounts_float))
-
-        # 線形回帰
-        result = stats.linregress(x, amounts_float)
-        slope_val: float = result.slope  # type: ignore
-        intercept_val: float = result.intercept  # type: ignore
-        r_value: float = result.rvalue  # type: ignore
-
-        r_squared = r_value**2
-
         # トレンド判定
-        if slope_val > 0.5:  # 閾値: 月0.5円以上の増加
+        if slope > 0.5:  # 閾値: 月0.5円以上の増加
             trend_direction = "increasing"
-        elif slope_val < -0.5:  # 月0.5円以上の減少
+        elif slope < -0.5:  # 月0.5円以上の減少
             trend_direction = "decreasing"
         else:
             trend_direction = "flat"
 
         return TrendAnalysis(
             category=category,
-            slope=slope_val,
-            intercept=intercept_val,
-            r_squared=float(r_squared),
+            slope=slope,
+            intercept=intercept,
+            r_squared=r_squared,
             trend_direction=trend_direction,
         )
 
@@ -278,22 +407,20 @@ class ExpensePatternAnalyzer:
             {カテゴリ: [異常月インデックスリスト]}
 
         """
-        anomalies = {}
-
-        for category, amounts in expense_data.items():
-            if len(amounts) < 3:
-                continue
-
-            amounts_float = [float(a) for a in amounts]
-            avg = mean(amounts_float)
-            std = stdev(amounts_float)
+        items = [
+            (category, amounts)
+            for category, amounts in expense_data.items()
+            if len(amounts) >= 3
+        ]
 
-            threshold = avg + sigma_threshold * std
-            anomaly_indices = [
-                i for i, amount in enumerate(amounts_float) if amount > threshold
-            ]
+        # カテゴリをまとめた行列上で閾値判定を一括実行
+        anomaly_slots: dict[int, list[int]] = {}
+        for indices, matrix in ExpensePatternAnalyzer._stack_by_length(items):
+            _, _, sigma_mask = ExpensePatternAnalyzer._scan(matrix, sigma_threshold)
 
-            if anomaly_indices:
-                anomalies[category] = anomaly_indices
+            row_anomalies = ExpensePatternAnalyzer._mask_rows_to_indices(sigma_mask)
+            for idx, months in zip(indices, row_anomalies, strict=True):
+                if months:
+                    anomaly_slots[idx] = months
 
-        return anomalies
+        return {items[idx][0]: anomaly_slots[idx] for idx in sorted(anomaly_slots)}
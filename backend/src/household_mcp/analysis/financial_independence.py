@@ -7,14 +7,21 @@
 
 from __future__ import annotations
 
+from itertools import islice
 from typing import Any
 
+import numpy as np
+
 from household_mcp.analysis.expense_classifier import (
     ClassificationResult,
     ExpenseClassifier,
 )
 from household_mcp.analysis.fire_calculator import FIRECalculator
-from household_mcp.analysis.trend_statistics import ProjectionScenario, TrendStatistics
+from household_mcp.analysis.trend_statistics import (
+    GrowthRateAnalysis,
+    ProjectionScenario,
+    TrendStatistics,
+)
 
 
 class FinancialIndependenceAnalyzer:
@@ -29,6 +36,9 @@ class FinancialIndependenceAnalyzer:
     5. 改善提案の生成
     """
 
+    # 成長率キャッシュの最大保持件数
+    GROWTH_CACHE_SIZE = 32
+
     def __init__(
         self, min_data_points: int = 3, projection_months: list[int] | None = None
     ):
@@ -42,6 +52,38 @@ class FinancialIndependenceAnalyzer:
         """
         self.min_data_points = min_data_points
         self.projection_months = projection_months or [12, 36, 60]
+        self._growth_cache: dict[tuple[tuple[float, ...], str], GrowthRateAnalysis] = {}
+
+    def _growth_rate(
+        self, asset_history: list[float], method: str = "regression"
+    ) -> GrowthRateAnalysis:
+        """
+        資産履歴の成長率分析（同じ履歴・計算方法の結果を再利用）
+
+        get_status / calculate_scenarios / suggest_improvements は同じ履歴で
+        続けて呼ばれることが多いため、回帰計算を1回に抑える。
+
+        Args:
+            asset_history: 月次資産額の履歴
+            method: 計算方法（TrendStatistics.calculate_monthly_growth_rate と同じ）
+
+        Returns:
+            GrowthRateAnalysis: 成長率分析結果
+
+        """
+        key = (tuple(asset_history), method)
+        cached = self._growth_cache.get(key)
+        if cached is not None:
+            return cached
+
+        analysis = TrendStatistics.calculate_monthly_growth_rate(
+            asset_history, method=method
+        )
+        if len(self._growth_cache) >= self.GROWTH_CACHE_SIZE:
+            # 最も古いエントリを破棄
+            del self._growth_cache[next(iter(self._growth_cache))]
+        self._growth_cache[key] = analysis
+        return analysis
 
     def get_status(
         self,
@@ -91,9 +133,7 @@ class FinancialIndependenceAnalyzer:
 
         # 成長率分析
         if asset_history and len(asset_history) >= self.min_data_points:
-            growth_analysis = TrendStatistics.calculate_monthly_growth_rate(
-                asset_history, method="regression"
-            )
+            growth_analysis = self._growth_rate(asset_history, method="regression")
             result["growth_analysis"] = {
                 "monthly_growth_rate": growth_analysis.monthly_growth_rate,
                 "growth_rate_decimal": growth_analysis.growth_rate_decimal,
@@ -141,9 +181,7 @@ class FinancialIndependenceAnalyzer:
         fire_target = FIRECalculator.calculate_fire_target(annual_expense)
 
         # 基本となる成長率を計算
-        growth_analysis = TrendStatistics.calculate_monthly_growth_rate(
-            asset_history, method="regression"
-        )
+        growth_analysis = self._growth_rate(asset_history, method="regression")
         base_growth = growth_analysis.growth_rate_decimal
 
         # シナリオを作成
@@ -188,8 +226,9 @@ class FinancialIndependenceAnalyzer:
 
         for category_name, amounts in category_history.items():
             # ゼロを除いた実際の発生月をカウント
-            non_zero_amounts = [a for a in amounts if a > 0]
-            occurrences = len(non_zero_amounts)
+            arr = np.asarray(amounts, dtype=np.float64)
+            non_zero_amounts = arr[arr > 0]
+            occurrences = int(non_zero_amounts.size)
 
             if occurrences == 0:
                 # 発生なしのカテゴリ
@@ -239,9 +278,7 @@ class FinancialIndependenceAnalyzer:
 
         # 成長率を分析
         if len(asset_history) >= self.min_data_points:
-            growth_analysis = TrendStatistics.calculate_monthly_growth_rate(
-                asset_history
-            )
+            growth_analysis = self._growth_rate(asset_history)
 
             # 提案1: 成長率が低い場合
             if growth_analysis.growth_rate_decimal < 0.01:  # 1%未満
@@ -282,11 +319,17 @@ class FinancialIndependenceAnalyzer:
                 )
 
         # 提案3: 不定期支出の削減機会
-        irregular_categories = [
-            cat
-            for cat, result in category_classification.items()
-            if result.classification == "irregular"
-        ]
+        # 表示は先頭3件＋「ほか」の有無だけなので、4件見つかった時点で走査を打ち切る
+        irregular_categories = list(
+            islice(
+                (
+                    cat
+                    for cat, result in category_classification.items()
+                    if result.classification == "irregular"
+                ),
+                4,
+            )
+        )
 
         if irregular_categories:
             suggestions.append(
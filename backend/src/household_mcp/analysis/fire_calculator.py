@@ -6,8 +6,13 @@ FIRE基準に基づいた目標資産額の計算と関連ユーティリティ
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 from decimal import Decimal
+from functools import lru_cache
+from typing import Literal
+
+import numpy as np
 
 
 @dataclass
@@ -29,12 +34,16 @@ class FIRECalculator:
     FIRE_MULTIPLIER = 25
 
     @staticmethod
+    @lru_cache(maxsize=128, typed=True)
     def calculate_fire_target(
         annual_expense: float, custom_multiplier: float | None = None
     ) -> float:
         """
         FIRE基準に基づいて目標資産額を計算
 
+        純粋関数のため、同じ引数での再計算（状態取得・シナリオ計算・
+        改善提案で同じ年支出額を使う場合など）は結果をキャッシュして返す。
+
         Args:
             annual_expense: 年支出額（円）
             custom_multiplier: カスタム倍率（デフォルト: 25）
@@ -101,6 +110,7 @@ def calculate_fire_index(
     target_assets: Decimal,
     annual_return_rate: Decimal,
     inflation_rate: Decimal = Decimal("0"),
+    timeline_resolution: Literal["monthly", "yearly", "none"] = "monthly",
 ) -> FireCalculationResult:
     """
     複利とインフレを考慮したFIRE計算エンジン
@@ -114,6 +124,9 @@ def calculate_fire_index(
         target_assets: 目標資産額（円）
         annual_return_rate: 年利回り（小数。5% = 0.05）
         inflation_rate: インフレ率（小数。2% = 0.02）
+        timeline_resolution: 資産推移の粒度。"monthly" は毎月、"yearly" は
+            12ヶ月ごとと最終月のみ。"none" の場合は到達月数のみを閉形式で求め、
+            achieved_assets_timeline は空になる
 
     Returns:
         FireCalculationResult: 計算結果
@@ -135,15 +148,15 @@ def calculate_fire_index(
         )
     if inflation_rate < 0:
         raise ValueError(f"インフレ率は非負の数である必要があります: {inflation_rate}")
+    if timeline_resolution not in ("monthly", "yearly", "none"):
+        raise ValueError(f"不正なタイムライン粒度です: {timeline_resolution}")
+
+    build_timeline = timeline_resolution != "none"
+    yearly = timeline_resolution == "yearly"
 
     # 月利率の計算: (1 + 年利率)^(1/12) - 1
-    annual_rate_plus_1 = Decimal("1") + annual_return_rate
-    # 12乗根の近似計算
-    # 月利 ≈ (1 + 年利)^(1/12) - 1
-    # より精密には: month_rate = (1 + annual_rate)^(1/12) - 1
-    # ここでは簡略化として: month_rate ≈ annual_rate / 12
-    # ただし、複利効果を考慮した正確な計算を行う
-    monthly_rate = _calculate_monthly_rate(annual_rate_plus_1)
+    # シミュレーション本体は float で計算し、Decimal は入出力の境界だけで扱う
+    monthly_rate = _monthly_rate(float(annual_return_rate))
 
     # 到達判定: 月貯蓄が足りるか
     if monthly_savings == 0 and current_assets < target_assets:
@@ -158,30 +171,45 @@ def calculate_fire_index(
 
     # シミュレーション実行（複利計算）
     months_timeline = []
-    assets = current_assets
+    assets = float(current_assets)
+    savings = float(monthly_savings)
+    target = float(target_assets)
     month = 0
     max_months = 1000  # 無限ループ防止
+    # 累積インフレ係数 (1 - インフレ率/12)^month を月ごとに掛け進める
+    inflation_factor = 1.0
+    monthly_deflator = 1.0 - float(inflation_rate) / 12
 
-    while assets < target_assets and month < max_months:
+    if not build_timeline:
+        # 名目資産の到達月数はインフレに依存しないため閉形式で求める
+        month = _months_to_target(assets, savings, target, monthly_rate, max_months)
+        if month < 0:
+            month = max_months
+
+    while build_timeline and assets < target and month < max_months:
         month += 1
         # 利息計算
         interest = assets * monthly_rate
         # 資産更新
-        assets = assets + interest + monthly_savings
+        assets = assets + interest + savings
         # インフレ調整（実質資産の減少）
         if inflation_rate > 0:
-            # 実質資産 = 名目資産 * (1 - インフレ率)^(month/12)
-            inflation_adjustment = inflation_rate / Decimal("12")
-            assets_adjusted = assets * ((Decimal("1") - inflation_adjustment) ** month)
+            # 実質資産 = 名目資産 * (1 - インフレ率/12)^month
+            inflation_factor *= monthly_deflator
+            assets_adjusted = assets * inflation_factor
         else:
             assets_adjusted = assets
 
+        # 年次粒度では12ヶ月ごとと最終月（到達月または上限月）のみ記録
+        if yearly and month % 12 and assets < target and month < max_months:
+            continue
+
         months_timeline.append(
             {
                 "month": month,
-                "nominal_assets": float(assets.quantize(Decimal("0.01"))),
-                "real_assets": float(assets_adjusted.quantize(Decimal("0.01"))),
-                "monthly_interest": float(interest.quantize(Decimal("0.01"))),
+                "nominal_assets": round(assets, 2),
+                "real_assets": round(assets_adjusted, 2),
+                "monthly_interest": round(interest, 2),
             }
         )
 
@@ -190,10 +218,6 @@ def calculate_fire_index(
         feasible = False
         message = "計算期間内に目標に到達できません（月数が上限超過）"
         months_to_fi = -1
-    elif assets < target_assets:
-        feasible = False
-        message = "計算期間内に目標に到達できません"
-        months_to_fi = -1
     else:
         feasible = True
         message = f"{month}ヶ月で目標資産に到達予定"
@@ -228,31 +252,29 @@ def calculate_fire_index(
     )
 
 
-def _calculate_monthly_rate(annual_rate_plus_1: Decimal) -> Decimal:
+@lru_cache(maxsize=32)
+def _monthly_rate(annual_return_rate: float) -> float:
     """
-    年利率から月利率を計算（複利）
+    年利率から月利率を float で計算（複利）
 
-    月利 = (1 + 年利)^(1/12) - 1
+    シナリオの年利率は固定値のため、結果をキャッシュして使い回す。
 
     Args:
-        annual_rate_plus_1: (1 + 年利率)
+        annual_return_rate: 年利率
 
     Returns:
-        Decimal: 月利率
+        float: 月利率
 
     """
-    # Newton-Raphson法で12乗根を計算
-    # x^12 = annual_rate_plus_1 の解を求める
-    x = annual_rate_plus_1 ** (Decimal("1") / Decimal("12"))
-    return x - Decimal("1")
+    return (1.0 + annual_return_rate) ** (1 / 12) - 1.0
 
 
 def _simulate_scenario(
-    current_assets: Decimal,
-    monthly_savings: Decimal,
-    target_assets: Decimal,
-    annual_return_rate: Decimal,
-    inflation_rate: Decimal,
+    current_assets: Decimal | float,
+    monthly_savings: Decimal | float,
+    target_assets: Decimal | float,
+    annual_return_rate: Decimal | float,
+    inflation_rate: Decimal | float,
 ) -> int:
     """
     シナリオ別シミュレーション
@@ -268,18 +290,230 @@ def _simulate_scenario(
         int: 到達月数（到達不可の場合は-1）
 
     """
-    monthly_rate = _calculate_monthly_rate(Decimal("1") + annual_return_rate)
-    assets = current_assets
-    month = 0
+    return _simulate_scenario_cached(
+        float(current_assets),
+        float(monthly_savings),
+        float(target_assets),
+        float(annual_return_rate),
+        float(inflation_rate),
+    )
+
+
+@lru_cache(maxsize=4096)
+def _simulate_scenario_cached(
+    current_assets: float,
+    monthly_savings: float,
+    target_assets: float,
+    annual_return_rate: float,
+    inflation_rate: float,
+) -> int:
+    """
+    float に正規化した引数で到達月数を計算しキャッシュする
+
+    計算は float で行うため、同じ float 値に変換される入力は結果も同一になる。
+    丸めは行わず、キーには変換後の値をそのまま用いる。
+
+    Args:
+        current_assets: 現在資産額
+        monthly_savings: 月貯蓄額
+        target_assets: 目標資産額
+        annual_return_rate: 年利回り
+        inflation_rate: インフレ率
+
+    Returns:
+        int: 到達月数（到達不可の場合は-1）
+
+    """
+    monthly_rate = _monthly_rate(annual_return_rate)
     max_months = 1000
 
+    # インフレなし・非負の利回りなら年金終価の式で到達月数を直接求める
+    if inflation_rate == 0 and monthly_rate >= 0:
+        return _months_to_target(
+            current_assets, monthly_savings, target_assets, monthly_rate, max_months
+        )
+
+    return _simulate_months(
+        current_assets,
+        monthly_savings,
+        target_assets,
+        monthly_rate,
+        1.0 - inflation_rate / 12,
+        max_months,
+    )
+
+
+def _simulate_scenarios_vec(
+    current_assets: Decimal | float,
+    monthly_savings: np.ndarray,
+    target_assets: Decimal | float,
+    annual_return_rate: Decimal | float,
+    inflation_rate: Decimal | float,
+) -> np.ndarray:
+    """
+    月貯蓄額だけが異なる複数シナリオの到達月数をまとめて計算
+
+    インフレありの場合は全シナリオの月次推移を NumPy 配列で同時に更新する。
+    インフレなしの場合は各シナリオとも閉形式で O(1) のため要素ごとに求める。
+    いずれも _simulate_scenario を個別に呼んだ場合と同じ結果になる。
+
+    Args:
+        current_assets: 現在資産額
+        monthly_savings: シナリオごとの月貯蓄額（float64 配列）
+        target_assets: 目標資産額
+        annual_return_rate: 年利回り
+        inflation_rate: インフレ率
+
+    Returns:
+        np.ndarray: シナリオごとの到達月数（到達不可の場合は-1）
+
+    """
+    monthly_rate = _monthly_rate(float(annual_return_rate))
+    savings = np.asarray(monthly_savings, dtype=np.float64)
+    assets0 = float(current_assets)
+    target = float(target_assets)
+    inflation = float(inflation_rate)
+    max_months = 1000
+
+    if inflation == 0 and monthly_rate >= 0:
+        return np.array(
+            [
+                _months_to_target(assets0, s, target, monthly_rate, max_months)
+                for s in savings.tolist()
+            ],
+            dtype=np.int64,
+        )
+
+    growth = 1.0 + monthly_rate
+    monthly_deflator = 1.0 - inflation / 12
+    assets = np.full(savings.shape, assets0)
+    result = np.full(savings.shape, -1, dtype=np.int64)
+    active = assets < target
+    result[~active] = 0
+    # 資産・貯蓄が非負なら前月を下回った時点で到達不可と確定できる
+    can_stop_early = (
+        (assets >= 0) & (savings >= 0) & (growth > 0) & (0 < monthly_deflator <= 1)
+    )
+    inflation_factor = 1.0
+
+    for month in range(1, max_months):
+        if not active.any():
+            break
+        inflation_factor *= monthly_deflator
+        previous = assets
+        assets = (assets * growth + savings) * inflation_factor
+        active &= ~(can_stop_early & (assets < previous))
+        reached = active & (assets >= target)
+        result[reached] = month
+        active &= ~reached
+
+    return result
+
+
+def _simulate_months(
+    assets: float,
+    monthly_savings: float,
+    target_assets: float,
+    monthly_rate: float,
+    monthly_deflator: float,
+    max_months: int,
+) -> int:
+    """
+    月次ループで目標到達月数を計算（インフレ調整込み）
+
+    毎月の資産に累積インフレ係数 monthly_deflator^month を掛ける。
+    インフレなしの場合は monthly_deflator = 1.0 を渡す。
+
+    資産・貯蓄が非負で 0 < monthly_deflator <= 1 のとき、月次の乗数と加算額は
+    単調に減少するため、資産が一度前月を下回ればその後も減り続ける。
+    その時点で到達不可と判断し、上限月数までのループを打ち切る。
+
+    Args:
+        assets: 現在資産額
+        monthly_savings: 月貯蓄額
+        target_assets: 目標資産額
+        monthly_rate: 月利率
+        monthly_deflator: 月次のインフレ係数 (1 - インフレ率/12)
+        max_months: 計算上限月数
+
+    Returns:
+        int: 到達月数（上限月数以内に到達しない場合は-1）
+
+    """
+    growth = 1.0 + monthly_rate
+    inflation_factor = 1.0
+    month = 0
+    can_stop_early = (
+        assets >= 0
+        and monthly_savings >= 0
+        and growth > 0
+        and 0 < monthly_deflator <= 1
+    )
+
     while assets < target_assets and month < max_months:
         month += 1
-        interest = assets * monthly_rate
-        assets = assets + interest + monthly_savings
-        # インフレ調整
-        if inflation_rate > 0:
-            inflation_adjustment = inflation_rate / Decimal("12")
-            assets = assets * ((Decimal("1") - inflation_adjustment) ** month)
+        inflation_factor *= monthly_deflator
+        previous = assets
+        assets = (assets * growth + monthly_savings) * inflation_factor
+        if can_stop_early and assets < previous:
+            return -1
+
+    return month if month < max_months else -1
+
+
+def _months_to_target(
+    current_assets: float,
+    monthly_savings: float,
+    target_assets: float,
+    monthly_rate: float,
+    max_months: int,
+) -> int:
+    """
+    インフレなしの積立複利で目標資産に到達する月数を閉形式で計算
+
+    A_n = A_0 (1 + r)^n + s ((1 + r)^n - 1) / r（r = 0 のときは A_0 + s n）
+    を満たす最小の n を対数で求め、丸め誤差は前後の月を評価して補正する。
+
+    Args:
+        current_assets: 現在資産額
+        monthly_savings: 月貯蓄額
+        target_assets: 目標資産額
+        monthly_rate: 月利率（非負）
+        max_months: 計算上限月数
+
+    Returns:
+        int: 到達月数（上限月数以内に到達しない場合は-1）
+
+    """
+    if current_assets >= target_assets:
+        return 0
+
+    growth = 1.0 + monthly_rate
+
+    def assets_after(months: int) -> float:
+        if monthly_rate == 0:
+            return current_assets + monthly_savings * months
+        factor = growth**months
+        return current_assets * factor + monthly_savings * (factor - 1) / monthly_rate
+
+    if monthly_rate == 0:
+        if monthly_savings <= 0:
+            return -1
+        estimate = (target_assets - current_assets) / monthly_savings
+    else:
+        base = current_assets * monthly_rate + monthly_savings
+        if base <= 0:
+            return -1
+        ratio = (target_assets * monthly_rate + monthly_savings) / base
+        estimate = math.log(ratio) / math.log(growth)
+
+    if estimate >= max_months + 1:
+        return -1
+
+    month = max(int(estimate), 1)
+    while month > 1 and assets_after(month - 1) >= target_assets:
+        month -= 1
+    while assets_after(month) < target_assets:
+        month += 1
 
     return month if month < max_months else -1
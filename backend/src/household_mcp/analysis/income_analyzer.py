@@ -4,22 +4,49 @@
 家計簿CSVデータから収入を抽出・分類し、月次/年次サマリーを生成する。
 """
 
+import calendar
+import copy
 import json
+import re
+from collections import OrderedDict
 from dataclasses import dataclass
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from decimal import Decimal
 from pathlib import Path
-from typing import cast
+from typing import Any, ClassVar, cast
 
+import numpy as np
 import pandas as pd
+from sqlalchemy import func
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
 
+from household_mcp.analysis.keyword_match import compile_keywords
 from household_mcp.database.manager import DatabaseManager
 from household_mcp.database.models import IncomeSnapshot
 from household_mcp.dataloader import HouseholdDataLoader
+from household_mcp.utils.query_parser import iter_months
 
 # NFR-040: キャッシュ有効期間（秒） - 1時間
 CACHE_TTL_SECONDS = 3600
 
+# 期間ごとの収入レコード抽出結果を保持する最大件数
+PERIOD_CACHE_SIZE = 16
+
+# データがない期間の収入レコード（列と型は抽出結果と同じ）
+_EMPTY_INCOME_RECORDS = pd.DataFrame(
+    {
+        "日付": pd.Series(dtype="datetime64[ns]"),
+        "金額（円）": pd.Series(dtype="Int64"),
+        "計算対象": pd.Series(dtype="Int64"),
+        "大項目": pd.Series(dtype="category"),
+        "中項目": pd.Series(dtype="category"),
+    }
+)
+
+# (カテゴリ名, 大項目パターン, 中項目パターン)
+CompiledRule = tuple[str, re.Pattern[str] | None, re.Pattern[str] | None]
+
 
 class IncomeCategory:
     """収入カテゴリ定義"""
@@ -74,6 +101,9 @@ class IncomeSummary:
 class IncomeAnalyzer:
     """収入分析エンジン"""
 
+    # 分類ルール（JSON）とコンパイル済みパターンは全インスタンスで共有する
+    _category_rules_cache: ClassVar[tuple[dict, list[CompiledRule]] | None] = None
+
     def __init__(
         self,
         data_loader: HouseholdDataLoader,
@@ -89,7 +119,38 @@ class IncomeAnalyzer:
         """
         self.data_loader = data_loader
         self.db_manager = db_manager
-        self.category_rules = self._load_category_rules()
+        rules, self._compiled_rules = self._shared_category_rules()
+        self.category_rules = copy.deepcopy(rules)
+        # 期間ごとの抽出結果: (開始日, 終了日) -> (各月の CSV の版, 収入レコード)
+        self._period_cache: OrderedDict[
+            tuple[date, date], tuple[tuple[Any, ...], pd.DataFrame]
+        ] = OrderedDict()
+
+    @classmethod
+    def _shared_category_rules(cls) -> tuple[dict, list[CompiledRule]]:
+        """
+        クラス単位でキャッシュした分類ルールとコンパイル済みパターンを取得
+
+        初回のみ income_categories.json を読み込む。
+
+        Returns:
+            (カテゴリルール辞書, コンパイル済みルール)
+
+        """
+        if cls._category_rules_cache is None:
+            rules = cls._load_category_rules()
+            cls._category_rules_cache = (rules, cls._compile_category_rules(rules))
+        return cls._category_rules_cache
+
+    @classmethod
+    def reload_category_rules(cls) -> None:
+        """分類ルールのキャッシュを破棄（以降に生成するインスタンスで再読込）"""
+        cls._category_rules_cache = None
+
+    def clear_cache(self) -> None:
+        """月次データ（データローダー）・抽出結果のキャッシュを破棄"""
+        self.data_loader.clear_cache()
+        self._period_cache.clear()
 
     def extract_income_records(self, start_date: date, end_date: date) -> pd.DataFrame:
         """
@@ -99,6 +160,35 @@ class IncomeAnalyzer:
         - 金額（円）> 0
         - 計算対象 = 1
 
+        Args:
+            start_date: 開始日
+            end_date: 終了日
+
+        Returns:
+            収入レコードのDataFrame
+
+        """
+        # 前年比などで同じ期間を再抽出する場合は結合・抽出済みの結果を複製して返す
+        # （期間内のいずれかの月の CSV が更新されていれば抽出し直す）
+        key = (start_date, end_date)
+        versions = tuple(
+            self.data_loader.month_version(year, month)
+            for year, month in iter_months(start_date, end_date)
+        )
+        cached = self._period_cache.get(key)
+        if cached is None or cached[0] != versions:
+            cached = (versions, self._extract_period(start_date, end_date))
+            self._period_cache[key] = cached
+            while len(self._period_cache) > PERIOD_CACHE_SIZE:
+                self._period_cache.popitem(last=False)
+        self._period_cache.move_to_end(key)
+
+        return cached[1].copy()
+
+    def _extract_period(self, start_date: date, end_date: date) -> pd.DataFrame:
+        """
+        期間内の月次データを結合して収入レコードを抽出（キャッシュなし）
+
         Args:
             start_date: 開始日
             end_date: 終了日
@@ -108,44 +198,40 @@ class IncomeAnalyzer:
 
         """
         # 期間の月をすべて取得
-        all_months = []
-        current = start_date.replace(day=1)
-        end_month = end_date.replace(day=1)
-
-        while current <= end_month:
-            all_months.append((current.year, current.month))
-            # 次の月へ
-            if current.month == 12:
-                current = current.replace(year=current.year + 1, month=1)
-            else:
-                current = current.replace(month=current.month + 1)
+        all_months = list(iter_months(start_date, end_date))
+        self.data_loader.prefetch_months(all_months)
 
-        # 各月のデータを読み込み
+        start_ts = pd.Timestamp(start_date)
+        end_ts = pd.Timestamp(end_date)
+        last_index = len(all_months) - 1
+
+        # 各月のデータを読み込み、結合前に月ごとに収入レコードへ絞り込む
         dfs = []
-        for year, month in all_months:
+        for i, (year, month) in enumerate(all_months):
             try:
-                df = self.data_loader.load(year, month)
-                dfs.append(df)
+                df = self.data_loader.load_month(year, month)
             except FileNotFoundError:
                 # データがない月はスキップ
                 continue
 
-        if not dfs:
-            return pd.DataFrame()
+            # 収入レコードを抽出: 金額 > 0 かつ 計算対象 = 1
+            mask = (df["金額（円）"] > 0) & (df["計算対象"] == 1)
 
-        # すべてのデータを結合
-        all_data = pd.concat(dfs, ignore_index=True)
+            # 期間途中の月は全日が範囲内のため、日付での絞り込みは先頭・末尾の月のみ
+            if i == 0 or i == last_index:
+                mask &= (df["日付"] >= start_ts) & (df["日付"] <= end_ts)
 
-        # 収入レコードを抽出: 金額 > 0 かつ 計算対象 = 1
-        income_records = all_data[
-            (all_data["金額（円）"] > 0) & (all_data["計算対象"] == 1)
-        ].copy()
+            dfs.append(df.loc[mask])
 
-        # 日付でフィルタリング
-        income_records = income_records[
-            (income_records["日付"] >= pd.Timestamp(start_date))
-            & (income_records["日付"] <= pd.Timestamp(end_date))
-        ]
+        if not dfs:
+            return _EMPTY_INCOME_RECORDS
+
+        income_records = pd.concat(dfs, ignore_index=True)
+
+        # 大項目・中項目は種類が少ないためカテゴリ型で保持する
+        for column in ("大項目", "中項目"):
+            if column in income_records.columns:
+                income_records[column] = income_records[column].astype("category")
 
         return income_records
 
@@ -170,19 +256,163 @@ class IncomeAnalyzer:
         large_cat = str(record.get("大項目", ""))
         medium_cat = str(record.get("中項目", ""))
 
-        # 各カテゴリのキーワードでマッチング
-        for _category_key, rule in self.category_rules.items():
-            # 大項目でマッチング
-            if any(kw in large_cat for kw in rule.get("large_keywords", [])):
-                return rule["category"]
-
-            # 中項目でマッチング
-            if any(kw in medium_cat for kw in rule.get("medium_keywords", [])):
-                return rule["category"]
+        # 各カテゴリのキーワードでマッチング（大項目→中項目の順）
+        for category, large_pattern, medium_pattern in self._compiled_rules:
+            if large_pattern is not None and large_pattern.search(large_cat):
+                return category
+            if medium_pattern is not None and medium_pattern.search(medium_cat):
+                return category
 
         # どれにも該当しない場合はその他収入
         return IncomeCategory.OTHER
 
+    def _classify_records(self, income_records: pd.DataFrame) -> pd.Categorical:
+        """
+        収入レコード全体を一括で5カテゴリに分類
+
+        classify_income と同じルール順・同じキーワードで、行ごとの apply の
+        代わりに列単位の正規表現マッチで判定する。大項目・中項目は種類が
+        少ないため、各列のユニーク値だけを照合して行に展開する。
+
+        Args:
+            income_records: 収入レコードのDataFrame
+
+        Returns:
+            各行の IncomeCategory を値とするカテゴリ型配列
+
+        """
+        large_codes, large_values = self._factorize_text(income_records, "大項目")
+        medium_codes, medium_values = self._factorize_text(income_records, "中項目")
+        no_match = np.zeros(len(income_records), dtype=bool)
+
+        labels = list(
+            dict.fromkeys(
+                [rule[0] for rule in self._compiled_rules] + [IncomeCategory.OTHER]
+            )
+        )
+        label_codes = {label: code for code, label in enumerate(labels)}
+
+        conditions = []
+        choices = []
+        for category, large_pattern, medium_pattern in self._compiled_rules:
+            condition = no_match
+            for codes, values, pattern in (
+                (large_codes, large_values, large_pattern),
+                (medium_codes, medium_values, medium_pattern),
+            ):
+                if pattern is not None:
+                    matched = values.str.contains(pattern).to_numpy()
+                    condition = condition | matched[codes]
+            conditions.append(condition)
+            choices.append(label_codes[category])
+
+        codes = np.select(
+            conditions, choices, default=label_codes[IncomeCategory.OTHER]
+        )
+        return pd.Categorical.from_codes(codes, categories=labels)
+
+    @staticmethod
+    def _compile_category_rules(category_rules: dict) -> list[CompiledRule]:
+        """
+        カテゴリルールのキーワードを大項目用・中項目用の正規表現にまとめる
+
+        Args:
+            category_rules: _load_category_rules の戻り値
+
+        Returns:
+            (カテゴリ名, 大項目パターン, 中項目パターン) のリスト（ルール順）。
+            キーワードが空の場合、パターンはNone
+
+        """
+        return [
+            (
+                rule["category"],
+                compile_keywords(rule.get("large_keywords", [])),
+                compile_keywords(rule.get("medium_keywords", [])),
+            )
+            for rule in category_rules.values()
+        ]
+
+    @staticmethod
+    def _aggregate_categories(
+        income_records: pd.DataFrame,
+    ) -> tuple[Decimal, dict[str, Decimal], dict[str, Decimal]]:
+        """
+        分類済みレコードのカテゴリ別合計・総収入・構成比率を集計
+
+        金額は円単位の整数のため int64 のまま集計し、構成比率も整数演算で
+        小数第2位に丸める（Decimal の quantize と同じ ROUND_HALF_EVEN）。
+        Decimal への変換は戻り値の生成時に1回だけ行う。
+
+        Args:
+            income_records: income_category 列を持つ収入レコード
+
+        Returns:
+            (総収入, カテゴリ名 -> 金額, カテゴリ名 -> 構成比率(%))
+            該当なしのカテゴリは0
+
+        """
+        categories = IncomeCategory.all_categories()
+        totals = (
+            income_records.groupby("income_category", observed=True)["金額（円）"]
+            .sum()
+            .reindex(categories, fill_value=0)
+            .astype("int64")
+            .tolist()
+        )
+        total = sum(totals)
+
+        category_breakdown = {
+            cat: Decimal(amount) for cat, amount in zip(categories, totals, strict=True)
+        }
+        category_ratios = {
+            cat: (
+                IncomeAnalyzer._percent_hundredths(amount, total).scaleb(-2)
+                if total > 0
+                else Decimal("0")
+            )
+            for cat, amount in zip(categories, totals, strict=True)
+        }
+        return Decimal(total), category_breakdown, category_ratios
+
+    @staticmethod
+    def _percent_hundredths(amount: int, total: int) -> Decimal:
+        """
+        amount / total * 100 を小数第2位で偶数丸めした値を 0.01 単位の整数で返す
+
+        Args:
+            amount: 金額
+            total: 総額（正）
+
+        Returns:
+            構成比率(%) × 100 の Decimal 整数
+
+        """
+        quotient, remainder = divmod(amount * 10000, total)
+        if remainder * 2 > total or (remainder * 2 == total and quotient % 2 == 1):
+            quotient += 1
+        return Decimal(quotient)
+
+    @staticmethod
+    def _factorize_text(
+        records: pd.DataFrame, column: str
+    ) -> tuple[np.ndarray, pd.Series]:
+        """
+        列をユニーク値に分解し、classify_income と同じく文字列化して返す
+
+        Args:
+            records: 収入レコードのDataFrame
+            column: 列名（存在しない場合は空文字として扱う）
+
+        Returns:
+            (各行のユニーク値インデックス, 文字列化したユニーク値)
+
+        """
+        if column not in records.columns:
+            return np.zeros(len(records), dtype=np.intp), pd.Series([""], dtype=object)
+        codes, uniques = pd.factorize(records[column], use_na_sentinel=False)
+        return codes, pd.Series([str(value) for value in uniques], dtype=object)
+
     def get_monthly_summary(
         self, year: int, month: int, *, include_previous_change: bool = True
     ) -> IncomeSummary:
@@ -197,69 +427,68 @@ class IncomeAnalyzer:
         Returns:
             IncomeSummary
 
+        """
+        if self.db_manager is None:
+            return self._build_monthly_summary(
+                year, month, include_previous_change, session=None
+            )
+
+        # キャッシュの読み込みと保存で同じセッションを使う
+        with self.db_manager.get_session() as session:
+            return self._build_monthly_summary(
+                year, month, include_previous_change, session=session
+            )
+
+    def _build_monthly_summary(
+        self,
+        year: int,
+        month: int,
+        include_previous_change: bool,
+        *,
+        session: Session | None,
+    ) -> IncomeSummary:
+        """
+        月次収入サマリーをキャッシュまたはCSVから作成
+
+        Args:
+            year: 年
+            month: 月
+            include_previous_change: 前月比を計算するか
+            session: キャッシュの読み書きに使うセッション（DBなしの場合はNone）
+
+        Returns:
+            IncomeSummary
+
         """
         # キャッシュチェック（NFR-040: 1時間有効）
-        cached_snapshot = self._get_cached_snapshot(year, month)
+        cached_snapshot = self._get_cached_snapshot(year, month, session)
         if cached_snapshot is not None:
             return self._load_summary_from_snapshot(cached_snapshot)
 
         # キャッシュミス - CSVから計算
         start_date = date(year, month, 1)
         # 月末日を取得
-        if month == 12:
-            end_date = date(year, 12, 31)
-        else:
-            next_month_start = date(year, month + 1, 1)
-            next_month_ts = pd.Timestamp(next_month_start)
-            end_timestamp = next_month_ts - pd.Timedelta(days=1)
-            end_date = end_timestamp.date()
+        end_date = date(year, month, calendar.monthrange(year, month)[1])
 
         # 収入レコードを抽出
         income_records = self.extract_income_records(start_date, end_date)
 
         if income_records.empty:
-            return IncomeSummary(
-                year=year,
-                month=month,
-                total_income=Decimal("0"),
-                category_breakdown={
-                    cat: Decimal("0") for cat in IncomeCategory.all_categories()
-                },
-                category_ratios={
-                    cat: Decimal("0") for cat in IncomeCategory.all_categories()
-                },
-                previous_period_change=None,
-                average_monthly=None,
-            )
+            return self._empty_summary(year, month, average_monthly=None)
 
         # カテゴリ分類
-        income_records["income_category"] = income_records.apply(
-            self.classify_income, axis=1
-        )
-
-        # カテゴリ別集計
-        category_breakdown = {}
-        for cat in IncomeCategory.all_categories():
-            cat_sum = income_records[income_records["income_category"] == cat][
-                "金額（円）"
-            ].sum()
-            category_breakdown[cat] = Decimal(str(cat_sum))
-
-        # 総収入
-        total_income = sum(category_breakdown.values())
+        income_records["income_category"] = self._classify_records(income_records)
 
-        # 構成比率
-        category_ratios = {}
-        for cat, amount in category_breakdown.items():
-            if total_income > 0:
-                ratio = (amount / total_income) * 100
-                category_ratios[cat] = ratio.quantize(Decimal("0.01"))
-            else:
-                category_ratios[cat] = Decimal("0")
+        # カテゴリ別集計・総収入・構成比率
+        total_income, category_breakdown, category_ratios = self._aggregate_categories(
+            income_records
+        )
 
         # 前月比を計算（無限再帰を防ぐため条件付き）
         if include_previous_change:
-            prev_change = self._calculate_previous_month_change(year, month)
+            prev_change = self._calculate_previous_month_change(
+                year, month, total_income, session=session
+            )
         else:
             prev_change = None
 
@@ -274,7 +503,7 @@ class IncomeAnalyzer:
         )
 
         # キャッシュに保存
-        self._save_snapshot_to_cache(summary)
+        self._save_snapshot_to_cache(summary, session)
 
         return summary
 
@@ -296,47 +525,20 @@ class IncomeAnalyzer:
         income_records = self.extract_income_records(start_date, end_date)
 
         if income_records.empty:
-            return IncomeSummary(
-                year=year,
-                month=None,
-                total_income=Decimal("0"),
-                category_breakdown={
-                    cat: Decimal("0") for cat in IncomeCategory.all_categories()
-                },
-                category_ratios={
-                    cat: Decimal("0") for cat in IncomeCategory.all_categories()
-                },
-                previous_period_change=None,
-                average_monthly=Decimal("0"),
-            )
+            return self._empty_summary(year, None, average_monthly=Decimal("0"))
 
         # カテゴリ分類
-        income_records["income_category"] = income_records.apply(
-            self.classify_income, axis=1
-        )
-
-        # カテゴリ別集計
-        category_breakdown = {}
-        for cat in IncomeCategory.all_categories():
-            cat_sum = income_records[income_records["income_category"] == cat][
-                "金額（円）"
-            ].sum()
-            category_breakdown[cat] = Decimal(str(cat_sum))
-
-        # 総収入
-        total_income = sum(category_breakdown.values())
+        income_records["income_category"] = self._classify_records(income_records)
 
-        # 構成比率
-        category_ratios = {}
-        for cat, amount in category_breakdown.items():
-            if total_income > 0:
-                ratio = (amount / total_income) * 100
-                category_ratios[cat] = ratio.quantize(Decimal("0.01"))
-            else:
-                category_ratios[cat] = Decimal("0")
+        # カテゴリ別集計・総収入・構成比率
+        total_income, category_breakdown, category_ratios = self._aggregate_categories(
+            income_records
+        )
 
         # 前年比を計算
-        previous_period_change = self._calculate_previous_year_change(year)
+        previous_period_change = self._calculate_previous_year_change(
+            year, total_income
+        )
 
         # 月平均（年次は12ヶ月で平均化）
         average_monthly = (
@@ -355,13 +557,48 @@ class IncomeAnalyzer:
             average_monthly=average_monthly,
         )
 
-    def _calculate_previous_month_change(self, year: int, month: int) -> Decimal | None:
+    @staticmethod
+    def _empty_summary(
+        year: int, month: int | None, *, average_monthly: Decimal | None
+    ) -> IncomeSummary:
+        """
+        収入レコードがない期間のサマリー（全カテゴリ0）を作成
+
+        Args:
+            year: 年
+            month: 月（年次の場合はNone）
+            average_monthly: 月平均（月次はNone、年次は0）
+
+        Returns:
+            IncomeSummary
+
+        """
+        categories = IncomeCategory.all_categories()
+        return IncomeSummary(
+            year=year,
+            month=month,
+            total_income=Decimal("0"),
+            category_breakdown={cat: Decimal("0") for cat in categories},
+            category_ratios={cat: Decimal("0") for cat in categories},
+            previous_period_change=None,
+            average_monthly=average_monthly,
+        )
+
+    def _calculate_previous_month_change(
+        self,
+        year: int,
+        month: int,
+        current_total_income: Decimal,
+        session: Session | None = None,
+    ) -> Decimal | None:
         """
         前月比を計算
 
         Args:
             year: 年
             month: 月
+            current_total_income: 当月の総収入（計算済みの値を再利用）
+            session: キャッシュの読み込みに使うセッション（Noneの場合は新しく開く）
 
         Returns:
             前月比（%）、データがない場合はNone
@@ -374,80 +611,142 @@ class IncomeAnalyzer:
             prev_year, prev_month = year, month - 1
 
         try:
-            current_summary = self.get_monthly_summary(
-                year, month, include_previous_change=False
-            )
-            prev_summary = self.get_monthly_summary(
-                prev_year, prev_month, include_previous_change=False
-            )
-
-            if prev_summary.total_income == 0:
-                return None
-
-            change = (
-                (current_summary.total_income - prev_summary.total_income)
-                / prev_summary.total_income
-                * 100
-            )
-            return change.quantize(Decimal("0.01"))
+            prev_total = self._compute_monthly_total(prev_year, prev_month, session)
+            return self._percent_change(current_total_income, prev_total)
         except Exception:
             return None
 
-    def _calculate_previous_year_change(self, year: int) -> Decimal | None:
+    def _calculate_previous_year_change(
+        self, year: int, current_total_income: Decimal
+    ) -> Decimal | None:
         """
         前年比を計算
 
         Args:
             year: 年
+            current_total_income: 当年の総収入（計算済みの値を再利用）
 
         Returns:
             前年比（%）、データがない場合はNone
 
         """
         try:
-            current_total = self._compute_annual_total(year)
             prev_total = self._compute_annual_total(year - 1)
+            return self._percent_change(current_total_income, prev_total)
+        except Exception:
+            return None
 
-            if prev_total == 0:
-                return None
+    @staticmethod
+    def _percent_change(current: Decimal, previous: Decimal) -> Decimal | None:
+        """
+        前期比（%）を計算
 
-            change = ((current_total - prev_total) / prev_total) * 100
-            return change.quantize(Decimal("0.01"))
-        except Exception:
+        Args:
+            current: 当期の値
+            previous: 前期の値
+
+        Returns:
+            前期比（%）、前期が0の場合はNone
+
+        """
+        if previous == 0:
             return None
+        change = ((current - previous) / previous) * 100
+        return change.quantize(Decimal("0.01"))
+
+    def _compute_monthly_total(
+        self, year: int, month: int, session: Session | None = None
+    ) -> Decimal:
+        """
+        月指定の総収入合計のみを計算（副作用なし、再帰回避用）
+
+        有効なスナップショットがあればその値を使い、なければ収入レコードから
+        総収入だけを集計する（カテゴリ分類は行わない）。
+
+        Args:
+            year: 年
+            month: 月
+            session: キャッシュの読み込みに使うセッション（Noneの場合は新しく開く）
+
+        Returns:
+            総収入（Decimal）。データがない場合は Decimal("0")。
+
+        """
+        cached_snapshot = self._get_cached_snapshot(year, month, session)
+        if cached_snapshot is not None:
+            return Decimal(cast(int, cached_snapshot.total_income))
+
+        start_date = date(year, month, 1)
+        end_date = date(year, month, calendar.monthrange(year, month)[1])
 
-    def _compute_annual_total(self, year: int) -> Decimal:
+        income_records = self.extract_income_records(start_date, end_date)
+        return Decimal(int(income_records["金額（円）"].sum()))
+
+    def _compute_annual_total(
+        self, year: int, session: Session | None = None
+    ) -> Decimal:
         """
         年指定の総収入合計のみを計算（副作用なし、再帰回避用）
 
         Args:
             year: 年
+            session: キャッシュの読み込みに使うセッション（Noneの場合は新しく開く）
 
         Returns:
             総収入（Decimal）。データがない場合は Decimal("0")。
 
         """
+        cached_total = self._annual_total_from_cache(year, session)
+        if cached_total is not None:
+            return cached_total
+
         start_date = date(year, 1, 1)
         end_date = date(year, 12, 31)
 
         income_records = self.extract_income_records(start_date, end_date)
-        if income_records.empty:
-            return Decimal("0")
+        # 総収入はカテゴリ別合計の和と等しいため分類は不要
+        return Decimal(int(income_records["金額（円）"].sum()))
 
-        income_records["income_category"] = income_records.apply(
-            self.classify_income, axis=1
-        )
+    def _annual_total_from_cache(
+        self, year: int, session: Session | None = None
+    ) -> Decimal | None:
+        """
+        12ヶ月分の有効なスナップショットから年間総収入を集計
+
+        Args:
+            year: 年
+            session: 使用するセッション（Noneの場合は新しく開く）
 
-        total = Decimal("0")
-        for cat in IncomeCategory.all_categories():
-            cat_sum = income_records[income_records["income_category"] == cat][
-                "金額（円）"
-            ].sum()
-            total += Decimal(str(cat_sum))
+        Returns:
+            年間総収入。スナップショットが12ヶ月分揃っていない場合はNone
 
-        return total
+        """
+        if self.db_manager is None:
+            return None
 
-    def _load_category_rules(self) -> dict:
+        if session is None:
+            with self.db_manager.get_session() as own_session:
+                return self._annual_total_from_cache(year, own_session)
+
+        cutoff = datetime.now() - timedelta(seconds=CACHE_TTL_SECONDS)
+        months, total = (
+            session.query(
+                func.count(IncomeSnapshot.id),
+                func.sum(IncomeSnapshot.total_income),
+            )
+            .filter(
+                IncomeSnapshot.snapshot_month.like(f"{year:04d}-%"),
+                IncomeSnapshot.updated_at >= cutoff,
+            )
+            .one()
+        )
+
+        if months < 12:
+            return None
+        return Decimal(int(total))
+
+    @staticmethod
+    def _load_category_rules() -> dict:
         """
         カテゴリ分類ルールを income_categories.json から読み込み
 
@@ -495,13 +794,16 @@ class IncomeAnalyzer:
 
         return default_rules
 
-    def _get_cached_snapshot(self, year: int, month: int) -> IncomeSnapshot | None:
+    def _get_cached_snapshot(
+        self, year: int, month: int, session: Session | None = None
+    ) -> IncomeSnapshot | None:
         """
         キャッシュから収入スナップショットを取得（TASK-2015）
 
         Args:
             year: 年
             month: 月
+            session: 使用するセッション（Noneの場合は新しく開く）
 
         Returns:
             キャッシュされたスナップショット（存在しない or 期限切れの場合はNone）
@@ -510,39 +812,50 @@ class IncomeAnalyzer:
         if self.db_manager is None:
             return None
 
+        if session is None:
+            with self.db_manager.get_session() as own_session:
+                return self._get_cached_snapshot(year, month, own_session)
+
         snapshot_month = f"{year:04d}-{month:02d}"
 
-        with self.db_manager.get_session() as session:
-            snapshot = (
-                session.query(IncomeSnapshot)
-                .filter(IncomeSnapshot.snapshot_month == snapshot_month)
-                .first()
-            )
+        snapshot = (
+            session.query(IncomeSnapshot)
+            .filter(IncomeSnapshot.snapshot_month == snapshot_month)
+            .first()
+        )
 
-            if snapshot is None:
-                return None
+        if snapshot is None:
+            return None
 
-            # NFR-040: キャッシュ有効期間チェック（1時間）
-            now = datetime.now()
-            cache_age = (now - snapshot.updated_at).total_seconds()
+        # NFR-040: キャッシュ有効期間チェック（1時間）
+        now = datetime.now()
+        cache_age = (now - snapshot.updated_at).total_seconds()
 
-            if cache_age > CACHE_TTL_SECONDS:
-                # 期限切れ
-                return None
+        if cache_age > CACHE_TTL_SECONDS:
+            # 期限切れ
+            return None
 
-            return snapshot
+        return snapshot
 
-    def _save_snapshot_to_cache(self, summary: IncomeSummary) -> None:
+    def _save_snapshot_to_cache(
+        self, summary: IncomeSummary, session: Session | None = None
+    ) -> None:
         """
         収入サマリーをキャッシュに保存（TASK-2015）
 
         Args:
             summary: 収入サマリー
+            session: 使用するセッション（Noneの場合は新しく開く）
 
         """
         if self.db_manager is None or summary.month is None:
             return
 
+        if session is None:
+            with self.db_manager.get_session() as own_session:
+                self._save_snapshot_to_cache(summary, own_session)
+            return
+
         snapshot_month = f"{summary.year:04d}-{summary.month:02d}"
 
         # カテゴリ別金額を整数に変換（単位:円）
@@ -561,41 +874,28 @@ class IncomeAnalyzer:
         other = int(summary.category_breakdown.get(IncomeCategory.OTHER, Decimal("0")))
         total = int(summary.total_income)
 
-        with self.db_manager.get_session() as session:
-            # Upsert: 既存レコードがあれば更新、なければ挿入
-            snapshot = (
-                session.query(IncomeSnapshot)
-                .filter(IncomeSnapshot.snapshot_month == snapshot_month)
-                .first()
-            )
+        now = datetime.now()
+        values = {
+            "salary_income": salary,
+            "business_income": business,
+            "real_estate_income": real_estate,
+            "dividend_income": dividend,
+            "other_income": other,
+            "total_income": total,
+            "savings_rate": None,  # 将来の拡張用
+            "updated_at": now,
+        }
 
-            if snapshot:
-                # 更新
-                snapshot.salary_income = salary  # type: ignore[assignment]
-                snapshot.business_income = business  # type: ignore[assignment]
-                snapshot.real_estate_income = real_estate  # type: ignore[assignment]
-                snapshot.dividend_income = dividend  # type: ignore[assignment]
-                snapshot.other_income = other  # type: ignore[assignment]
-                snapshot.total_income = total  # type: ignore[assignment]
-                snapshot.savings_rate = None  # type: ignore[assignment] 将来の拡張用
-                snapshot.updated_at = datetime.now()  # type: ignore[assignment]
-            else:
-                # 新規挿入
-                snapshot = IncomeSnapshot(
-                    snapshot_month=snapshot_month,
-                    salary_income=salary,
-                    business_income=business,
-                    real_estate_income=real_estate,
-                    dividend_income=dividend,
-                    other_income=other,
-                    total_income=total,
-                    savings_rate=None,
-                    created_at=datetime.now(),
-                    updated_at=datetime.now(),
-                )
-                session.add(snapshot)
-
-            session.commit()
+        # Upsert: 既存レコードがあれば更新、なければ挿入（1文で実行）
+        stmt = sqlite_insert(IncomeSnapshot).values(
+            snapshot_month=snapshot_month, created_at=now, **values
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[IncomeSnapshot.snapshot_month], set_=values
+        )
+
+        session.execute(stmt)
+        session.commit()
 
     def _load_summary_from_snapshot(self, snapshot: IncomeSnapshot) -> IncomeSummary:
         """
@@ -0,0 +1,71 @@
+"""
+カテゴリのキーワード判定
+
+大項目・中項目に特定のキーワードを含む行を列単位で判定する共通処理。
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+
+import numpy as np
+import pandas as pd
+
+CATEGORY_COLUMNS = ("大項目", "中項目")
+
+
+def compile_keywords(keywords: Iterable[str]) -> re.Pattern[str] | None:
+    """
+    キーワードのいずれかに一致する正規表現をコンパイル
+
+    Args:
+        keywords: キーワード（正規表現としてはエスケープする）
+
+    Returns:
+        コンパイル済みパターン。キーワードが空の場合はNone
+        （空文字列のパターンはすべての行に一致してしまうため）
+
+    """
+    keywords = list(keywords)
+    if not keywords:
+        return None
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
+def category_keyword_mask(
+    df: pd.DataFrame,
+    pattern: re.Pattern[str] | None,
+    columns: Iterable[str] = CATEGORY_COLUMNS,
+) -> pd.Series:
+    """
+    指定列のいずれかにパターンを含む行のマスクを作成
+
+    カテゴリ型の列はユニーク値（少数）だけを判定し、コードで各行へ展開する
+    （欠損値のコード -1 は末尾に追加した False を参照する）。
+
+    Args:
+        df: 判定対象のデータ
+        pattern: compile_keywords で作成したパターン（None の場合はどの行にも一致しない）
+        columns: 判定する列（存在しない列は無視する）
+
+    Returns:
+        df と同じインデックスの bool Series
+
+    """
+    mask = pd.Series(False, index=df.index)
+    if pattern is None:
+        return mask
+    for column in columns:
+        if column not in df.columns:
+            continue
+        values = df[column]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            search = pattern.search
+            hits = np.array(
+                [search(str(c)) is not None for c in values.cat.categories] + [False]
+            )
+            mask |= hits[values.cat.codes.to_numpy()]
+        else:
+            mask |= values.astype(str).str.contains(pattern)
+    return mask
@@ -19,10 +19,23 @@ from pathlib import Path
 import pandas as pd
 
 from household_mcp.analysis.income_analyzer import IncomeAnalyzer
+from household_mcp.analysis.keyword_match import category_keyword_mask, compile_keywords
 from household_mcp.dataloader import HouseholdDataLoader
+from household_mcp.utils.query_parser import iter_months
 
 _MONEY_Q = Decimal("0.01")
 
+# データがない期間の計算対象レコード（列と型は読み込み結果と同じ）
+_EMPTY_PERIOD_DATA = pd.DataFrame(
+    {
+        "日付": pd.Series(dtype="datetime64[ns]"),
+        "金額（円）": pd.Series(dtype="Int64"),
+        "計算対象": pd.Series(dtype="Int64"),
+        "大項目": pd.Series(dtype="category"),
+        "中項目": pd.Series(dtype="category"),
+    }
+)
+
 
 @dataclass
 class RealEstateCashflow:
@@ -54,6 +67,10 @@ class RealEstateCashflowAnalyzer:
     REAL_ESTATE_INCOME_KEYWORDS = ["不動産", "家賃収入", "不動産収入"]
     REAL_ESTATE_EXPENSE_KEYWORDS = ["住宅", "不動産", "管理費", "修繕"]
 
+    # キーワード判定用の正規表現（クラス定義時に1回だけコンパイル）
+    _INCOME_PATTERN = compile_keywords(REAL_ESTATE_INCOME_KEYWORDS)
+    _EXPENSE_PATTERN = compile_keywords(REAL_ESTATE_EXPENSE_KEYWORDS)
+
     def __init__(
         self,
         income_analyzer: IncomeAnalyzer,
@@ -63,6 +80,10 @@ class RealEstateCashflowAnalyzer:
         self.data_loader = data_loader
         self.property_db = self._load_property_database()
 
+    def clear_cache(self) -> None:
+        """月次データ（データローダー）のキャッシュをクリア"""
+        self.data_loader.clear_cache()
+
     # ----------------------- Public API -----------------------
     def calculate_cashflow(
         self,
@@ -157,30 +178,44 @@ class RealEstateCashflowAnalyzer:
 
     # ----------------------- Helpers -----------------------
     def _load_period_data(self, start_date: date, end_date: date) -> pd.DataFrame:
-        """期間内の全月データを読み込み"""
+        """
+        期間内の計算対象レコードを読み込み
+
+        収入・支出の抽出はどちらも 計算対象=1 を前提とするため、結合前に月ごとに
+        絞り込んで不要な行のコピーを避ける。
+        """
+        start_ts = pd.Timestamp(start_date)
+        end_ts = pd.Timestamp(end_date)
+        boundary_months = {
+            (start_date.year, start_date.month),
+            (end_date.year, end_date.month),
+        }
+
+        months = list(iter_months(start_date, end_date))
+        self.data_loader.prefetch_months(months)
+
         dfs = []
-        current = start_date.replace(day=1)
-        end_marker = end_date.replace(day=1)
-        while current <= end_marker:
+        for year, month in months:
             try:
-                df = self.data_loader.load(current.year, current.month)
-                dfs.append(df)
+                df = self.data_loader.load_month(year, month)
             except FileNotFoundError:
-                pass
-            if current.month == 12:
-                current = current.replace(year=current.year + 1, month=1)
-            else:
-                current = current.replace(month=current.month + 1)
+                continue
+            mask = df["計算対象"] == 1
+            # 期間途中の月は全日が範囲内のため、日付での絞り込みは先頭・末尾の月のみ
+            if (year, month) in boundary_months:
+                mask &= (df["日付"] >= start_ts) & (df["日付"] <= end_ts)
+            dfs.append(df.loc[mask])
 
         if not dfs:
-            return pd.DataFrame()
+            return _EMPTY_PERIOD_DATA.copy()
 
         all_data = pd.concat(dfs, ignore_index=True)
-        # 日付範囲でフィルタ（pd.Timestampに変換）
-        all_data = all_data[
-            (all_data["日付"] >= pd.Timestamp(start_date))
-            & (all_data["日付"] <= pd.Timestamp(end_date))
-        ]
+
+        # 大項目・中項目は種類が少ないためカテゴリ型で保持する
+        for column in ("大項目", "中項目"):
+            if column in all_data.columns:
+                all_data[column] = all_data[column].astype("category")
+
         return all_data
 
     def _extract_real_estate_income(
@@ -192,21 +227,15 @@ class RealEstateCashflowAnalyzer:
         条件: 金額 > 0 かつ 計算対象=1 かつ 大項目or中項目に不動産キーワード
         """
         if df.empty:
-            return pd.DataFrame()
+            return df
 
         income_mask = (df["金額（円）"] > 0) & (df["計算対象"] == 1)
-        income_df = df[income_mask].copy()
+        income_df = df[income_mask]
         if income_df.empty:
-            return pd.DataFrame()
+            return income_df
 
         # 不動産キーワードでフィルタ
-        def is_real_estate_income(row):
-            large = str(row.get("大項目", ""))
-            medium = str(row.get("中項目", ""))
-            text = large + " " + medium
-            return any(kw in text for kw in self.REAL_ESTATE_INCOME_KEYWORDS)
-
-        mask = income_df.apply(is_real_estate_income, axis=1)
+        mask = category_keyword_mask(income_df, self._INCOME_PATTERN)
         result = income_df[mask]
 
         # property_id 指定がある場合は摘要などでフィルタ（将来拡張）
@@ -222,20 +251,14 @@ class RealEstateCashflowAnalyzer:
         条件: 金額 < 0 かつ 計算対象=1 かつ 大項目or中項目に住宅/不動産キーワード
         """
         if df.empty:
-            return pd.DataFrame()
+            return df
 
         expense_mask = (df["金額（円）"] < 0) & (df["計算対象"] == 1)
-        expense_df = df[expense_mask].copy()
+        expense_df = df[expense_mask]
         if expense_df.empty:
-            return pd.DataFrame()
-
-        def is_real_estate_expense(row):
-            large = str(row.get("大項目", ""))
-            medium = str(row.get("中項目", ""))
-            text = large + " " + medium
-            return any(kw in text for kw in self.REAL_ESTATE_EXPENSE_KEYWORDS)
+            return expense_df
 
-        mask = expense_df.apply(is_real_estate_expense, axis=1)
+        mask = category_keyword_mask(expense_df, self._EXPENSE_PATTERN)
         result = expense_df[mask]
         return result
 
@@ -10,19 +10,27 @@ FR-032-3: 貯蓄率計算 / NFR-038 数値精度（%は小数第2位）
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, replace
 from datetime import date
 from decimal import ROUND_HALF_UP, Decimal
+from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from household_mcp.analysis.income_analyzer import IncomeAnalyzer, IncomeSummary
+from household_mcp.analysis.keyword_match import category_keyword_mask, compile_keywords
 from household_mcp.dataloader import HouseholdDataLoader
+from household_mcp.utils.query_parser import iter_months
 
 _PERCENT_Q = Decimal("0.01")
 
+# 保持する月次メトリクスの最大月数（5年分）
+METRICS_CACHE_SIZE = 60
 
-@dataclass
+
+@dataclass(slots=True)
 class SavingsMetrics:
     """貯蓄関連メトリクス"""
 
@@ -38,16 +46,18 @@ class SavingsMetrics:
     variable_cost_ratio: Decimal  # (variable_costs / disposable_income) *100
 
     def to_dict(self) -> dict:
+        # 金額は計算時には丸めず、出力時に小数第2位へ揃える
+        # （率は計算時に ROUND_HALF_UP で丸め済み）
         return {
             "year": self.year,
             "month": self.month,
-            "income": float(self.income),
-            "expense": float(self.expense),
-            "savings": float(self.savings),
+            "income": float(self.income.quantize(_PERCENT_Q)),
+            "expense": float(self.expense.quantize(_PERCENT_Q)),
+            "savings": float(self.savings.quantize(_PERCENT_Q)),
             "savings_rate": float(self.savings_rate),
-            "disposable_income": float(self.disposable_income),
-            "fixed_costs": float(self.fixed_costs),
-            "variable_costs": float(self.variable_costs),
+            "disposable_income": float(self.disposable_income.quantize(_PERCENT_Q)),
+            "fixed_costs": float(self.fixed_costs.quantize(_PERCENT_Q)),
+            "variable_costs": float(self.variable_costs.quantize(_PERCENT_Q)),
             "variable_cost_ratio": float(self.variable_cost_ratio),
         }
 
@@ -63,11 +73,26 @@ class SavingsRateCalculator:
         "保険",  # 保険
     ]
 
+    # 固定費キーワード判定用の正規表現（クラス定義時に1回だけコンパイル）
+    _FIXED_COST_PATTERN = compile_keywords(FIXED_COST_KEYWORDS)
+
     def __init__(
         self, income_analyzer: IncomeAnalyzer, data_loader: HouseholdDataLoader
     ):
         self.income_analyzer = income_analyzer
         self.data_loader = data_loader
+        # 月次メトリクスキャッシュ: (year, month) -> (CSV の版, SavingsMetrics)
+        self._metrics_cache: OrderedDict[
+            tuple[int, int], tuple[Any, SavingsMetrics]
+        ] = OrderedDict()
+
+    def invalidate(self, year: int, month: int) -> None:
+        """指定月のメトリクスキャッシュを破棄（CSV の更新は自動で検知する）"""
+        self._metrics_cache.pop((year, month), None)
+
+    def clear_cache(self) -> None:
+        """メトリクスキャッシュをすべて破棄"""
+        self._metrics_cache.clear()
 
     # ------------------------- Public API -------------------------
     def calculate_monthly_savings_rate(self, year: int, month: int) -> SavingsMetrics:
@@ -82,83 +107,203 @@ class SavingsRateCalculator:
           固定費 = 固定費キーワードに一致する支出合計
           可処分所得 = 収入 - 固定費
           変動費率 = (変動費 / 可処分所得) * 100
+
+        計算結果は月次CSVが更新されるまでインスタンス内で再利用する。
         """
-        income_summary: IncomeSummary = self.income_analyzer.get_monthly_summary(
-            year, month
-        )
-        income = income_summary.total_income
+        key = (year, month)
+        version = self.data_loader.month_version(year, month)
+        cached = self._cached_metrics(key, version)
+        if cached is not None:
+            return replace(cached)
 
-        df = self._load_month_df(year, month)
-        if df.empty:
-            return self._empty_metrics(year, month, income)
+        metrics = self._compute_months([key])[0]
+        self._store_metrics(key, version, metrics)
+        return replace(metrics)
 
-        expense_df = df[(df["計算対象"] == 1) & (df["金額（円）"] < 0)].copy()
-        if expense_df.empty:
-            return self._empty_metrics(year, month, income)
+    def get_savings_rate_trend(
+        self, start_date: date, end_date: date
+    ) -> list[SavingsMetrics]:
+        """
+        期間の貯蓄率推移を取得（開始月～終了月 inclusive）
 
-        expense_df["abs_amount"] = expense_df["金額（円）"].abs()
+        キャッシュにない月の支出はまとめて読み込み、1回の groupby で集計する。
+        """
+        months = list(iter_months(start_date, end_date))
+        versions = {key: self.data_loader.month_version(*key) for key in months}
 
-        # 固定費 / 変動費分類
-        expense_df["cost_type"] = expense_df.apply(self.classify_cost_type, axis=1)
-        fixed_costs_sum = Decimal(
-            str(expense_df[expense_df["cost_type"] == "fixed"]["abs_amount"].sum())
-        )
-        variable_costs_sum = Decimal(
-            str(expense_df[expense_df["cost_type"] == "variable"]["abs_amount"].sum())
-        )
+        # キャッシュ済みの月を先に取り出す（保存時の LRU 破棄の影響を受けない）
+        results: dict[tuple[int, int], SavingsMetrics] = {}
+        for key in months:
+            cached = self._cached_metrics(key, versions[key])
+            if cached is not None:
+                results[key] = cached
 
-        total_expense = Decimal(str(expense_df["abs_amount"].sum()))
-        savings = (income - total_expense).quantize(_PERCENT_Q)
+        missing = [key for key in months if key not in results]
+        if missing:
+            for key, metrics in zip(
+                missing, self._compute_months(missing), strict=True
+            ):
+                results[key] = metrics
+                self._store_metrics(key, versions[key], metrics)
 
-        if income > 0:
-            savings_rate = (savings / income * 100).quantize(
-                _PERCENT_Q, rounding=ROUND_HALF_UP
+        return [replace(results[key]) for key in months]
+
+    def _cached_metrics(
+        self, key: tuple[int, int], version: Any
+    ) -> SavingsMetrics | None:
+        """CSV の版が一致するキャッシュ済みメトリクスを取得（なければ None）"""
+        cached = self._metrics_cache.get(key)
+        if cached is None or cached[0] != version:
+            return None
+        self._metrics_cache.move_to_end(key)
+        return cached[1]
+
+    def _store_metrics(
+        self, key: tuple[int, int], version: Any, metrics: SavingsMetrics
+    ) -> None:
+        """メトリクスを保存し、METRICS_CACHE_SIZE を超えた古い月を破棄"""
+        self._metrics_cache[key] = (version, metrics)
+        self._metrics_cache.move_to_end(key)
+        while len(self._metrics_cache) > METRICS_CACHE_SIZE:
+            self._metrics_cache.popitem(last=False)
+
+    def _compute_months(self, months: list[tuple[int, int]]) -> list[SavingsMetrics]:
+        """
+        複数月の貯蓄率を計算（キャッシュなし）
+
+        Args:
+            months: (年, 月) のリスト
+
+        Returns:
+            months と同じ順序の SavingsMetrics
+
+        """
+        # CSV のない月は収入・支出とも読み込まずに空のメトリクスとする
+        available = [key for key in months if self.data_loader.exists(*key)]
+        expense_totals = self._expense_totals(available)
+        available_set = set(available)
+
+        results: list[SavingsMetrics] = []
+        for year, month in months:
+            if (year, month) not in available_set:
+                results.append(self._empty_metrics(year, month, Decimal("0")))
+                continue
+
+            income_summary: IncomeSummary = self.income_analyzer.get_monthly_summary(
+                year, month
             )
-        else:
-            savings_rate = Decimal("0")
+            income = income_summary.total_income
+
+            totals = expense_totals.get((year, month))
+            if totals is None:
+                results.append(self._empty_metrics(year, month, income))
+                continue
 
-        disposable_income = (income - fixed_costs_sum).quantize(_PERCENT_Q)
-        if disposable_income > 0:
-            variable_ratio = (variable_costs_sum / disposable_income * 100).quantize(
-                _PERCENT_Q, rounding=ROUND_HALF_UP
+            total_expense, fixed_costs_sum = totals
+            results.append(
+                self._build_metrics(year, month, income, total_expense, fixed_costs_sum)
             )
-        else:
-            variable_ratio = Decimal("0")
+        return results
+
+    def _expense_totals(
+        self, months: list[tuple[int, int]]
+    ) -> dict[tuple[int, int], tuple[Decimal, Decimal]]:
+        """
+        月ごとの支出合計・固定費合計をまとめて集計
+
+        各月の金額・計算対象・固定費判定を NumPy 配列として取り出し、支出レコード
+        （計算対象=1 かつ 金額<0）の合計と固定費分の合計を中間 DataFrame を作らずに
+        求める。
+
+        Args:
+            months: (年, 月) のリスト
+
+        Returns:
+            (年, 月) -> (支出合計, 固定費合計)。支出がない月は含まない
+
+        """
+        totals: dict[tuple[int, int], tuple[Decimal, Decimal]] = {}
+        for year, month in months:
+            df = self._load_month_df(year, month)
+            if df.empty:
+                continue
+
+            amounts = df["金額（円）"].to_numpy(dtype=np.int64, na_value=0)
+            targets = df["計算対象"].to_numpy(dtype=np.int64, na_value=0)
+            is_expense = (targets == 1) & (amounts < 0)
+            if not is_expense.any():
+                continue
+
+            # 固定費 / 変動費分類（classify_cost_type と同じ判定を列単位で行う）
+            is_fixed = self._fixed_cost_mask(df).to_numpy(dtype=bool)
+            expense = -int(amounts[is_expense].sum())
+            fixed = -int(amounts[is_expense & is_fixed].sum())
+            totals[(year, month)] = (Decimal(expense), Decimal(fixed))
+
+        return totals
+
+    def _build_metrics(
+        self,
+        year: int,
+        month: int,
+        income: Decimal,
+        total_expense: Decimal,
+        fixed_costs_sum: Decimal,
+    ) -> SavingsMetrics:
+        """収入・支出合計・固定費合計から SavingsMetrics を組み立てる"""
+        if not isinstance(income, Decimal):
+            income = Decimal(str(income))
+        variable_costs_sum = total_expense - fixed_costs_sum
+        savings = income - total_expense
+
+        savings_rate = self._percent(savings, income)
+        disposable_income = income - fixed_costs_sum
+        variable_ratio = self._percent(variable_costs_sum, disposable_income)
 
         return SavingsMetrics(
             year=year,
             month=month,
-            income=(
-                income.quantize(_PERCENT_Q)
-                if isinstance(income, Decimal)
-                else Decimal(str(income)).quantize(_PERCENT_Q)
-            ),
-            expense=total_expense.quantize(_PERCENT_Q),
+            income=income,
+            expense=total_expense,
             savings=savings,
             savings_rate=savings_rate,
             disposable_income=disposable_income,
-            fixed_costs=fixed_costs_sum.quantize(_PERCENT_Q),
-            variable_costs=variable_costs_sum.quantize(_PERCENT_Q),
+            fixed_costs=fixed_costs_sum,
+            variable_costs=variable_costs_sum,
             variable_cost_ratio=variable_ratio,
         )
 
-    def get_savings_rate_trend(
-        self, start_date: date, end_date: date
-    ) -> list[SavingsMetrics]:
-        """期間の貯蓄率推移を取得（開始月～終了月 inclusive）"""
-        metrics: list[SavingsMetrics] = []
-        current = start_date.replace(day=1)
-        end_marker = end_date.replace(day=1)
-        while current <= end_marker:
-            metrics.append(
-                self.calculate_monthly_savings_rate(current.year, current.month)
-            )
-            # 次の月
-            if current.month == 12:
-                current = current.replace(year=current.year + 1, month=1)
-            else:
-                current = current.replace(month=current.month + 1)
-        return metrics
+    @staticmethod
+    def _percent(numerator: Decimal, denominator: Decimal) -> Decimal:
+        """
+        numerator / denominator * 100 を小数第2位で四捨五入（ROUND_HALF_UP）
+
+        金額はほぼ整数円のため、両方が整数なら Decimal の除算を使わず整数演算で
+        同じ丸め結果を求める。
+
+        Args:
+            numerator: 分子
+            denominator: 分母（0以下の場合は0を返す）
+
+        Returns:
+            百分率（小数第2位）
+
+        """
+        if denominator <= 0:
+            return Decimal("0")
+
+        if (
+            numerator == numerator.to_integral_value()
+            and denominator == denominator.to_integral_value()
+        ):
+            quotient, remainder = divmod(abs(int(numerator)) * 10000, int(denominator))
+            if remainder * 2 >= int(denominator):
+                quotient += 1
+            return Decimal(quotient if numerator >= 0 else -quotient).scaleb(-2)
+
+        return (numerator / denominator * 100).quantize(
+            _PERCENT_Q, rounding=ROUND_HALF_UP
+        )
 
     # ------------------------- Helpers -------------------------
     def classify_cost_type(self, record: pd.Series) -> str:
@@ -170,29 +315,31 @@ class SavingsRateCalculator:
         large_cat = str(record.get("大項目", ""))
         medium_cat = str(record.get("中項目", ""))
         text = large_cat + " " + medium_cat
-        for kw in self.FIXED_COST_KEYWORDS:
-            if kw in text:
-                return "fixed"
-        return "variable"
+        return "fixed" if self._FIXED_COST_PATTERN.search(text) else "variable"
+
+    @classmethod
+    def _fixed_cost_mask(cls, df: pd.DataFrame) -> pd.Series:
+        """大項目・中項目のいずれかに固定費キーワードを含む行のマスク"""
+        return category_keyword_mask(df, cls._FIXED_COST_PATTERN)
 
     def _load_month_df(self, year: int, month: int) -> pd.DataFrame:
         try:
-            return self.data_loader.load(year, month)
+            return self.data_loader.load_month(year, month)
         except FileNotFoundError:
             return pd.DataFrame()
 
     def _empty_metrics(self, year: int, month: int, income: Decimal) -> SavingsMetrics:
         income_val = income if isinstance(income, Decimal) else Decimal(str(income))
-        zero = Decimal("0").quantize(_PERCENT_Q)
+        zero = Decimal("0")
         return SavingsMetrics(
             year=year,
             month=month,
-            income=income_val.quantize(_PERCENT_Q),
+            income=income_val,
             expense=zero,
-            savings=income_val.quantize(_PERCENT_Q),  # 収入のみの場合、全額貯蓄とみなす
-            savings_rate=Decimal("100.00") if income_val > 0 else zero,
-            disposable_income=income_val.quantize(_PERCENT_Q),
+            savings=income_val,  # 収入のみの場合、全額貯蓄とみなす
+            savings_rate=Decimal("100.00") if income_val > 0 else Decimal("0.00"),
+            disposable_income=income_val,
             fixed_costs=zero,
             variable_costs=zero,
-            variable_cost_ratio=zero,
+            variable_cost_ratio=Decimal("0.00"),
         )
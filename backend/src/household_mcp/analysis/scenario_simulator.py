@@ -9,10 +9,12 @@ from __future__ import annotations
 from dataclasses import dataclass
 from decimal import Decimal
 
-from .fire_calculator import _simulate_scenario
+import numpy as np
 
+from .fire_calculator import _simulate_scenario, _simulate_scenarios_vec
 
-@dataclass
+
+@dataclass(slots=True)
 class ScenarioConfig:
     """シナリオ設定"""
 
@@ -23,7 +25,7 @@ class ScenarioConfig:
     difficulty_score: Decimal = Decimal("1")
 
 
-@dataclass
+@dataclass(slots=True)
 class ScenarioResult:
     """シナリオ分析結果"""
 
@@ -91,11 +93,22 @@ class ScenarioSimulator:
             シナリオ分析結果リスト（ROI降順）
 
         """
-        results = []
+        # Decimal で各シナリオの月貯蓄を求め、到達月数は配列でまとめて計算する
+        adjusted = [self._adjust_savings(scenario) for scenario in scenarios]
+        months_to_fi = _simulate_scenarios_vec(
+            self.current_assets,
+            np.array([float(savings) for savings, _ in adjusted], dtype=np.float64),
+            self.target_assets,
+            self.annual_return_rate,
+            self.inflation_rate,
+        )
 
-        for scenario in scenarios:
-            result = self._simulate_single_scenario(scenario)
-            results.append(result)
+        results = [
+            self._build_result(scenario, int(months), message)
+            for scenario, (_, message), months in zip(
+                scenarios, adjusted, months_to_fi.tolist(), strict=True
+            )
+        ]
 
         # ROI降順でソート
         results.sort(key=lambda x: x.roi_score, reverse=True)
@@ -111,6 +124,29 @@ class ScenarioSimulator:
         Returns:
             シナリオ分析結果
 
+        """
+        new_monthly_savings, message = self._adjust_savings(scenario)
+
+        # シナリオで到達月数を計算
+        scenario_months_to_fi = _simulate_scenario(
+            self.current_assets,
+            new_monthly_savings,
+            self.target_assets,
+            self.annual_return_rate,
+            self.inflation_rate,
+        )
+        return self._build_result(scenario, scenario_months_to_fi, message)
+
+    def _adjust_savings(self, scenario: ScenarioConfig) -> tuple[Decimal, str]:
+        """
+        シナリオ適用後の月貯蓄額を計算
+
+        Args:
+            scenario: シナリオ設定
+
+        Returns:
+            (新しい月貯蓄額, 警告メッセージ)。警告がなければメッセージは空文字
+
         """
         # 支出削減による月貯蓄の増加
         expense_reduction = (
@@ -129,10 +165,8 @@ class ScenarioSimulator:
         reduced_monthly_expense = self.current_monthly_expense - expense_reduction
 
         # 支出削減の合計が月支出を超える場合の警告
-        achievable = True
         message = ""
         if reduced_monthly_expense < 0:
-            achievable = False
             message = (
                 "警告: 削減後の月支出が負になります "
                 f"（削減前: {self.current_monthly_expense}, "
@@ -143,14 +177,24 @@ class ScenarioSimulator:
                 self.current_monthly_savings + self.current_monthly_expense
             )
 
-        # シナリオで到達月数を計算
-        scenario_months_to_fi = _simulate_scenario(
-            self.current_assets,
-            new_monthly_savings,
-            self.target_assets,
-            self.annual_return_rate,
-            self.inflation_rate,
-        )
+        return new_monthly_savings, message
+
+    def _build_result(
+        self, scenario: ScenarioConfig, scenario_months_to_fi: int, message: str
+    ) -> ScenarioResult:
+        """
+        到達月数からシナリオ分析結果を組み立てる
+
+        Args:
+            scenario: シナリオ設定
+            scenario_months_to_fi: シナリオ適用後の到達月数
+            message: _adjust_savings が返した警告メッセージ
+
+        Returns:
+            シナリオ分析結果
+
+        """
+        achievable = not message
 
         # 月数短縮
         if scenario_months_to_fi == -1:
@@ -7,10 +7,10 @@
 from __future__ import annotations
 
 import math
+from collections.abc import Sequence
 from typing import NamedTuple
 
 import numpy as np
-from scipy import stats
 
 
 class GrowthRateAnalysis(NamedTuple):
@@ -82,11 +82,18 @@ class TrendStatistics:
         asset_values: list[float],
     ) -> GrowthRateAnalysis:
         """線形回帰による月次成長率計算"""
-        x = np.arange(len(asset_values))
-        y = np.array(asset_values)
-
-        # 線形回帰実行
-        slope, _intercept, r_value, _p_value, _std_err = stats.linregress(x, y)
+        # 最小二乗法の閉形式（p値・標準誤差は使わないため scipy は不要）
+        x = np.arange(len(asset_values), dtype=np.float64)
+        y = np.asarray(asset_values, dtype=np.float64)
+        dx = x - x.mean()
+        dy = y - y.mean()
+        sxx = dx @ dx
+        sxy = dx @ dy
+        syy = dy @ dy
+
+        slope = sxy / sxx
+        # 相関係数（y が一定なら 0、丸め誤差で ±1 を超えないよう補正）
+        r_value = 0.0 if syy == 0 else max(-1.0, min(1.0, sxy / np.sqrt(sxx * syy)))
 
         # 成長率に変換
         # 初月資産を基準に計算
@@ -116,25 +123,22 @@ class TrendStatistics:
     @staticmethod
     def _calculate_by_average(asset_values: list[float]) -> GrowthRateAnalysis:
         """月次成長率の直前比平均計算"""
-        growth_rates = []
-
-        for i in range(1, len(asset_values)):
-            if asset_values[i - 1] == 0:
-                continue
-            rate = (asset_values[i] - asset_values[i - 1]) / asset_values[i - 1]
-            growth_rates.append(rate)
+        arr = np.asarray(asset_values, dtype=np.float64)
+        prev = arr[:-1]
+        # 前月が0の月は成長率を定義できないため除外
+        nonzero = prev != 0
+        growth_rates = (arr[1:][nonzero] - prev[nonzero]) / prev[nonzero]
 
-        if not growth_rates:
+        if growth_rates.size == 0:
             monthly_growth_decimal = 0.0
             monthly_growth_percent = 0.0
             confidence = 0.0
         else:
-            monthly_growth_decimal = np.mean(growth_rates)
+            monthly_growth_decimal = growth_rates.mean()
             monthly_growth_percent = monthly_growth_decimal * 100
             # 信頼度 = データ点数と変動性に基づく
-            mean_val = np.mean(growth_rates)
-            if mean_val != 0:
-                cv = np.std(growth_rates) / abs(mean_val)
+            if monthly_growth_decimal != 0:
+                cv = growth_rates.std() / abs(monthly_growth_decimal)
             else:
                 cv = 0
             confidence = max(0.0, 1.0 - cv)
@@ -146,7 +150,7 @@ class TrendStatistics:
             growth_rate_decimal=float(round(monthly_growth_decimal, 6)),
             annual_growth_rate=float(round(annual_growth_percent, 2)),
             confidence=float(round(confidence, 3)),
-            data_points=len(growth_rates),
+            data_points=int(growth_rates.size),
             r_squared=float(round(confidence, 3)),
         )
 
@@ -157,7 +161,7 @@ class TrendStatistics:
         """
         FIRE達成までの月数を計算
 
-        式: n = log(目標資産 / 現在資産) / log(1 + 月間成長率)
+        式: n = log(目標資産 / 現在資産) / log1p(月間成長率)
 
         Args:
             current_assets: 現在の資産額
@@ -180,10 +184,10 @@ class TrendStatistics:
         if monthly_growth_rate <= 0:
             return None
 
-        # 成長率から月数を計算
+        # 成長率から月数を計算（小さな成長率でも精度を保つため log1p を使う）
         try:
-            months = math.log(target_assets / current_assets) / math.log(
-                1 + monthly_growth_rate
+            months = math.log(target_assets / current_assets) / math.log1p(
+                monthly_growth_rate
             )
             return round(months, 2)
         except (ValueError, ZeroDivisionError):
@@ -216,6 +220,39 @@ class TrendStatistics:
         projected = current_assets * ((1 + monthly_growth_rate) ** months)
         return round(projected, 2)
 
+    @staticmethod
+    def project_assets_many(
+        current_assets: float, monthly_growth_rate: float, months: Sequence[int]
+    ) -> list[float]:
+        """
+        複数の投影月数について未来の資産をまとめて計算
+
+        (1 + 月間成長率) の累乗を NumPy で一括計算する。金額の精度を保つため
+        float64 のまま計算し、丸めは project_assets と同じ round を用いる。
+        float の範囲を超える場合は project_assets と同様に OverflowError とする。
+
+        Args:
+            current_assets: 現在の資産額
+            monthly_growth_rate: 月間成長率（小数形式）
+            months: 投影対象月数のリスト
+
+        Returns:
+            月数ごとの投影資産額
+
+        """
+        if current_assets < 0:
+            raise ValueError("現在の資産額は0以上である必要があります")
+
+        horizons = np.asarray(months, dtype=np.float64)
+        if (horizons < 0).any():
+            raise ValueError("月数は0以上である必要があります")
+
+        with np.errstate(over="ignore", invalid="ignore"):
+            projected = current_assets * np.power(1.0 + monthly_growth_rate, horizons)
+        if not np.isfinite(projected).all():
+            raise OverflowError("投影資産額が浮動小数点数の範囲を超えました")
+        return [round(value, 2) for value in projected.tolist()]
+
     @staticmethod
     def create_projection_scenario(
         scenario_name: str,
@@ -240,12 +277,8 @@ class TrendStatistics:
             current_assets, target_assets, monthly_growth_rate
         )
 
-        projected_12m = TrendStatistics.project_assets(
-            current_assets, monthly_growth_rate, 12
-        )
-
-        projected_60m = TrendStatistics.project_assets(
-            current_assets, monthly_growth_rate, 60
+        projected_12m, projected_60m = TrendStatistics.project_assets_many(
+            current_assets, monthly_growth_rate, (12, 60)
         )
 
         is_achievable = months_to_fi is not None
@@ -277,8 +310,12 @@ class TrendStatistics:
         if window <= 0 or window > len(values):
             raise ValueError(f"ウィンドウサイズは1〜{len(values)}である必要があります")
 
-        ma = np.convolve(values, np.ones(window) / window, mode="valid")
+        # 累積和の差分で各ウィンドウの合計を O(n) で求める
+        cumsum = np.empty(len(values) + 1)
+        cumsum[0] = 0.0
+        np.cumsum(np.asarray(values, dtype=np.float64), out=cumsum[1:])
+        ma = (cumsum[window:] - cumsum[:-window]) / window
 
         # 元の長さに合わせるため、最初の値を補充
         padding = [values[0]] * (len(values) - len(ma))
-        return padding + list(ma)
+        return padding + ma.tolist()
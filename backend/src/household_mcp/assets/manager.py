@@ -2,12 +2,31 @@
 
 from datetime import datetime
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from household_mcp.database.models import AssetClass, AssetRecord
 
 from .models import AssetRecordRequest, AssetRecordResponse
 
+# AssetRecordResponse のフィールドに対応する asset_records のカラム
+_RECORD_COLUMNS = (
+    AssetRecord.id,
+    AssetRecord.record_date,
+    AssetRecord.asset_class_id,
+    AssetRecord.sub_asset_name,
+    AssetRecord.amount,
+    AssetRecord.memo,
+    AssetRecord.is_manual,
+    AssetRecord.source_type,
+    AssetRecord.created_at,
+    AssetRecord.updated_at,
+)
+_RESPONSE_COLUMNS = (
+    *_RECORD_COLUMNS,
+    AssetClass.display_name.label("asset_class_name"),
+)
+
 
 class AssetManager:
     """資産データの管理."""
@@ -21,6 +40,9 @@ class AssetManager:
 
         """
         self.session = session
+        # 資産クラスID -> 表示名（件数が少なくほぼ不変のため初期化時に1回だけ読み込む）
+        self._class_name_by_id: dict[int, str] = {}
+        self.refresh_asset_classes()
 
     def create_record(self, request: AssetRecordRequest) -> AssetRecordResponse:
         """
@@ -46,6 +68,39 @@ class AssetManager:
         # リレーションを取得するため再度クエリ
         return self._record_to_response(record)
 
+    def create_records(
+        self, requests: list[AssetRecordRequest]
+    ) -> list[AssetRecordResponse]:
+        """
+        資産レコード一括作成.
+
+        1回の INSERT ... RETURNING で全件を登録し、ORM のユニットオブワークを介さない.
+
+        Args:
+            requests: リクエストモデルのリスト
+
+        Returns:
+            作成されたレコード（入力順）
+
+        """
+        if not requests:
+            return []
+
+        stmt = insert(AssetRecord).returning(
+            *_RECORD_COLUMNS, sort_by_parameter_order=True
+        )
+        rows = self.session.execute(
+            stmt, [request.model_dump() for request in requests]
+        ).all()
+
+        return [
+            AssetRecordResponse.model_construct(
+                **row._mapping,
+                asset_class_name=self._asset_class_name(row.asset_class_id),
+            )
+            for row in rows
+        ]
+
     def get_records(
         self,
         asset_class_id: int | None = None,
@@ -66,7 +121,8 @@ class AssetManager:
             レコードリスト
 
         """
-        query = self.session.query(AssetRecord)
+        # 資産クラス名を JOIN で同時に取得し、行ごとのリレーション遅延ロードを避ける
+        query = self.session.query(*_RESPONSE_COLUMNS).join(AssetRecord.asset_class)
 
         if not include_deleted:
             query = query.filter(AssetRecord.is_deleted == 0)
@@ -80,8 +136,9 @@ class AssetManager:
         if end_date is not None:
             query = query.filter(AssetRecord.record_date <= end_date)
 
-        records = query.order_by(AssetRecord.record_date.desc()).all()
-        return [self._record_to_response(r) for r in records]
+        rows = query.order_by(AssetRecord.record_date.desc()).all()
+        # DB の型付きカラムをそのまま渡すため、検証を省略して組み立てる
+        return [AssetRecordResponse.model_construct(**row._mapping) for row in rows]
 
     def get_record(self, record_id: int) -> AssetRecordResponse | None:
         """
@@ -104,7 +161,11 @@ class AssetManager:
         return self._record_to_response(record)
 
     def update_record(
-        self, record_id: int, request: AssetRecordRequest
+        self,
+        record_id: int,
+        request: AssetRecordRequest,
+        *,
+        now: datetime | None = None,
     ) -> AssetRecordResponse:
         """
         資産レコード更新.
@@ -112,6 +173,7 @@ class AssetManager:
         Args:
             record_id: レコードID
             request: リクエストモデル
+            now: 更新日時（一括更新時に呼び出し側で共有する。省略時は現在時刻）
 
         Returns:
             更新されたレコード
@@ -128,17 +190,18 @@ class AssetManager:
         record.sub_asset_name = request.sub_asset_name
         record.amount = request.amount
         record.memo = request.memo
-        record.updated_at = datetime.now()
+        record.updated_at = now or datetime.now()
 
         self.session.flush()
         return self._record_to_response(record)
 
-    def delete_record(self, record_id: int) -> bool:
+    def delete_record(self, record_id: int, *, now: datetime | None = None) -> bool:
         """
         資産レコード削除（論理削除）.
 
         Args:
             record_id: レコードID
+            now: 更新日時（一括削除時に呼び出し側で共有する。省略時は現在時刻）
 
         Returns:
             削除成功の有無
@@ -151,7 +214,7 @@ class AssetManager:
             return False
 
         record.is_deleted = 1
-        record.updated_at = datetime.now()
+        record.updated_at = now or datetime.now()
         self.session.flush()
         return True
 
@@ -164,6 +227,7 @@ class AssetManager:
 
         """
         classes = self.session.query(AssetClass).all()
+        self._class_name_by_id = {c.id: c.display_name for c in classes}
         return [
             {
                 "id": c.id,
@@ -175,8 +239,34 @@ class AssetManager:
             for c in classes
         ]
 
-    @staticmethod
-    def _record_to_response(record: AssetRecord) -> AssetRecordResponse:
+    def refresh_asset_classes(self) -> dict[int, str]:
+        """
+        資産クラス名のキャッシュを読み直す（資産クラスを追加・変更した後に呼ぶ）.
+
+        Returns:
+            資産クラスID -> 表示名
+
+        """
+        self._class_name_by_id = dict(
+            self.session.query(AssetClass.id, AssetClass.display_name).all()
+        )
+        return self._class_name_by_id
+
+    def _asset_class_name(self, asset_class_id: int) -> str:
+        """
+        資産クラスIDから表示名を取得.
+
+        Args:
+            asset_class_id: 資産クラスID
+
+        Returns:
+            表示名（存在しない場合は空文字。資産クラスの変更後は
+            refresh_asset_classes で読み直す）
+
+        """
+        return self._class_name_by_id.get(asset_class_id, "")
+
+    def _record_to_response(self, record: AssetRecord) -> AssetRecordResponse:
         """
         レコードをレスポンスモデルに変換.
 
@@ -191,7 +281,7 @@ class AssetManager:
             id=record.id,
             record_date=record.record_date,
             asset_class_id=record.asset_class_id,
-            asset_class_name=record.asset_class.display_name,
+            asset_class_name=self._asset_class_name(record.asset_class_id),
             sub_asset_name=record.sub_asset_name,
             amount=record.amount,
             memo=record.memo,
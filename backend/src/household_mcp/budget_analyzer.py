@@ -8,6 +8,7 @@ MoneyForward CSV exports.
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 # MoneyForwardのCSV列名マッピング
@@ -33,6 +34,8 @@ class BudgetAnalyzer:
         self.csv_path = csv_path
         self.encoding = encoding
         self.df = pd.DataFrame(columns=list(COLUMNS_MAP.values()))
+        # (年, 月) -> 行位置。load_data で一度だけ構築し、月次集計で再走査しない
+        self._month_rows: dict[tuple[int, int], np.ndarray] = {}
 
     def load_data(self) -> None:
         """Load budget data from the CSV file."""
@@ -46,6 +49,8 @@ class BudgetAnalyzer:
             self.df["calc_target"] = pd.to_numeric(
                 self.df["calc_target"], errors="coerce"
             )
+            dates = self.df["date"]
+            self._month_rows = self.df.groupby([dates.dt.year, dates.dt.month]).indices
             print(f"データ読み込み完了: {len(self.df)}件のレコード")
 
         except (
@@ -55,30 +60,33 @@ class BudgetAnalyzer:
         ) as e:
             print(f"データ読み込みエラー: {e}")
             self.df = pd.DataFrame(columns=list(COLUMNS_MAP.values()))
+            self._month_rows = {}
 
     def get_monthly_summary(self, year: int, month: int) -> dict[str, Any]:
         """Return a summary of monthly budget data for specified period."""
         if self.df.empty:
             return {"message": "No data available."}
 
-        mask = (self.df["date"].dt.year == year) & (self.df["date"].dt.month == month)
-        monthly_data = self.df[mask]
-
-        if monthly_data.empty:
+        rows = self._month_rows.get((year, month))
+        if rows is None:
             return {"message": f"No data for {year}-{month:02d}."}
-
-        income_data = monthly_data[monthly_data["amount"] > 0]
-        expense_data = monthly_data[monthly_data["amount"] < 0]
-
-        total_income = income_data["amount"].sum()
-        total_expense = abs(expense_data["amount"].sum())
+        monthly_data = self.df.iloc[rows]
+
+        # 金額の符号 × 中項目で1回だけ集計し、収入・支出・カテゴリ別内訳を導く
+        # （カテゴリ欠損の行も収支合計には含めるため dropna=False）
+        amount = monthly_data["amount"]
+        sums = amount.groupby(
+            [np.sign(amount), monthly_data["minor_category"]], dropna=False
+        ).sum()
+        signs = sums.index.get_level_values(0)
+        expense_sums = sums[signs == -1].droplevel(0)
+
+        total_income = sums[signs == 1].sum()
+        total_expense = abs(expense_sums.sum())
         balance = total_income - total_expense
 
         category_summary = (
-            expense_data.groupby("minor_category")["amount"]
-            .sum()
-            .abs()
-            .sort_values(ascending=False)
+            expense_sums[expense_sums.index.notna()].abs().sort_values(ascending=False)
         )
 
         summary = {
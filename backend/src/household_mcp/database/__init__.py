@@ -11,6 +11,7 @@ raise a clear ImportError explaining how to enable the feature.
 
 from __future__ import annotations
 
+import importlib
 from typing import Any
 
 __all__ = [
@@ -30,52 +31,36 @@ __all__ = [
 ]
 
 
-def __getattr__(name: str) -> Any:  # pragma: no cover - import-time behavior
-    try:
-        if name == "DatabaseManager":
-            from .manager import DatabaseManager as _DatabaseManager
-
-            return _DatabaseManager
-        if name in {"Base", "Budget", "DuplicateCheck", "Transaction"}:
-            from .models import Base as _Base
-            from .models import Budget as _Budget
-            from .models import DuplicateCheck as _Dup
-            from .models import Transaction as _Txn
+# 遅延インポートする属性名 → 定義モジュール
+_LAZY = {
+    "DatabaseManager": ".manager",
+    "Base": ".models",
+    "Budget": ".models",
+    "DuplicateCheck": ".models",
+    "Transaction": ".models",
+    "AssetClass": ".models",
+    "AssetRecord": ".models",
+    "FireAssetSnapshot": ".models",
+    "CSVImporter": ".csv_importer",
+    "get_active_transactions": ".query_helpers",
+    "get_category_breakdown": ".query_helpers",
+    "get_duplicate_impact_report": ".query_helpers",
+    "get_monthly_summary": ".query_helpers",
+}
 
-            mapping = {
-                "Base": _Base,
-                "Budget": _Budget,
-                "DuplicateCheck": _Dup,
-                "Transaction": _Txn,
-            }
-            return mapping[name]
-        if name in {"AssetClass", "AssetRecord", "FireAssetSnapshot"}:
-            from .models import AssetClass as _AC
-            from .models import AssetRecord as _AR
-            from .models import FireAssetSnapshot as _FS
 
-            mapping = {
-                "AssetClass": _AC,
-                "AssetRecord": _AR,
-                "FireAssetSnapshot": _FS,
-            }
-            return mapping[name]
-        if name == "CSVImporter":
-            from .csv_importer import CSVImporter as _CSVImporter
-
-            return _CSVImporter
-        if name in {
-            "get_active_transactions",
-            "get_category_breakdown",
-            "get_duplicate_impact_report",
-            "get_monthly_summary",
-        }:
-            from . import query_helpers as _qh
+def __getattr__(name: str) -> Any:  # pragma: no cover - import-time behavior
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(name)
 
-            return getattr(_qh, name)
+    try:
+        value = getattr(importlib.import_module(module_name, __name__), name)
     except Exception as e:
         raise ImportError(
             "Database features are not available. Install with '.[db]' or '.[full]'"
         ) from e
 
-    raise AttributeError(name)
+    # 2回目以降は通常のモジュール属性として解決されるようにキャッシュする
+    globals()[name] = value
+    return value
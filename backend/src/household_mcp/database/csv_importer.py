@@ -5,11 +5,25 @@ import os
 from decimal import Decimal
 from typing import Any
 
+import numpy as np
 import pandas as pd
+from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.orm import Session
 
 from .models import Transaction
 
+# CSV を読み込む1チャンクあたりの行数
+_READ_CHUNK_SIZE = 50_000
+
+# 1回の INSERT で送る行数（SQLite のバインド変数上限に収まる件数）
+_INSERT_BATCH_SIZE = 500
+
+# 取り込み済みの行はユニーク制約 idx_source_file_row に任せて DB 側で無視する。
+# 文は一度だけ組み立ててエンジンのコンパイル済み SQL キャッシュを毎回再利用する
+_INSERT_STMT = insert(Transaction).on_conflict_do_nothing(
+    index_elements=["source_file", "row_number"]
+)
+
 
 class CSVImporter:
     """CSV → DB インポーター."""
@@ -40,89 +54,138 @@ class CSVImporter:
             }
 
         """
-        try:
-            df = pd.read_csv(csv_path, encoding=encoding)
-        except Exception as e:
-            return {
-                "imported": 0,
-                "skipped": 0,
-                "errors": [{"row": -1, "error": f"CSV読み込みエラー: {e!s}"}],
-            }
-
+        source_file = os.path.basename(csv_path)
         imported = 0
         skipped = 0
         errors: list[dict[str, Any]] = []
 
-        source_file = os.path.basename(csv_path)
+        try:
+            reader = pd.read_csv(
+                csv_path, encoding=encoding, chunksize=_READ_CHUNK_SIZE
+            )
+        except Exception as e:
+            errors.append({"row": -1, "error": f"CSV読み込みエラー: {e!s}"})
+            return {"imported": imported, "skipped": skipped, "errors": errors}
+
+        # チャンク単位で 読み込み→挿入→コミット を行いメモリ使用量を抑える
+        # （チャンクのインデックスはファイル全体の行番号として連続する）
+        with reader:
+            while True:
+                try:
+                    chunk = next(reader)
+                except StopIteration:
+                    break
+                except Exception as e:
+                    errors.append({"row": -1, "error": f"CSV読み込みエラー: {e!s}"})
+                    break
+
+                to_insert, chunk_errors = self._build_rows(chunk, source_file)
+                errors.extend(chunk_errors)
+
+                # ORM オブジェクトを経由せず Core の insert でバッチ単位に一括挿入
+                # （rowcount で挿入件数を得るためセッションの接続で直接実行する）
+                inserted = 0
+                try:
+                    connection = self.db.connection()
+                    for start in range(0, len(to_insert), _INSERT_BATCH_SIZE):
+                        result = connection.execute(
+                            _INSERT_STMT,
+                            to_insert[start : start + _INSERT_BATCH_SIZE],
+                        )
+                        inserted += result.rowcount
+                    self.db.commit()
+                except Exception as e:
+                    self.db.rollback()
+                    errors.append({"row": -1, "error": f"コミットエラー: {e!s}"})
+                    # コミット済みのチャンクだけをインポート数として扱い中断する
+                    break
+
+                imported += inserted
+                skipped += len(to_insert) - inserted
 
-        # 1回のクエリで当該ファイルの既存 row_number を取得（重複チェックを高速化）
-        existing_rows = {
-            rn
-            for (rn,) in self.db.query(Transaction.row_number)
-            .filter(Transaction.source_file == source_file)
-            .all()
-        }
+        return {"imported": imported, "skipped": skipped, "errors": errors}
 
-        to_insert: list[Transaction] = []
+    @staticmethod
+    def _build_rows(
+        df: pd.DataFrame, source_file: str
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """
+        CSV の行から transactions テーブルへの挿入値を作成.
 
-        for idx, row in df.iterrows():
-            try:
-                # インデックスを整数に変換
-                row_num = int(idx) if isinstance(idx, int | float) else 0
-
-                # 既存ならスキップ（ユニーク制約 idx_source_file_row にも一致）
-                if row_num in existing_rows:
-                    skipped += 1
-                    continue
-
-                # 日付解析
-                date_value = pd.to_datetime(row["日付"])
-
-                # 金額をDecimalに変換（全角・半角括弧両対応）
-                amount_key = "金額（円）" if "金額（円）" in row else "金額(円)"
-                amount_value = Decimal(str(row[amount_key]))
-
-                # 新規登録オブジェクト作成（後で一括挿入）
-                trans = Transaction(
-                    source_file=source_file,
-                    row_number=row_num,
-                    date=date_value,
-                    amount=amount_value,
-                    description=row.get("内容", ""),
-                    category_major=row.get("大項目", row.get("大分類", "")),
-                    category_minor=row.get("中項目", row.get("中分類", "")),
-                    account=row.get("口座", ""),
-                    memo=row.get("メモ", ""),
-                    is_target=int(row.get("計算対象", 1)),
-                )
+        日付と金額は列単位で一括変換し、変換できなかった行だけ1件ずつ変換し直して
+        行単位のエラーとして記録する。行は iterrows ではなく辞書のリストで走査する。
 
-                to_insert.append(trans)
-                imported += 1
+        Args:
+            df: 取り込み対象の行（インデックスが行番号）
+            source_file: 取り込み元ファイル名
 
-            except Exception as e:
-                row_num = int(idx) if isinstance(idx, int | float) else -1
-                errors.append({"row": row_num, "error": str(e)})
+        Returns:
+            (挿入値の辞書リスト, エラー情報リスト)
 
-        # 一括挿入で高速化
-        try:
-            if to_insert:
-                # bulk_save_objects は ORM オブジェクトの一括挿入で高速
-                self.db.bulk_save_objects(to_insert, return_defaults=False)
-            self.db.commit()
-        except Exception as e:
-            self.db.rollback()
-            errors.append({"row": -1, "error": f"コミットエラー: {e!s}"})
-            # コミット失敗時はインポート数を0扱いに戻す
-            imported = 0
+        """
+        if "日付" in df.columns:
+            dates = pd.to_datetime(df["日付"], errors="coerce").tolist()
+        else:
+            dates = [pd.NaT] * len(df)
+
+        # 金額列名（全角・半角括弧両対応）
+        amount_key = "金額（円）" if "金額（円）" in df.columns else "金額(円)"
+
+        # 金額は円単位の整数が基本なので int で渡す（Numeric 列にそのまま正確に入る）
+        # 小数や数値でない値は従来どおり Decimal で変換する
+        if amount_key in df.columns:
+            values = pd.to_numeric(df[amount_key], errors="coerce").to_numpy(
+                dtype=np.float64, na_value=np.nan
+            )
+        else:
+            values = np.full(len(df), np.nan)
+        is_int = np.isfinite(values) & (values == np.trunc(values))
+        int_amounts = np.where(is_int, values, 0).astype(np.int64).tolist()
+
+        rows: list[dict[str, Any]] = []
+        errors: list[dict[str, Any]] = []
+        for row_num, row, date_value, amount_is_int, amount in zip(
+            df.index.tolist(),
+            df.to_dict(orient="records"),
+            dates,
+            is_int.tolist(),
+            int_amounts,
+            strict=True,
+        ):
+            try:
+                if pd.isna(date_value):
+                    date_value = pd.to_datetime(row["日付"])
+                if not amount_is_int:
+                    amount = Decimal(str(row[amount_key]))
+
+                rows.append(
+                    {
+                        "source_file": source_file,
+                        "row_number": int(row_num),
+                        "date": date_value,
+                        "amount": amount,
+                        "description": row.get("内容", ""),
+                        "category_major": row.get("大項目", row.get("大分類", "")),
+                        "category_minor": row.get("中項目", row.get("中分類", "")),
+                        "account": row.get("口座", ""),
+                        "memo": row.get("メモ", ""),
+                        "is_target": int(row.get("計算対象", 1)),
+                    }
+                )
+            except Exception as e:
+                errors.append({"row": int(row_num), "error": str(e)})
 
-        return {"imported": imported, "skipped": skipped, "errors": errors}
+        return rows, errors
 
-    def import_all_csvs(self, data_dir: str = "data") -> dict[str, Any]:
+    def import_all_csvs(
+        self, data_dir: str = "data", encoding: str = "cp932"
+    ) -> dict[str, Any]:
         """
         dataディレクトリ内の全CSVをインポート.
 
         Args:
             data_dir: データディレクトリパス (デフォルト: "data")
+            encoding: エンコーディング (デフォルト: cp932)
 
         Returns:
             {
@@ -148,8 +211,10 @@ class CSVImporter:
         total_skipped = 0
         all_errors: list[dict[str, Any]] = []
 
+        # ファイルごとにチャンク単位で読み込み→挿入するため、同時に保持するのは
+        # 1チャンク分に限られる（SQLite への書き込みも1接続で順に行う）
         for csv_file in sorted(csv_files):
-            result = self.import_csv(csv_file)
+            result = self.import_csv(csv_file, encoding=encoding)
             total_imported += result["imported"]
             total_skipped += result["skipped"]
 
@@ -12,6 +12,11 @@ from sqlalchemy.orm import Session, sessionmaker
 
 from .models import AssetClass, Base
 
+# 他の接続が書き込み中のときにロック解除を待つ秒数。CSV 取り込みはチャンクごとに
+# コミットするため、sqlite3 既定の5秒では大きなチャンクの書き込み中に
+# "database is locked" となることがある
+BUSY_TIMEOUT_SECONDS = 30
+
 
 @event.listens_for(Engine, "connect")  # type: ignore[misc]
 def set_sqlite_pragma(dbapi_conn: Any, _connection_record: Any) -> None:
@@ -22,11 +27,6 @@ def set_sqlite_pragma(dbapi_conn: Any, _connection_record: Any) -> None:
     # 有効化条件: 環境変数 HOUSEHOLD_SQLITE_FAST=1（デフォルト有効）
     fast = os.getenv("HOUSEHOLD_SQLITE_FAST", "1") == "1"
     if fast:
-        try:
-            cursor.execute("PRAGMA journal_mode=MEMORY")
-        except Exception:
-            # 一部環境で失敗しても致命的ではない
-            pass
         cursor.execute("PRAGMA synchronous=OFF")
         cursor.execute("PRAGMA temp_store=MEMORY")
         # 負の値はKB単位のページを示しメモリキャッシュ拡張
@@ -34,6 +34,23 @@ def set_sqlite_pragma(dbapi_conn: Any, _connection_record: Any) -> None:
     cursor.close()
 
 
+def enable_wal(dbapi_conn: Any, _connection_record: Any) -> None:
+    """
+    WAL モードを有効化（読み取りを書き込みと並行させる）.
+
+    journal_mode=WAL は DB ファイルに保存されるため、エンジンごとに最初の
+    接続で1回だけ設定する。
+    """
+    cursor = dbapi_conn.cursor()
+    try:
+        cursor.execute("PRAGMA journal_mode=WAL")
+    except Exception:
+        # 一部環境（ネットワークファイルシステム等）で失敗しても致命的ではない
+        pass
+    finally:
+        cursor.close()
+
+
 class DatabaseManager:
     """データベース管理クラス."""
 
@@ -57,12 +74,15 @@ class DatabaseManager:
             db_dir = Path(self.db_path).parent
             db_dir.mkdir(parents=True, exist_ok=True)
 
-            # エンジン作成
+            # エンジン作成（ファイル DB の接続プールは SQLAlchemy 既定の
+            # QueuePool・check_same_thread=False のまま使う）
             self._engine = create_engine(
                 f"sqlite:///{self.db_path}",
                 echo=False,  # SQLログを出力しない
                 future=True,  # SQLAlchemy 2.0スタイル
+                connect_args={"timeout": BUSY_TIMEOUT_SECONDS},
             )
+            event.listen(self._engine, "first_connect", enable_wal)
         return self._engine
 
     @property
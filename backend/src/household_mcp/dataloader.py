@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import calendar
+import os
 import re
+import threading
+from collections import OrderedDict
 from collections.abc import Generator, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -18,7 +22,15 @@ COLUMN_ALIASES = {
 }
 REQUIRED_COLUMNS = {"計算対象", "金額（円）", "日付"}
 
+# キャッシュに保持する月次データの最大月数（5年分）
+MONTH_CACHE_SIZE = 60
+
+# 月次CSVを並列に読み込むときの最大スレッド数
+MAX_LOAD_WORKERS = 8
+
 MonthTuple = tuple[int, int]
+# 月次CSVの版: (更新時刻[ns], サイズ)
+MonthVersion = tuple[int, int]
 
 
 @dataclass(frozen=True)
@@ -33,7 +45,11 @@ class HouseholdDataLoader:
 
     def __init__(self, src_dir: str | Path = "data") -> None:
         self._config = LoaderConfig(src_dir=self._resolve_src_dir(src_dir))
-        self._month_cache: dict[MonthTuple, tuple[pd.DataFrame, float]] = {}
+        # (year, month) -> (DataFrame, CSV の版)。LRU で MONTH_CACHE_SIZE 月まで保持
+        self._month_cache: OrderedDict[
+            MonthTuple, tuple[pd.DataFrame, MonthVersion]
+        ] = OrderedDict()
+        self._cache_lock = threading.Lock()
         # キャッシュ統計
         self._cache_hits: int = 0
         self._cache_misses: int = 0
@@ -41,6 +57,10 @@ class HouseholdDataLoader:
     def month_csv_path(self, year: int, month: int) -> Path:
         return self._config.src_dir / self._make_filename(year, month)
 
+    def exists(self, year: int, month: int) -> bool:
+        """指定月の CSV が存在するかを読み込まずに判定する。"""
+        return self.month_csv_path(year, month).is_file()
+
     @property
     def src_dir(self) -> Path:
         """Public accessor for source directory (read-only)."""
@@ -60,22 +80,58 @@ class HouseholdDataLoader:
         df = pd.concat(frames, ignore_index=True)
         return self._post_process(df)
 
+    def month_version(self, year: int, month: int) -> MonthVersion | None:
+        """指定月の CSV の版（更新時刻[ns], サイズ）を返す。ファイルがなければ None。"""
+        try:
+            stat = self.month_csv_path(year, month).stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
     def load_month(self, year: int, month: int) -> pd.DataFrame:
         key = (year, month)
         path = self.month_csv_path(year, month)
-        try:
-            mtime = path.stat().st_mtime
-        except FileNotFoundError as exc:  # pragma: no cover
-            raise DataSourceError(f"CSV ファイルが見つかりません: {path}") from exc
-        cached = self._month_cache.get(key)
-        if cached and cached[1] == mtime:
-            self._cache_hits += 1
-            return cached[0].copy()
-        self._cache_misses += 1
+        version = self.month_version(year, month)
+        if version is None:  # pragma: no cover
+            raise DataSourceError(f"CSV ファイルが見つかりません: {path}")
+        with self._cache_lock:
+            cached = self._month_cache.get(key)
+            if cached and cached[1] == version:
+                self._cache_hits += 1
+                self._month_cache.move_to_end(key)
+                return cached[0].copy()
+            self._cache_misses += 1
         df = self.load(year=year, month=month)
-        self._month_cache[key] = (df, mtime)
+        with self._cache_lock:
+            self._month_cache[key] = (df, version)
+            self._month_cache.move_to_end(key)
+            while len(self._month_cache) > MONTH_CACHE_SIZE:
+                self._month_cache.popitem(last=False)
         return df.copy()
 
+    def prefetch_months(self, months: Iterable[MonthTuple]) -> None:
+        """
+        未読込・更新済みの月次CSVをスレッドプールで並列に読み込みキャッシュする。
+
+        CSVのパースは月ごとに独立しているため、読み込みが必要な月が複数あり
+        CPUも複数使える場合のみ並列化する（それ以外は load_month の逐次読み込みに
+        任せる）。存在しない月は対象外とする。
+        """
+        missing = []
+        for key in months:
+            version = self.month_version(*key)
+            with self._cache_lock:
+                cached = self._month_cache.get(key)
+            if version is not None and (cached is None or cached[1] != version):
+                missing.append(key)
+        workers = min(MAX_LOAD_WORKERS, len(missing), os.cpu_count() or 1)
+        if workers < 2:
+            return
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # 例外は呼び出し元へ伝播させるため結果をすべて取り出す
+            list(executor.map(lambda key: self.load_month(*key), missing))
+
     def load_many(self, months: Sequence[MonthTuple]) -> pd.DataFrame:
         frames: list[pd.DataFrame] = []
         for y, m in months:
@@ -157,7 +213,10 @@ class HouseholdDataLoader:
         df["日付"] = pd.to_datetime(df["日付"], errors="coerce")
         if df["日付"].isna().any():
             raise DataSourceError("日付列に解析できない値が含まれています")
-        df["年月"] = df["日付"].dt.to_period("M").dt.to_timestamp()
+        # 月初日への切り捨てを datetime64 の月単位変換で行う（PeriodIndex を作らない）
+        df["年月"] = (
+            df["日付"].to_numpy().astype("datetime64[M]").astype(df["日付"].dtype)
+        )
         df["年月キー"] = df["日付"].dt.strftime("%Y-%m")
         df["大項目"] = df["大項目"].fillna("未分類").astype("string")
         df["中項目"] = df["中項目"].fillna("未分類").astype("string")
@@ -176,20 +235,22 @@ class HouseholdDataLoader:
         return df
 
     def clear_cache(self) -> None:
-        self._month_cache.clear()
-        self._cache_hits = 0
-        self._cache_misses = 0
+        with self._cache_lock:
+            self._month_cache.clear()
+            self._cache_hits = 0
+            self._cache_misses = 0
 
     def cache_size(self) -> int:
         return len(self._month_cache)
 
     def cache_stats(self) -> dict[str, int]:
         """キャッシュ統計情報を返す (ヒット/ミス/サイズ)。"""
-        return {
-            "hits": self._cache_hits,
-            "misses": self._cache_misses,
-            "size": len(self._month_cache),
-        }
+        with self._cache_lock:
+            return {
+                "hits": self._cache_hits,
+                "misses": self._cache_misses,
+                "size": len(self._month_cache),
+            }
 
 
 def month_csv_path(year: int, month: int, src_dir: str = "data") -> Path:
@@ -8,6 +8,7 @@ from .formatters import (
 )
 from .query_parser import (
     TrendQuery,
+    iter_months,
     resolve_trend_query,
     sorted_available_months,
     to_month_key,
@@ -18,6 +19,7 @@ __all__ = [
     "format_category_trend_response",
     "format_currency",
     "format_percentage",
+    "iter_months",
     "resolve_trend_query",
     "sorted_available_months",
     "to_month_key",
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import re
-from collections.abc import Iterable, Mapping, Sequence
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass
 from datetime import date
 
@@ -36,6 +36,16 @@ def to_month_key(year: int, month: int) -> str:
     return f"{year:04d}-{month:02d}"
 
 
+def iter_months(start: date, end: date) -> Iterator[tuple[int, int]]:
+    """Yield (year, month) pairs from start's month through end's month (inclusive)."""
+
+    index = start.year * 12 + start.month - 1
+    last = end.year * 12 + end.month - 1
+    while index <= last:
+        yield index // 12, index % 12 + 1
+        index += 1
+
+
 def _parse_month_string(value: str) -> date:
     match = _MONTH_PATTERN.match(value.strip())
     if not match:
@@ -261,3 +261,57 @@ class TestExpensePatternAnalyzer:
         # 月別指数の平均は100に近い（丸め誤差を考慮）
         avg_index = sum(seasonality.monthly_indices.values()) / 12
         assert abs(avg_index - 100) < 1
+
+    def test_mixed_length_categories_keep_input_order(self, analyzer):
+        """系列長が異なるカテゴリを混在させても入力順で結果を返す"""
+        expense_data = {
+            "食費": [Decimal("30000"), Decimal("32000"), Decimal("34000")],
+            "家賃": [Decimal("100000")] * 5,
+            "交通費": [Decimal("7000"), Decimal("6500"), Decimal("6000")],
+        }
+
+        result = analyzer.analyze_expenses(expense_data)
+
+        assert [c.category for c in result.classifications] == [
+            "食費",
+            "家賃",
+            "交通費",
+        ]
+        assert [t.trend_direction for t in result.trends] == [
+            "increasing",
+            "flat",
+            "decreasing",
+        ]
+        assert result.trends[0].slope == pytest.approx(2000.0)
+        assert result.trends[0].r_squared == pytest.approx(1.0)
+        assert result.trends[1].r_squared == 0.0
+
+    def test_analyze_expenses_reports_anomalies(self, analyzer):
+        """analyze_expenses の異常月が detect_anomalies（2σ）と一致する"""
+        expense_data = {
+            "医療費": [Decimal("5000")] * 11 + [Decimal("60000")],
+            "家賃": [Decimal("100000")] * 12,
+        }
+
+        result = analyzer.analyze_expenses(expense_data)
+
+        assert result.anomalies == {"医療費": [11]}
+        assert result.anomalies == ExpensePatternAnalyzer.detect_anomalies(
+            expense_data, sigma_threshold=2.0
+        )
+
+
+def test_analysis_modules_do_not_import_scipy_at_load():
+    """支出パターン分析・経済的自由度分析モジュールの読み込みで scipy を読み込まない"""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys\n"
+        "import household_mcp.analysis.expense_pattern_analyzer\n"
+        "import household_mcp.analysis.financial_independence\n"
+        "sys.exit('scipy' in sys.modules)\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], check=False)
+
+    assert result.returncode == 0
@@ -6,13 +6,16 @@ FIRE計算エンジンのテストモジュール
 
 from decimal import Decimal
 
+import numpy as np
 import pytest
 
 from household_mcp.analysis.fire_calculator import (
     FireCalculationResult,
     FIRECalculator,
-    _calculate_monthly_rate,
+    _monthly_rate,
     _simulate_scenario,
+    _simulate_scenario_cached,
+    _simulate_scenarios_vec,
     calculate_fire_index,
 )
 
@@ -55,25 +58,28 @@ class TestFIRECalculator:
         assert FIRECalculator.is_fi_achieved(24000000, 25000000) is False
 
 
+def _decimal_monthly_rate(annual_rate: Decimal) -> Decimal:
+    """参照用の月次ループで使う Decimal の月利率"""
+    return (Decimal("1") + annual_rate) ** (Decimal("1") / Decimal("12")) - Decimal("1")
+
+
 class TestCalculateMonthlyRate:
     """月利率計算のテストクラス"""
 
     def test_monthly_rate_from_5_percent_annual(self):
         """年利5%から月利を計算"""
-        annual_rate = Decimal("0.05")
-        annual_rate_plus_1 = Decimal("1") + annual_rate
-        monthly_rate = _calculate_monthly_rate(annual_rate_plus_1)
+        annual_rate = 0.05
+        monthly_rate = _monthly_rate(annual_rate)
 
         # (1 + 月利)^12 = 1.05 の確認
-        monthly_rate_plus_1 = Decimal("1") + monthly_rate
-        reconstructed_annual_rate = (monthly_rate_plus_1**12) - Decimal("1")
+        reconstructed_annual_rate = (1 + monthly_rate) ** 12 - 1
 
         # 誤差範囲内での確認（小数第5位まで）
-        assert abs(float(reconstructed_annual_rate - annual_rate)) < 0.00001
+        assert abs(reconstructed_annual_rate - annual_rate) < 0.00001
 
     def test_monthly_rate_zero_annual(self):
         """年利0%から月利を計算"""
-        monthly_rate = _calculate_monthly_rate(Decimal("1"))
+        monthly_rate = _monthly_rate(0.0)
         assert monthly_rate == 0
 
 
@@ -156,6 +162,57 @@ class TestCalculateFireIndex:
 
         assert len(result.achieved_assets_timeline) == result.months_to_fi
 
+    @pytest.mark.parametrize("target", ["1500000", "30000000", "900000000"])
+    def test_without_timeline_matches_full_calculation(self, target):
+        """タイムラインなしでも到達月数・判定・シナリオは同じ"""
+        kwargs = {
+            "current_assets": Decimal("1000000"),
+            "monthly_savings": Decimal("100000"),
+            "target_assets": Decimal(target),
+            "annual_return_rate": Decimal("0.05"),
+            "inflation_rate": Decimal("0.02"),
+        }
+        full = calculate_fire_index(**kwargs)
+        lean = calculate_fire_index(**kwargs, timeline_resolution="none")
+
+        assert lean.achieved_assets_timeline == []
+        assert lean.months_to_fi == full.months_to_fi
+        assert lean.feasible == full.feasible
+        assert lean.message == full.message
+        assert lean.scenarios == full.scenarios
+
+    def test_yearly_timeline_resolution(self):
+        """年次粒度では12ヶ月ごとと到達月のみ、値は月次と同じ"""
+        kwargs = {
+            "current_assets": Decimal("1000000"),
+            "monthly_savings": Decimal("100000"),
+            "target_assets": Decimal("30000000"),
+            "annual_return_rate": Decimal("0.05"),
+            "inflation_rate": Decimal("0.02"),
+        }
+        monthly = calculate_fire_index(**kwargs)
+        yearly = calculate_fire_index(**kwargs, timeline_resolution="yearly")
+
+        expected = [
+            entry
+            for entry in monthly.achieved_assets_timeline
+            if entry["month"] % 12 == 0 or entry["month"] == monthly.months_to_fi
+        ]
+        assert yearly.achieved_assets_timeline == expected
+        assert yearly.achieved_assets_timeline[-1]["month"] == monthly.months_to_fi
+        assert yearly.months_to_fi == monthly.months_to_fi
+
+    def test_invalid_timeline_resolution(self):
+        """不正なタイムライン粒度"""
+        with pytest.raises(ValueError):
+            calculate_fire_index(
+                current_assets=Decimal("1000000"),
+                monthly_savings=Decimal("100000"),
+                target_assets=Decimal("1500000"),
+                annual_return_rate=Decimal("0.05"),
+                timeline_resolution="daily",
+            )
+
     def test_timeline_data_structure(self):
         """タイムラインのデータ構造確認"""
         result = calculate_fire_index(
@@ -261,3 +318,111 @@ class TestSimulateScenario:
         )
 
         assert months == -1
+
+    @pytest.mark.parametrize(
+        ("current", "savings", "target", "annual_rate"),
+        [
+            ("1000000", "100000", "1500000", "0"),
+            ("0", "50000", "30000000", "0.05"),
+            ("2500000", "120000", "40000000", "0.07"),
+            ("123456", "7890", "9876543", "0.0347"),
+        ],
+    )
+    def test_closed_form_matches_monthly_loop(
+        self, current, savings, target, annual_rate
+    ):
+        """インフレなしの閉形式が月次ループと同じ到達月数を返す"""
+        current_assets = Decimal(current)
+        monthly_savings = Decimal(savings)
+        target_assets = Decimal(target)
+        monthly_rate = _decimal_monthly_rate(Decimal(annual_rate))
+
+        assets = current_assets
+        expected = 0
+        while assets < target_assets and expected < 1000:
+            expected += 1
+            assets = assets + assets * monthly_rate + monthly_savings
+
+        months = _simulate_scenario(
+            current_assets=current_assets,
+            monthly_savings=monthly_savings,
+            target_assets=target_assets,
+            annual_return_rate=Decimal(annual_rate),
+            inflation_rate=Decimal("0"),
+        )
+
+        assert months == (expected if expected < 1000 else -1)
+
+    @pytest.mark.parametrize(
+        ("current", "savings", "target", "inflation"),
+        [
+            ("100000", "50000", "600000", "0.02"),
+            ("0", "300000", "2000000", "0.005"),
+            ("1000000", "50000", "300000000", "0.02"),
+        ],
+    )
+    def test_inflation_path_matches_full_loop(
+        self, current, savings, target, inflation
+    ):
+        """早期打ち切りありでも上限月数まで回すループと同じ結果になる"""
+        monthly_rate = _decimal_monthly_rate(Decimal("0.05"))
+        adjustment = Decimal(inflation) / Decimal("12")
+        assets = Decimal(current)
+        expected = 0
+        while assets < Decimal(target) and expected < 1000:
+            expected += 1
+            assets = assets + assets * monthly_rate + Decimal(savings)
+            assets = assets * ((Decimal("1") - adjustment) ** expected)
+
+        months = _simulate_scenario(
+            current_assets=Decimal(current),
+            monthly_savings=Decimal(savings),
+            target_assets=Decimal(target),
+            annual_return_rate=Decimal("0.05"),
+            inflation_rate=Decimal(inflation),
+        )
+
+        assert months == (expected if expected < 1000 else -1)
+
+    @pytest.mark.parametrize("inflation", ["0", "0.02"])
+    def test_vectorized_matches_scalar(self, inflation):
+        """配列版が各シナリオを個別に計算した結果と一致する"""
+        savings = [Decimal("0"), Decimal("-20000"), Decimal("50000"), Decimal("300000")]
+
+        months = _simulate_scenarios_vec(
+            Decimal("1000000"),
+            np.array([float(s) for s in savings]),
+            Decimal("20000000"),
+            Decimal("0.05"),
+            Decimal(inflation),
+        )
+
+        expected = [
+            _simulate_scenario(
+                Decimal("1000000"),
+                s,
+                Decimal("20000000"),
+                Decimal("0.05"),
+                Decimal(inflation),
+            )
+            for s in savings
+        ]
+        assert months.tolist() == expected
+
+    def test_repeated_scenario_uses_cache(self):
+        """Decimal と float で同じ値の呼び出しはキャッシュを共有する"""
+        _simulate_scenario_cached.cache_clear()
+
+        first = _simulate_scenario(
+            Decimal("1000000"),
+            Decimal("100000"),
+            Decimal("20000000"),
+            Decimal("0.05"),
+            Decimal("0.02"),
+        )
+        second = _simulate_scenario(1000000.0, 100000.0, 20000000.0, 0.05, 0.02)
+
+        assert first == second
+        info = _simulate_scenario_cached.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
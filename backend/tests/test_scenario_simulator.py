@@ -137,6 +137,24 @@ class TestScenarioSimulator:
         for i in range(len(results) - 1):
             assert results[i].roi_score >= results[i + 1].roi_score
 
+    def test_simulate_scenarios_matches_single(self):
+        """一括計算の結果が単一シナリオの計算と一致する（インフレあり）"""
+        simulator = ScenarioSimulator(
+            current_assets=Decimal("1000000"),
+            current_monthly_savings=Decimal("100000"),
+            target_assets=Decimal("20000000"),
+            annual_return_rate=Decimal("0.05"),
+            current_monthly_expense=Decimal("200000"),
+            inflation_rate=Decimal("0.02"),
+        )
+        scenarios = ScenarioSimulator.create_default_scenarios(Decimal("200000"))
+
+        results = simulator.simulate_scenarios(scenarios)
+
+        expected = {s.name: simulator._simulate_single_scenario(s) for s in scenarios}
+        for result in results:
+            assert result == expected[result.scenario_name]
+
     def test_roi_calculation(self, simulator):
         """ROI計算"""
         scenario = ScenarioConfig(
@@ -0,0 +1,113 @@
+"""
+ExpenseClassifier ユニットテスト
+
+支出分類（IQR法・発生頻度・変動係数）のテスト
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from household_mcp.analysis.expense_classifier import (
+    ClassificationResult,
+    ExpenseClassifier,
+)
+
+
+class TestExpenseClassifier:
+    """ExpenseClassifierのテスト"""
+
+    def test_classify_by_iqr_basic(self):
+        """IQR法による分類（基本ケース）"""
+        amounts = [100, 110, 120, 130, 140, 150, 160, 170, 180, 190]
+        result = ExpenseClassifier.classify_by_iqr(amounts)
+
+        assert "has_outliers" in result
+        assert "outlier_count" in result
+        assert result["outlier_ratio"] >= 0
+
+    def test_classify_by_iqr_with_outliers(self):
+        """IQR法による分類（異常値あり）"""
+        amounts = [100, 110, 120, 130, 140, 150, 160, 170, 180, 1000]
+        result = ExpenseClassifier.classify_by_iqr(amounts, threshold=1.5)
+
+        assert result["has_outliers"] is True
+        assert result["outlier_count"] >= 1
+
+    def test_classify_by_iqr_insufficient_data(self):
+        """IQR法による分類（データ不足）"""
+        amounts = [100, 110, 120]
+        result = ExpenseClassifier.classify_by_iqr(amounts)
+
+        assert result["has_outliers"] is False
+        assert result["outlier_count"] == 0
+
+    @pytest.mark.parametrize("size", [4, 5, 7, 10, 13, 60])
+    def test_classify_by_iqr_quartiles_match_percentile(self, size):
+        """IQR法の四分位数が np.percentile（linear 補間）と一致する"""
+        amounts = [float((i * 7919) % 97 + 100) for i in range(size)]
+        result = ExpenseClassifier.classify_by_iqr(amounts)
+
+        assert result["q1"] == pytest.approx(np.percentile(amounts, 25))
+        assert result["q3"] == pytest.approx(np.percentile(amounts, 75))
+
+    def test_classify_by_occurrence_regular(self):
+        """発生頻度による分類（定期的）"""
+        result = ExpenseClassifier.classify_by_occurrence(months=12, occurrences=10)
+
+        assert result["is_regular"] is True
+        threshold = ExpenseClassifier.OCCURRENCE_RATE_THRESHOLD
+        assert result["occurrence_rate"] > threshold
+
+    def test_classify_by_occurrence_irregular(self):
+        """発生頻度による分類（不定期的）"""
+        result = ExpenseClassifier.classify_by_occurrence(months=12, occurrences=5)
+
+        assert result["is_regular"] is False
+        threshold = ExpenseClassifier.OCCURRENCE_RATE_THRESHOLD
+        assert result["occurrence_rate"] < threshold
+
+    def test_classify_by_cv_stable(self):
+        """変動係数による分類（安定的）"""
+        amounts = [1000, 1010, 990, 1005, 995, 1000, 1020, 980]
+        result = ExpenseClassifier.classify_by_cv(amounts)
+
+        assert result["is_stable"] is True
+        assert result["cv"] <= ExpenseClassifier.CV_THRESHOLD
+
+    def test_classify_by_cv_variable(self):
+        """変動係数による分類（変動的）"""
+        amounts = [100, 500, 200, 800, 150, 900, 300, 1000]
+        result = ExpenseClassifier.classify_by_cv(amounts)
+
+        assert result["cv"] > 0.3
+
+    def test_calculate_confidence(self):
+        """信頼度の計算"""
+        iqr_result = {"has_outliers": False, "outlier_ratio": 0.0}
+        occurrence_result = {"is_regular": True, "occurrence_rate": 0.9}
+        cv_result = {"is_stable": True, "cv": 0.2}
+
+        confidence = ExpenseClassifier.calculate_confidence(
+            iqr_result, occurrence_result, cv_result
+        )
+
+        assert 0.0 <= confidence <= 1.0
+        assert confidence > 0.8  # 高い信頼度
+
+    def test_classify_complete(self):
+        """完全な分類処理"""
+        amounts = [10000, 10500, 9800, 10200, 9900, 10100]
+        result = ExpenseClassifier.classify(amounts=amounts, months=12, occurrences=6)
+
+        assert isinstance(result, ClassificationResult)
+        assert result.classification in ["regular", "irregular"]
+        assert 0.0 <= result.confidence <= 1.0
+
+    def test_classify_no_occurrences(self):
+        """発生なしの分類"""
+        result = ExpenseClassifier.classify(amounts=[], months=12, occurrences=0)
+
+        assert result.classification == "irregular"
+        assert result.confidence == 1.0
@@ -8,10 +8,7 @@ from __future__ import annotations
 
 import pytest
 
-from household_mcp.analysis.expense_classifier import (
-    ClassificationResult,
-    ExpenseClassifier,
-)
+from household_mcp.analysis.expense_classifier import ClassificationResult
 from household_mcp.analysis.financial_independence import FinancialIndependenceAnalyzer
 from household_mcp.analysis.fire_calculator import FIRECalculator
 from household_mcp.analysis.trend_statistics import TrendStatistics
@@ -67,95 +64,6 @@ class TestFIRECalculator:
         assert result is False
 
 
-class TestExpenseClassifier:
-    """ExpenseClassifierのテスト"""
-
-    def test_classify_by_iqr_basic(self):
-        """IQR法による分類（基本ケース）"""
-        amounts = [100, 110, 120, 130, 140, 150, 160, 170, 180, 190]
-        result = ExpenseClassifier.classify_by_iqr(amounts)
-
-        assert "has_outliers" in result
-        assert "outlier_count" in result
-        assert result["outlier_ratio"] >= 0
-
-    def test_classify_by_iqr_with_outliers(self):
-        """IQR法による分類（異常値あり）"""
-        amounts = [100, 110, 120, 130, 140, 150, 160, 170, 180, 1000]
-        result = ExpenseClassifier.classify_by_iqr(amounts, threshold=1.5)
-
-        assert result["has_outliers"] is True
-        assert result["outlier_count"] >= 1
-
-    def test_classify_by_iqr_insufficient_data(self):
-        """IQR法による分類（データ不足）"""
-        amounts = [100, 110, 120]
-        result = ExpenseClassifier.classify_by_iqr(amounts)
-
-        assert result["has_outliers"] is False
-        assert result["outlier_count"] == 0
-
-    def test_classify_by_occurrence_regular(self):
-        """発生頻度による分類（定期的）"""
-        result = ExpenseClassifier.classify_by_occurrence(months=12, occurrences=10)
-
-        assert result["is_regular"] is True
-        threshold = ExpenseClassifier.OCCURRENCE_RATE_THRESHOLD
-        assert result["occurrence_rate"] > threshold
-
-    def test_classify_by_occurrence_irregular(self):
-        """発生頻度による分類（不定期的）"""
-        result = ExpenseClassifier.classify_by_occurrence(months=12, occurrences=5)
-
-        assert result["is_regular"] is False
-        threshold = ExpenseClassifier.OCCURRENCE_RATE_THRESHOLD
-        assert result["occurrence_rate"] < threshold
-
-    def test_classify_by_cv_stable(self):
-        """変動係数による分類（安定的）"""
-        amounts = [1000, 1010, 990, 1005, 995, 1000, 1020, 980]
-        result = ExpenseClassifier.classify_by_cv(amounts)
-
-        assert result["is_stable"] is True
-        assert result["cv"] <= ExpenseClassifier.CV_THRESHOLD
-
-    def test_classify_by_cv_variable(self):
-        """変動係数による分類（変動的）"""
-        amounts = [100, 500, 200, 800, 150, 900, 300, 1000]
-        result = ExpenseClassifier.classify_by_cv(amounts)
-
-        assert result["cv"] > 0.3
-
-    def test_calculate_confidence(self):
-        """信頼度の計算"""
-        iqr_result = {"has_outliers": False, "outlier_ratio": 0.0}
-        occurrence_result = {"is_regular": True, "occurrence_rate": 0.9}
-        cv_result = {"is_stable": True, "cv": 0.2}
-
-        confidence = ExpenseClassifier.calculate_confidence(
-            iqr_result, occurrence_result, cv_result
-        )
-
-        assert 0.0 <= confidence <= 1.0
-        assert confidence > 0.8  # 高い信頼度
-
-    def test_classify_complete(self):
-        """完全な分類処理"""
-        amounts = [10000, 10500, 9800, 10200, 9900, 10100]
-        result = ExpenseClassifier.classify(amounts=amounts, months=12, occurrences=6)
-
-        assert isinstance(result, ClassificationResult)
-        assert result.classification in ["regular", "irregular"]
-        assert 0.0 <= result.confidence <= 1.0
-
-    def test_classify_no_occurrences(self):
-        """発生なしの分類"""
-        result = ExpenseClassifier.classify(amounts=[], months=12, occurrences=0)
-
-        assert result.classification == "irregular"
-        assert result.confidence == 1.0
-
-
 class TestTrendStatistics:
     """TrendStatisticsのテスト"""
 
@@ -376,6 +284,25 @@ class TestFinancialIndependenceAnalyzer:
             assert "priority" in suggestion
             assert "type" in suggestion
 
+    def test_growth_rate_is_computed_once_per_history(self, monkeypatch):
+        """同じ資産履歴の成長率分析は1回だけ実行される"""
+        analyzer = FinancialIndependenceAnalyzer()
+        asset_history = [1000000, 1010000, 1020000, 1030000, 1040000]
+        calls = []
+        original = TrendStatistics.calculate_monthly_growth_rate
+
+        def counting(values, method="regression"):
+            calls.append(method)
+            return original(values, method=method)
+
+        monkeypatch.setattr(TrendStatistics, "calculate_monthly_growth_rate", counting)
+
+        analyzer.get_status(1040000, 0, 500000, asset_history=asset_history)
+        analyzer.calculate_scenarios(1040000, 500000, asset_history)
+        analyzer.suggest_improvements(1040000, 500000, asset_history, {})
+
+        assert calls == ["regression"]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -88,6 +88,36 @@ class TestIncomeClassification:
         result = income_analyzer.classify_income(record)
         assert result == IncomeCategory.OTHER
 
+    def test_classify_records_matches_row_classification(self, income_analyzer):
+        """一括分類が行ごとの classify_income と一致する"""
+        records = pd.DataFrame(
+            {
+                "大項目": ["給与", "事業収入", "不動産", "その他", None, "金融収入"],
+                "中項目": ["給与", "売上", "雑収入", "配当", "賞与", "還付金"],
+            }
+        )
+
+        expected = [
+            income_analyzer.classify_income(row) for _, row in records.iterrows()
+        ]
+
+        assert list(income_analyzer._classify_records(records)) == expected
+
+    def test_category_rules_are_loaded_once_per_class(self, mock_data_loader):
+        """分類ルールはクラス単位で1回だけ読み込まれ、インスタンス間で独立"""
+        IncomeAnalyzer.reload_category_rules()
+        with patch.object(
+            IncomeAnalyzer,
+            "_load_category_rules",
+            wraps=IncomeAnalyzer._load_category_rules,
+        ) as load_rules:
+            first = IncomeAnalyzer(mock_data_loader)
+            second = IncomeAnalyzer(mock_data_loader)
+
+        assert load_rules.call_count == 1
+        first.category_rules["salary"]["large_keywords"].append("追加")
+        assert "追加" not in second.category_rules["salary"]["large_keywords"]
+
 
 class TestMonthlySummary:
     """月次サマリーテスト（extract_income_recordsをモック）"""
@@ -132,6 +162,24 @@ class TestMonthlySummary:
         assert summary.category_breakdown[IncomeCategory.DIVIDEND] == Decimal("10000")
         assert summary.category_breakdown[IncomeCategory.OTHER] == Decimal("50000")
 
+    def test_category_ratios_round_half_even(self, income_analyzer):
+        """構成比率は整数演算で小数第2位に偶数丸めする"""
+        # 1 / 800 = 0.125% → 0.12%、799 / 800 = 99.875% → 99.88%（偶数丸め）
+        records = pd.DataFrame(
+            {
+                "金額（円）": pd.array([1, 799], dtype="Int64"),
+                "income_category": [IncomeCategory.DIVIDEND, IncomeCategory.SALARY],
+            }
+        )
+
+        total, breakdown, ratios = IncomeAnalyzer._aggregate_categories(records)
+
+        assert str(total) == "800"
+        assert str(breakdown[IncomeCategory.SALARY]) == "799"
+        assert ratios[IncomeCategory.DIVIDEND] == Decimal("0.12")
+        assert ratios[IncomeCategory.SALARY] == Decimal("99.88")
+        assert str(ratios[IncomeCategory.BUSINESS]) == "0.00"
+
     def test_get_monthly_summary_empty_data(self, income_analyzer):
         """データがない場合"""
         with (
@@ -146,6 +194,45 @@ class TestMonthlySummary:
 
         assert summary.total_income == Decimal("0")
 
+    def test_previous_month_change_reuses_current_total(
+        self, income_analyzer, mock_data_loader, sample_income_data
+    ):
+        """前月比は当月の集計結果を再利用し、前月分だけを追加で集計する"""
+        june_data = sample_income_data.assign(
+            日付=sample_income_data["日付"] - pd.DateOffset(months=1)
+        )
+        mock_data_loader.load_month.side_effect = lambda year, month: (
+            sample_income_data if month == 7 else june_data.iloc[:1]
+        )
+
+        with patch.object(
+            income_analyzer,
+            "extract_income_records",
+            wraps=income_analyzer.extract_income_records,
+        ) as extract:
+            summary = income_analyzer.get_monthly_summary(2024, 7)
+
+        # (360000 - 300000) / 300000 = 20%
+        assert summary.previous_period_change == Decimal("20.00")
+        assert extract.call_count == 2
+
+    def test_previous_month_total_uses_snapshot(self, income_analyzer):
+        """前月の総収入は有効なスナップショットがあればそれを使う"""
+        snapshot = Mock(total_income=250000)
+
+        with (
+            patch.object(
+                income_analyzer, "_get_cached_snapshot", return_value=snapshot
+            ),
+            patch.object(income_analyzer, "extract_income_records") as extract,
+        ):
+            change = income_analyzer._calculate_previous_month_change(
+                2024, 1, Decimal("300000")
+            )
+
+        assert change == Decimal("20.00")
+        extract.assert_not_called()
+
 
 class TestAnnualSummary:
     """年次サマリーテスト（extract_income_recordsをモック）"""
@@ -179,6 +266,113 @@ class TestAnnualSummary:
         assert summary.average_monthly == Decimal("100000")
 
 
+class TestMonthLoadCache:
+    """月次データ・抽出結果キャッシュのテスト"""
+
+    def test_month_is_loaded_once(
+        self, income_analyzer, mock_data_loader, sample_income_data
+    ):
+        """同じ月の再抽出ではCSVを読み直さない"""
+        mock_data_loader.load_month.return_value = sample_income_data
+
+        first = income_analyzer.extract_income_records(
+            date(2024, 7, 1), date(2024, 7, 31)
+        )
+        second = income_analyzer.extract_income_records(
+            date(2024, 7, 1), date(2024, 7, 31)
+        )
+
+        assert mock_data_loader.load_month.call_count == 1
+        pd.testing.assert_frame_equal(first, second)
+
+        income_analyzer.clear_cache()
+        income_analyzer.extract_income_records(date(2024, 7, 1), date(2024, 7, 31))
+        assert mock_data_loader.load_month.call_count == 2
+
+    def test_cached_period_is_not_shared_with_caller(
+        self, income_analyzer, mock_data_loader, sample_income_data
+    ):
+        """抽出結果を変更してもキャッシュ済みの期間データは変わらない"""
+        mock_data_loader.load_month.return_value = sample_income_data
+
+        first = income_analyzer.extract_income_records(
+            date(2024, 1, 1), date(2024, 12, 31)
+        )
+        first["income_category"] = "dummy"
+        second = income_analyzer.extract_income_records(
+            date(2024, 1, 1), date(2024, 12, 31)
+        )
+
+        assert "income_category" not in second.columns
+        assert len(second) == len(first)
+
+    def test_months_prefetched_through_loader(
+        self, income_analyzer, mock_data_loader, sample_income_data
+    ):
+        """複数月はデータローダーのプリフェッチでまとめて読み込む"""
+        mock_data_loader.load_month.side_effect = lambda year, month: (
+            sample_income_data.assign(
+                日付=sample_income_data["日付"] + pd.DateOffset(months=month - 7)
+            )
+        )
+
+        records = income_analyzer.extract_income_records(
+            date(2024, 7, 1), date(2024, 9, 30)
+        )
+
+        mock_data_loader.prefetch_months.assert_called_once_with(
+            [(2024, 7), (2024, 8), (2024, 9)]
+        )
+        assert mock_data_loader.load_month.call_count == 3
+        assert list(records["日付"].dt.month) == [7, 7, 7, 8, 8, 8, 9, 9, 9]
+
+    def test_income_records_follow_csv_updates(self, tmp_path):
+        """CSV を編集すると長寿命の IncomeAnalyzer でも最新の収入を返す"""
+        loader = HouseholdDataLoader(src_dir=tmp_path)
+        path = loader.month_csv_path(2024, 7)
+        header = "日付,計算対象,金額（円）,大項目,中項目\n"
+        path.write_text(header + "2024-07-01,1,1000,収入,給与\n", encoding="cp932")
+        analyzer = IncomeAnalyzer(loader)
+        period = (date(2024, 7, 1), date(2024, 7, 31))
+
+        assert analyzer.extract_income_records(*period)["金額（円）"].sum() == 1000
+
+        path.write_text(header + "2024-07-01,1,30000,収入,給与\n", encoding="cp932")
+
+        assert analyzer.extract_income_records(*period)["金額（円）"].sum() == 30000
+
+    def test_period_cache_is_bounded(
+        self, income_analyzer, mock_data_loader, sample_income_data
+    ):
+        """期間ごとの抽出結果は PERIOD_CACHE_SIZE 件まで新しい順に保持する"""
+        mock_data_loader.load_month.return_value = sample_income_data
+
+        with patch("household_mcp.analysis.income_analyzer.PERIOD_CACHE_SIZE", 2):
+            for day in (29, 30, 31):
+                income_analyzer.extract_income_records(
+                    date(2024, 7, 1), date(2024, 7, day)
+                )
+
+        assert list(income_analyzer._period_cache) == [
+            (date(2024, 7, 1), date(2024, 7, 30)),
+            (date(2024, 7, 1), date(2024, 7, 31)),
+        ]
+
+    def test_missing_months_return_typed_empty_records(
+        self, income_analyzer, mock_data_loader
+    ):
+        """データがない期間でも抽出結果と同じ列を持つ空のDataFrameを返す"""
+        mock_data_loader.load_month.side_effect = FileNotFoundError
+
+        records = income_analyzer.extract_income_records(
+            date(2024, 7, 1), date(2024, 7, 31)
+        )
+
+        assert records.empty
+        assert {"日付", "金額（円）", "大項目", "中項目"} <= set(records.columns)
+        assert income_analyzer._compute_annual_total(2024) == Decimal("0")
+
+
 class TestIncomeSummaryDataclass:
     """IncomeSummaryデータクラステスト"""
 
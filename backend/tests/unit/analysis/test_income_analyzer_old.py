@@ -2,6 +2,7 @@
 
 TASK-2004: Phase 1 単体テスト
 """
+
 from datetime import date
 from decimal import Decimal
 from unittest.mock import Mock
@@ -73,7 +74,7 @@ class TestIncomeAnalyzerExtraction:
         self, income_analyzer, mock_data_loader, sample_income_data
     ):
         """金額が正のレコードのみ抽出される"""
-        mock_data_loader.load.return_value = sample_income_data
+        mock_data_loader.load_month.return_value = sample_income_data
 
         result = income_analyzer.extract_income_records(
             date(2024, 7, 1), date(2024, 7, 31)
@@ -96,7 +97,7 @@ class TestIncomeAnalyzerExtraction:
                 "中項目": ["給与", "給与", "給与"],
             }
         )
-        mock_data_loader.load.return_value = data
+        mock_data_loader.load_month.return_value = data
 
         result = income_analyzer.extract_income_records(
             date(2024, 7, 1), date(2024, 7, 31)
@@ -120,7 +121,7 @@ class TestIncomeAnalyzerExtraction:
                 "中項目": ["給与", "給与", "給与", "給与"],
             }
         )
-        mock_data_loader.load.return_value = data
+        mock_data_loader.load_month.return_value = data
 
         result = income_analyzer.extract_income_records(
             date(2024, 7, 1), date(2024, 7, 31)
@@ -133,7 +134,7 @@ class TestIncomeAnalyzerExtraction:
         self, income_analyzer, mock_data_loader
     ):
         """データがない場合は空DataFrame"""
-        mock_data_loader.load.side_effect = FileNotFoundError()
+        mock_data_loader.load_month.side_effect = FileNotFoundError()
 
         result = income_analyzer.extract_income_records(
             date(2024, 7, 1), date(2024, 7, 31)
@@ -189,7 +190,7 @@ class TestMonthlySummary:
         self, income_analyzer, mock_data_loader, sample_income_data
     ):
         """基本的な月次サマリー取得"""
-        mock_data_loader.load.return_value = sample_income_data
+        mock_data_loader.load_month.return_value = sample_income_data
 
         summary = income_analyzer.get_monthly_summary(2024, 7)
 
@@ -203,7 +204,7 @@ class TestMonthlySummary:
         self, income_analyzer, mock_data_loader, sample_income_data
     ):
         """総収入が正しく計算される"""
-        mock_data_loader.load.return_value = sample_income_data
+        mock_data_loader.load_month.return_value = sample_income_data
 
         summary = income_analyzer.get_monthly_summary(2024, 7)
 
@@ -214,7 +215,7 @@ class TestMonthlySummary:
         self, income_analyzer, mock_data_loader, sample_income_data
     ):
         """カテゴリ別内訳が正しい"""
-        mock_data_loader.load.return_value = sample_income_data
+        mock_data_loader.load_month.return_value = sample_income_data
 
         summary = income_analyzer.get_monthly_summary(2024, 7)
 
@@ -226,7 +227,7 @@ class TestMonthlySummary:
         self, income_analyzer, mock_data_loader, sample_income_data
     ):
         """構成比率の合計が100%"""
-        mock_data_loader.load.return_value = sample_income_data
+        mock_data_loader.load_month.return_value = sample_income_data
 
         summary = income_analyzer.get_monthly_summary(2024, 7)
 
@@ -235,7 +236,7 @@ class TestMonthlySummary:
 
     def test_get_monthly_summary_empty_data(self, income_analyzer, mock_data_loader):
         """データがない場合は0を返す"""
-        mock_data_loader.load.side_effect = FileNotFoundError()
+        mock_data_loader.load_month.side_effect = FileNotFoundError()
 
         summary = income_analyzer.get_monthly_summary(2024, 7)
 
@@ -248,6 +249,7 @@ class TestAnnualSummary:
 
     def test_get_annual_summary_basic(self, income_analyzer, mock_data_loader):
         """基本的な年次サマリー取得"""
+
         # 複数月のデータをモック
         def load_side_effect(year, month):
             return pd.DataFrame(
@@ -260,7 +262,7 @@ class TestAnnualSummary:
                 }
             )
 
-        mock_data_loader.load.side_effect = load_side_effect
+        mock_data_loader.load_month.side_effect = load_side_effect
 
         summary = income_analyzer.get_annual_summary(2024)
 
@@ -285,7 +287,7 @@ class TestAnnualSummary:
                 }
             )
 
-        mock_data_loader.load.side_effect = load_side_effect
+        mock_data_loader.load_month.side_effect = load_side_effect
 
         summary = income_analyzer.get_annual_summary(2024)
 
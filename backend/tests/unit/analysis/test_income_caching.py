@@ -2,10 +2,16 @@
 
 from datetime import datetime, timedelta
 from decimal import Decimal
+from unittest.mock import Mock, patch
 
+import pandas as pd
 import pytest
 
-from household_mcp.analysis.income_analyzer import IncomeAnalyzer, IncomeCategory
+from household_mcp.analysis.income_analyzer import (
+    IncomeAnalyzer,
+    IncomeCategory,
+    IncomeSummary,
+)
 from household_mcp.database.manager import DatabaseManager
 from household_mcp.database.models import IncomeSnapshot
 from household_mcp.dataloader import HouseholdDataLoader
@@ -129,6 +135,130 @@ def test_cache_update_on_recalculation(analyzer, db_manager):
         assert snapshot2.updated_at > updated_at_1
 
 
+def test_save_snapshot_upserts_single_row(db_manager):
+    """Test saving the same month twice updates the existing snapshot."""
+    analyzer = IncomeAnalyzer(Mock(spec=HouseholdDataLoader), db_manager)
+    categories = IncomeCategory.all_categories()
+
+    for salary in (100000, 250000):
+        breakdown = {cat: Decimal("0") for cat in categories}
+        breakdown[IncomeCategory.SALARY] = Decimal(salary)
+        analyzer._save_snapshot_to_cache(
+            IncomeSummary(
+                year=2024,
+                month=6,
+                total_income=Decimal(salary),
+                category_breakdown=breakdown,
+                category_ratios={cat: Decimal("0") for cat in categories},
+                previous_period_change=None,
+                average_monthly=None,
+            )
+        )
+
+    with db_manager.get_session() as session:
+        snapshots = (
+            session.query(IncomeSnapshot)
+            .filter(IncomeSnapshot.snapshot_month == "2024-06")
+            .all()
+        )
+        assert len(snapshots) == 1
+        assert snapshots[0].salary_income == 250000
+        assert snapshots[0].total_income == 250000
+
+
+def test_cache_miss_uses_single_session(db_manager):
+    """Test the cache read and write on a miss share one session."""
+    data_loader = Mock(spec=HouseholdDataLoader)
+    data_loader.load_month.return_value = pd.DataFrame(
+        {
+            "日付": pd.to_datetime(["2024-07-25"]),
+            "金額（円）": [300000],
+            "計算対象": [1],
+            "大項目": ["給与"],
+            "中項目": ["給与"],
+        }
+    )
+    analyzer = IncomeAnalyzer(data_loader, db_manager)
+
+    with patch.object(
+        db_manager, "get_session", wraps=db_manager.get_session
+    ) as get_session:
+        summary = analyzer.get_monthly_summary(2024, 7, include_previous_change=False)
+
+    assert summary.total_income == Decimal("300000")
+    assert get_session.call_count == 1
+    assert analyzer._get_cached_snapshot(2024, 7) is not None
+
+
+def test_monthly_summary_with_previous_change_uses_single_session(db_manager):
+    """Test the previous-month lookup reuses the summary's session."""
+    data_loader = Mock(spec=HouseholdDataLoader)
+    data_loader.load_month.side_effect = lambda year, month: pd.DataFrame(
+        {
+            "日付": pd.to_datetime([f"2024-{month:02d}-25"]),
+            "金額（円）": [300000 if month == 7 else 250000],
+            "計算対象": [1],
+            "大項目": ["給与"],
+            "中項目": ["給与"],
+        }
+    )
+    analyzer = IncomeAnalyzer(data_loader, db_manager)
+
+    with patch.object(
+        db_manager, "get_session", wraps=db_manager.get_session
+    ) as get_session:
+        summary = analyzer.get_monthly_summary(2024, 7)
+
+    assert summary.previous_period_change == Decimal("20.00")
+    assert get_session.call_count == 1
+
+
+def test_annual_total_uses_given_session(db_manager):
+    """Test the annual snapshot aggregate runs in the caller's session."""
+    data_loader = Mock(spec=HouseholdDataLoader)
+    data_loader.load_month.side_effect = FileNotFoundError
+    analyzer = IncomeAnalyzer(data_loader, db_manager)
+
+    with (
+        patch.object(
+            db_manager, "get_session", wraps=db_manager.get_session
+        ) as get_session,
+        db_manager.get_session() as session,
+    ):
+        assert analyzer._annual_total_from_cache(2023, session) is None
+        assert analyzer._compute_annual_total(2023, session) == Decimal("0")
+
+    assert get_session.call_count == 1
+
+
+def test_annual_total_reads_complete_snapshot_year(db_manager):
+    """Test the annual total comes from 12 fresh snapshots without CSV loads."""
+    data_loader = Mock(spec=HouseholdDataLoader)
+    analyzer = IncomeAnalyzer(data_loader, db_manager)
+    categories = IncomeCategory.all_categories()
+
+    for month in range(1, 13):
+        breakdown = {cat: Decimal("0") for cat in categories}
+        breakdown[IncomeCategory.SALARY] = Decimal(100000 * month)
+        analyzer._save_snapshot_to_cache(
+            IncomeSummary(
+                year=2023,
+                month=month,
+                total_income=Decimal(100000 * month),
+                category_breakdown=breakdown,
+                category_ratios={cat: Decimal("0") for cat in categories},
+                previous_period_change=None,
+                average_monthly=None,
+            )
+        )
+        if month == 11:
+            # 11ヶ月分だけではCSVから集計する
+            assert analyzer._annual_total_from_cache(2023) is None
+
+    assert analyzer._compute_annual_total(2023) == Decimal("7800000")
+    data_loader.load_month.assert_not_called()
+
+
 def test_without_database_manager():
     """Test analyzer works without database (no caching)."""
     data_loader = HouseholdDataLoader()
@@ -0,0 +1,46 @@
+"""カテゴリのキーワード判定のテスト"""
+
+import pandas as pd
+
+from household_mcp.analysis.keyword_match import (
+    category_keyword_mask,
+    compile_keywords,
+)
+
+
+def test_categorical_and_object_columns_match_the_same_rows():
+    """カテゴリ型でも文字列型でも同じ行を判定する（欠損値は一致しない）"""
+    pattern = compile_keywords(["住宅", "光熱"])
+    df = pd.DataFrame(
+        {
+            "大項目": ["住宅", "食費", None, "水道・光熱費", "食費"],
+            "中項目": ["家賃", "外食", "住宅ローン", None, None],
+        }
+    )
+    categorical = df.astype({"大項目": "category", "中項目": "category"})
+
+    expected = [True, False, True, True, False]
+    assert category_keyword_mask(df, pattern).tolist() == expected
+    assert category_keyword_mask(categorical, pattern).tolist() == expected
+
+
+def test_keywords_are_matched_literally_and_missing_columns_ignored():
+    """キーワードは正規表現として解釈せず、存在しない列は無視する"""
+    pattern = compile_keywords(["a.b"])
+    df = pd.DataFrame({"大項目": ["a.b", "axb"]}, index=[10, 20])
+
+    mask = category_keyword_mask(df, pattern)
+
+    assert mask.tolist() == [True, False]
+    assert mask.index.tolist() == [10, 20]
+
+
+def test_empty_keywords_match_no_rows():
+    """キーワードが空の場合はパターンを作らず、どの行にも一致しない"""
+    pattern = compile_keywords([])
+    df = pd.DataFrame({"大項目": ["住宅", "食費"], "中項目": ["家賃", "外食"]})
+
+    assert pattern is None
+    assert category_keyword_mask(df, pattern).tolist() == [False, False]
+    categorical = df.astype({"大項目": "category"})
+    assert category_keyword_mask(categorical, pattern).tolist() == [False, False]
@@ -35,6 +35,15 @@ def property_database_json():
     }"""
 
 
+def _loader_with_month(data_dir, month, rows):
+    """2024年の指定月の CSV を書き込み、そのディレクトリのデータローダーを返す"""
+    loader = HouseholdDataLoader(src_dir=data_dir)
+    loader.month_csv_path(2024, month).write_text(
+        "日付,計算対象,金額（円）,大項目,中項目\n" + rows, encoding="cp932"
+    )
+    return loader
+
+
 @pytest.fixture
 def mock_data_loader():
     """モックデータローダー"""
@@ -69,7 +78,7 @@ class TestRealEstateCashflow:
                 "備考": ["property_001", "property_001"],
             }
         )
-        mock_data_loader.load.return_value = data
+        mock_data_loader.load_month.return_value = data
 
         cashflow = analyzer.calculate_cashflow(
             date(2024, 7, 1), date(2024, 7, 31), "property_001"
@@ -108,6 +117,128 @@ class TestRealEstateCashflow:
         assert cashflow.roi is not None
         assert abs(cashflow.roi - expected_roi) < Decimal("0.01")
 
+    def test_keyword_filter_matches_either_column(self, analyzer):
+        """大項目・中項目どちらかのキーワード一致で抽出する"""
+        df = pd.DataFrame(
+            {
+                "日付": pd.to_datetime(["2024-07-05"] * 5),
+                "金額（円）": [100000, 50000, 3000, -20000, -8000],
+                "計算対象": [1, 1, 1, 1, 1],
+                "大項目": ["不動産", "収入", "収入", "住宅", None],
+                "中項目": ["家賃", "家賃収入", "給与", "ローン", "修繕費"],
+            }
+        )
+
+        income = analyzer._extract_real_estate_income(df, None)
+        expense = analyzer._extract_real_estate_expense(df, None)
+
+        assert list(income["金額（円）"]) == [100000, 50000]
+        assert list(expense["金額（円）"]) == [-20000, -8000]
+
+    def test_month_loaded_once_across_calls(self, tmp_path, property_database_json):
+        """同じ月の再計算ではデータローダーのキャッシュを使いCSVを再読み込みしない"""
+        loader = _loader_with_month(
+            tmp_path, 7, "2024-07-05,1,100000,不動産,家賃収入\n"
+        )
+        with patch("builtins.open", mock_open(read_data=property_database_json)):
+            analyzer = RealEstateCashflowAnalyzer(Mock(spec=IncomeAnalyzer), loader)
+
+        first = analyzer.calculate_cashflow(date(2024, 7, 1), date(2024, 7, 31))
+        second = analyzer.calculate_cashflow(date(2024, 7, 1), date(2024, 7, 31))
+
+        assert first.income == second.income == Decimal("100000.00")
+        assert loader.cache_stats()["misses"] == 1
+
+        analyzer.clear_cache()
+        analyzer.calculate_cashflow(date(2024, 7, 1), date(2024, 7, 31))
+        assert loader.cache_stats()["misses"] == 1
+        assert loader.cache_stats()["hits"] == 0
+
+    def test_month_cache_shared_with_income_analyzer(
+        self, tmp_path, property_database_json
+    ):
+        """同じローダーの IncomeAnalyzer と月次データを共有し、CSVは1回だけ読む"""
+        loader = _loader_with_month(
+            tmp_path, 7, "2024-07-05,1,100000,不動産,家賃収入\n"
+        )
+        income_analyzer = IncomeAnalyzer(loader)
+        with patch("builtins.open", mock_open(read_data=property_database_json)):
+            re_analyzer = RealEstateCashflowAnalyzer(income_analyzer, loader)
+
+        income_analyzer.extract_income_records(date(2024, 7, 1), date(2024, 7, 31))
+        cashflow = re_analyzer.calculate_cashflow(date(2024, 7, 1), date(2024, 7, 31))
+
+        assert cashflow.income == Decimal("100000.00")
+        assert loader.cache_stats() == {"hits": 1, "misses": 1, "size": 1}
+
+    def test_months_prefetched_through_loader(self, analyzer, mock_data_loader):
+        """複数月はデータローダーのプリフェッチでまとめて読み込む"""
+        mock_data_loader.load_month.side_effect = lambda year, month: pd.DataFrame(
+            {
+                "日付": pd.to_datetime([f"2024-{month:02d}-05"]),
+                "金額（円）": [100000],
+                "計算対象": [1],
+                "大項目": ["不動産"],
+                "中項目": ["家賃収入"],
+            }
+        )
+
+        cashflow = analyzer.calculate_cashflow(date(2024, 7, 1), date(2024, 9, 30))
+
+        assert cashflow.income == Decimal("300000.00")
+        mock_data_loader.prefetch_months.assert_called_once_with(
+            [(2024, 7), (2024, 8), (2024, 9)]
+        )
+
+    def test_missing_months_return_typed_empty_frame(self, analyzer, mock_data_loader):
+        """データがない期間でも読み込み結果と同じ列・型の空のDataFrameを返す"""
+        mock_data_loader.load_month.side_effect = FileNotFoundError
+
+        result = analyzer._load_period_data(date(2024, 7, 1), date(2024, 7, 31))
+
+        assert result.empty
+        assert {"日付", "金額（円）", "計算対象", "大項目", "中項目"} <= set(
+            result.columns
+        )
+        assert isinstance(result["大項目"].dtype, pd.CategoricalDtype)
+        assert analyzer._extract_real_estate_income(result, None).empty
+        assert analyzer._extract_real_estate_expense(result, None).empty
+
+    def test_load_period_data_prefilters_months(self, analyzer, mock_data_loader):
+        """計算対象外と期間外の行は結合前に除外する"""
+        mock_data_loader.load_month.return_value = pd.DataFrame(
+            {
+                "日付": pd.to_datetime(["2024-07-05", "2024-07-20", "2024-07-10"]),
+                "金額（円）": [100000, 50000, 30000],
+                "計算対象": [1, 1, 0],
+                "大項目": ["不動産"] * 3,
+                "中項目": ["家賃収入"] * 3,
+            }
+        )
+
+        result = analyzer._load_period_data(date(2024, 7, 1), date(2024, 7, 15))
+
+        assert list(result["金額（円）"]) == [100000]
+        assert isinstance(result["大項目"].dtype, pd.CategoricalDtype)
+
+    def test_keyword_filter_on_categorical_columns(self, analyzer):
+        """カテゴリ型の列でも文字列列と同じ行を抽出する"""
+        df = pd.DataFrame(
+            {
+                "金額（円）": [100000, 50000, 3000, -20000],
+                "計算対象": [1, 1, 1, 1],
+                "大項目": ["不動産", None, "収入", "住宅"],
+                "中項目": ["家賃", "家賃収入", "給与", None],
+            }
+        )
+        categorical = df.astype({"大項目": "category", "中項目": "category"})
+
+        for frame in (df, categorical):
+            income = analyzer._extract_real_estate_income(frame, None)
+            expense = analyzer._extract_real_estate_expense(frame, None)
+            assert list(income["金額（円）"]) == [100000, 50000]
+            assert list(expense["金額（円）"]) == [-20000]
+
 
 class TestPropertyDatabase:
     """物件データベーステスト"""
@@ -3,7 +3,9 @@
 TASK-2004: Phase 1 単体テスト
 """
 
-from decimal import Decimal
+import os
+from datetime import date
+from decimal import ROUND_HALF_UP, Decimal
 from unittest.mock import Mock, patch
 
 import pandas as pd
@@ -86,7 +88,7 @@ class TestMonthlySavingsRate:
                 "中項目": ["家賃", "食料品"],
             }
         )
-        mock_data_loader.load.return_value = expense_data
+        mock_data_loader.load_month.return_value = expense_data
 
         metrics = calculator.calculate_monthly_savings_rate(2024, 7)
 
@@ -124,7 +126,7 @@ class TestMonthlySavingsRate:
                 "中項目": ["外食"],
             }
         )
-        mock_data_loader.load.return_value = expense_data
+        mock_data_loader.load_month.return_value = expense_data
 
         metrics = calculator.calculate_monthly_savings_rate(2024, 7)
 
@@ -133,6 +135,235 @@ class TestMonthlySavingsRate:
         # 貯蓄率: (-100000 / 100000) * 100 = -100.00%
         assert metrics.savings_rate == Decimal("-100.00")
 
+    def test_fixed_and_variable_costs_split(
+        self, calculator, mock_income_analyzer, mock_data_loader
+    ):
+        """固定費・変動費の合計は行単位の分類と一致する"""
+        mock_income_analyzer.get_monthly_summary.return_value = IncomeSummary(
+            year=2024,
+            month=7,
+            total_income=Decimal("300000"),
+            category_breakdown={},
+            category_ratios={},
+            previous_period_change=None,
+            average_monthly=None,
+        )
+        expense_data = pd.DataFrame(
+            {
+                "日付": pd.to_datetime(["2024-07-01"] * 4),
+                "金額（円）": [-80000, -12000, -30000, -5000],
+                "計算対象": [1, 1, 1, 1],
+                "大項目": ["住宅", "水道・光熱費", "食費", "その他"],
+                "中項目": ["家賃", "電気代", "食料品", "生命保険"],
+            }
+        ).astype({"大項目": "category", "中項目": "category"})
+        mock_data_loader.load_month.return_value = expense_data
+
+        metrics = calculator.calculate_monthly_savings_rate(2024, 7)
+
+        assert metrics.fixed_costs == Decimal("97000.00")
+        assert metrics.variable_costs == Decimal("30000.00")
+
+    def test_nullable_missing_values_are_not_expenses(
+        self, calculator, mock_income_analyzer, mock_data_loader
+    ):
+        """金額・計算対象が欠損値の行は支出に含めない"""
+        mock_income_analyzer.get_monthly_summary.return_value = IncomeSummary(
+            year=2024,
+            month=7,
+            total_income=Decimal("300000"),
+            category_breakdown={},
+            category_ratios={},
+            previous_period_change=None,
+            average_monthly=None,
+        )
+        mock_data_loader.load_month.return_value = pd.DataFrame(
+            {
+                "日付": pd.to_datetime(["2024-07-01"] * 3),
+                "金額（円）": pd.array([-80000, None, -30000], dtype="Int64"),
+                "計算対象": pd.array([1, 1, None], dtype="Int64"),
+                "大項目": ["住宅", "住宅", "食費"],
+                "中項目": ["家賃", "家賃", "食料品"],
+            }
+        ).astype({"大項目": "category", "中項目": "category"})
+
+        metrics = calculator.calculate_monthly_savings_rate(2024, 7)
+
+        assert metrics.fixed_costs == Decimal("80000.00")
+        assert metrics.variable_costs == Decimal("0.00")
+
+    def test_monthly_metrics_are_cached_until_invalidated(
+        self, calculator, mock_income_analyzer, mock_data_loader
+    ):
+        """同じ月の再計算はキャッシュを使い、invalidate 後は再計算する"""
+        mock_income_analyzer.get_monthly_summary.return_value = IncomeSummary(
+            year=2024,
+            month=7,
+            total_income=Decimal("300000"),
+            category_breakdown={},
+            category_ratios={},
+            previous_period_change=None,
+            average_monthly=None,
+        )
+        mock_data_loader.load_month.return_value = pd.DataFrame(
+            {
+                "日付": pd.to_datetime(["2024-07-01"]),
+                "金額（円）": [-100000],
+                "計算対象": [1],
+                "大項目": ["住宅"],
+                "中項目": ["家賃"],
+            }
+        )
+
+        first = calculator.calculate_monthly_savings_rate(2024, 7)
+        second = calculator.calculate_monthly_savings_rate(2024, 7)
+        assert first == second
+        assert mock_data_loader.load_month.call_count == 1
+
+        calculator.invalidate(2024, 7)
+        calculator.calculate_monthly_savings_rate(2024, 7)
+        assert mock_data_loader.load_month.call_count == 2
+
+    def test_metrics_recomputed_when_csv_changes(self, tmp_path, mock_income_analyzer):
+        """CSV が更新された月は invalidate を呼ばなくても再計算する"""
+        mock_income_analyzer.get_monthly_summary.return_value = IncomeSummary(
+            year=2024,
+            month=7,
+            total_income=Decimal("300000"),
+            category_breakdown={},
+            category_ratios={},
+            previous_period_change=None,
+            average_monthly=None,
+        )
+        loader = HouseholdDataLoader(src_dir=tmp_path)
+        calculator = SavingsRateCalculator(mock_income_analyzer, loader)
+        path = loader.month_csv_path(2024, 7)
+        header = "日付,計算対象,金額（円）,大項目,中項目\n"
+
+        path.write_text(header + "2024-07-01,1,-100000,食費,食料品\n", encoding="cp932")
+        assert calculator.calculate_monthly_savings_rate(2024, 7).expense == 100000
+
+        path.write_text(header + "2024-07-01,1,-150000,食費,食料品\n", encoding="cp932")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert calculator.calculate_monthly_savings_rate(2024, 7).expense == 150000
+
+    def test_metrics_cache_is_bounded(self, calculator, mock_data_loader):
+        """保持する月数は METRICS_CACHE_SIZE まで"""
+        mock_data_loader.exists.return_value = False
+
+        with patch(
+            "household_mcp.analysis.savings_rate_calculator.METRICS_CACHE_SIZE", 2
+        ):
+            trend = calculator.get_savings_rate_trend(
+                date(2024, 1, 1), date(2024, 3, 31)
+            )
+
+        assert [(m.year, m.month) for m in trend] == [(2024, 1), (2024, 2), (2024, 3)]
+        assert list(calculator._metrics_cache) == [(2024, 2), (2024, 3)]
+
+    def test_trend_aggregates_months_in_one_pass(
+        self, calculator, mock_income_analyzer, mock_data_loader
+    ):
+        """推移は各月を1回だけ読み込み、月次計算と同じ結果を返す"""
+        mock_income_analyzer.get_monthly_summary.side_effect = (
+            lambda year, month: IncomeSummary(
+                year=year,
+                month=month,
+                total_income=Decimal("200000"),
+                category_breakdown={},
+                category_ratios={},
+                previous_period_change=None,
+                average_monthly=None,
+            )
+        )
+        mock_data_loader.load_month.side_effect = lambda year, month: pd.DataFrame(
+            {
+                "日付": pd.to_datetime([f"{year}-{month:02d}-01"] * 2),
+                "金額（円）": [-50000, -10000 * month],
+                "計算対象": [1, 1],
+                "大項目": ["住宅", "食費"],
+                "中項目": ["家賃", "食料品"],
+            }
+        )
+
+        trend = calculator.get_savings_rate_trend(date(2024, 11, 1), date(2025, 1, 31))
+
+        assert [(m.year, m.month) for m in trend] == [(2024, 11), (2024, 12), (2025, 1)]
+        assert [m.variable_costs for m in trend] == [
+            Decimal("110000.00"),
+            Decimal("120000.00"),
+            Decimal("10000.00"),
+        ]
+        assert all(m.fixed_costs == Decimal("50000.00") for m in trend)
+        assert mock_data_loader.load_month.call_count == 3
+
+        calculator.clear_cache()
+        assert calculator.calculate_monthly_savings_rate(2025, 1) == trend[2]
+
+    def test_trend_skips_months_without_csv(
+        self, calculator, mock_income_analyzer, mock_data_loader
+    ):
+        """CSV のない月は収入・支出を読み込まずに空のメトリクスを返す"""
+        mock_data_loader.exists.side_effect = lambda year, month: month == 2
+        mock_income_analyzer.get_monthly_summary.return_value = IncomeSummary(
+            year=2024,
+            month=2,
+            total_income=Decimal("300000"),
+            category_breakdown={},
+            category_ratios={},
+            previous_period_change=None,
+            average_monthly=None,
+        )
+        mock_data_loader.load_month.return_value = pd.DataFrame(
+            {
+                "日付": pd.to_datetime(["2024-02-01"]),
+                "金額（円）": [-100000],
+                "計算対象": [1],
+                "大項目": ["食費"],
+                "中項目": ["食料品"],
+            }
+        )
+
+        trend = calculator.get_savings_rate_trend(date(2024, 1, 1), date(2024, 3, 31))
+
+        assert [m.expense for m in trend] == [0, Decimal("100000"), 0]
+        assert [m.income for m in trend] == [0, Decimal("300000"), 0]
+        mock_income_analyzer.get_monthly_summary.assert_called_once_with(2024, 2)
+        mock_data_loader.load_month.assert_called_once_with(2024, 2)
+
+
+class TestPercentRounding:
+    """百分率丸めのテスト"""
+
+    @pytest.mark.parametrize(
+        ("numerator", "denominator"),
+        [
+            ("1", "2000"),  # 0.05% ちょうど
+            ("-1", "2000"),
+            ("1", "3"),
+            ("-2", "3"),
+            ("123456", "654321"),
+            ("100000.5", "300000"),  # 整数でない場合は Decimal で計算
+        ],
+    )
+    def test_matches_decimal_half_up(self, numerator, denominator):
+        """整数演算の結果が Decimal の ROUND_HALF_UP と一致する"""
+        expected = (Decimal(numerator) / Decimal(denominator) * 100).quantize(
+            Decimal("0.01"), rounding=ROUND_HALF_UP
+        )
+
+        result = SavingsRateCalculator._percent(
+            Decimal(numerator), Decimal(denominator)
+        )
+
+        assert result == expected
+        assert result.as_tuple().exponent == -2
+
+    def test_non_positive_denominator_is_zero(self):
+        """分母が0以下なら0を返す"""
+        assert SavingsRateCalculator._percent(Decimal("100"), Decimal("0")) == 0
+
 
 class TestSavingsMetricsDataclass:
     """SavingsMetricsデータクラステスト"""
@@ -157,3 +388,42 @@ class TestSavingsMetricsDataclass:
         assert result["year"] == 2024
         assert result["income"] == 300000.0
         assert isinstance(result["savings_rate"], float)
+
+    def test_to_dict_rounds_amounts_to_two_decimals(self):
+        """金額は出力時に小数第2位へ丸められる"""
+        metrics = SavingsMetrics(
+            year=2024,
+            month=7,
+            income=Decimal("300000.456"),
+            expense=Decimal("200000"),
+            savings=Decimal("100000.456"),
+            savings_rate=Decimal("33.33"),
+            disposable_income=Decimal("250000.454"),
+            fixed_costs=Decimal("50000"),
+            variable_costs=Decimal("150000"),
+            variable_cost_ratio=Decimal("60.00"),
+        )
+
+        result = metrics.to_dict()
+
+        assert result["income"] == 300000.46
+        assert result["savings"] == 100000.46
+        assert result["disposable_income"] == 250000.45
+        assert result["expense"] == 200000.0
+
+    def test_metrics_use_slots(self):
+        """インスタンスごとの __dict__ を持たない"""
+        metrics = SavingsMetrics(
+            year=2024,
+            month=7,
+            income=Decimal("1"),
+            expense=Decimal("0"),
+            savings=Decimal("1"),
+            savings_rate=Decimal("100.00"),
+            disposable_income=Decimal("1"),
+            fixed_costs=Decimal("0"),
+            variable_costs=Decimal("0"),
+            variable_cost_ratio=Decimal("0.00"),
+        )
+
+        assert not hasattr(metrics, "__dict__")
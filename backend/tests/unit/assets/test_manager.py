@@ -3,10 +3,12 @@
 from datetime import datetime
 
 import pytest
+from sqlalchemy import event
 
 from household_mcp.assets.manager import AssetManager
 from household_mcp.assets.models import AssetRecordRequest
 from household_mcp.database.manager import DatabaseManager
+from household_mcp.database.models import AssetClass, AssetRecord
 
 
 @pytest.fixture
@@ -200,3 +202,152 @@ class TestAssetManager:
                 end_date=datetime(2025, 3, 31),
             )
             assert len(records) == 2
+
+    def test_get_records_single_query_matches_get_record(self, temp_db_with_manager):
+        """一覧取得は1クエリで行い、個別取得と同じ内容を返す."""
+        with temp_db_with_manager.session_scope() as session:
+            manager = AssetManager(session)
+            for class_id in [1, 2, 3]:
+                manager.create_record(
+                    AssetRecordRequest(
+                        record_date=datetime(2025, class_id, 28),
+                        asset_class_id=class_id,
+                        sub_asset_name="テスト",
+                        amount=100000 * class_id,
+                    )
+                )
+            session.expire_all()
+
+            statements = []
+
+            def count(conn, cursor, statement, parameters, context, executemany):
+                statements.append(statement)
+
+            event.listen(temp_db_with_manager.engine, "before_cursor_execute", count)
+            try:
+                records = manager.get_records()
+            finally:
+                event.remove(
+                    temp_db_with_manager.engine, "before_cursor_execute", count
+                )
+
+            assert len(statements) == 1
+            assert [r.asset_class_name for r in records] == ["投資信託", "株", "現金"]
+            for record in records:
+                assert record == manager.get_record(record.id)
+
+    def test_create_records_batch(self, temp_db_with_manager):
+        """一括作成は入力順にレコードを返し、個別取得と一致する."""
+        with temp_db_with_manager.session_scope() as session:
+            manager = AssetManager(session)
+            requests = [
+                AssetRecordRequest(
+                    record_date=datetime(2025, 1, 31),
+                    asset_class_id=class_id,
+                    sub_asset_name=f"資産{class_id}",
+                    amount=10000 * class_id,
+                )
+                for class_id in [2, 1, 3]
+            ]
+
+            responses = manager.create_records(requests)
+
+            assert [r.sub_asset_name for r in responses] == ["資産2", "資産1", "資産3"]
+            assert [r.asset_class_name for r in responses] == ["株", "現金", "投資信託"]
+            for response in responses:
+                assert response == manager.get_record(response.id)
+            assert manager.create_records([]) == []
+
+    def test_update_and_delete_share_timestamp(self, temp_db_with_manager):
+        """呼び出し側から渡した更新日時がそのまま記録される."""
+        with temp_db_with_manager.session_scope() as session:
+            manager = AssetManager(session)
+            first, second = manager.create_records(
+                [
+                    AssetRecordRequest(
+                        record_date=datetime(2025, 1, 31),
+                        asset_class_id=1,
+                        sub_asset_name=name,
+                        amount=100000,
+                    )
+                    for name in ("更新", "削除")
+                ]
+            )
+            now = datetime(2025, 2, 1, 12, 0)
+
+            updated = manager.update_record(
+                first.id,
+                AssetRecordRequest(
+                    record_date=datetime(2025, 1, 31),
+                    asset_class_id=1,
+                    sub_asset_name="更新",
+                    amount=200000,
+                ),
+                now=now,
+            )
+            assert manager.delete_record(second.id, now=now) is True
+
+            deleted = session.get(AssetRecord, second.id)
+            assert updated.updated_at == now
+            assert deleted.updated_at == now
+
+    def test_asset_class_names_loaded_once(self, temp_db_with_manager):
+        """資産クラス名はマネージャー単位で1回だけ読み込む."""
+        with temp_db_with_manager.session_scope() as session:
+            manager = AssetManager(session)
+            created = manager.create_records(
+                [
+                    AssetRecordRequest(
+                        record_date=datetime(2025, 1, 31),
+                        asset_class_id=class_id,
+                        sub_asset_name="テスト",
+                        amount=100000,
+                    )
+                    for class_id in [1, 2, 3]
+                ]
+            )
+            session.expire_all()
+
+            statements = []
+
+            def count(conn, cursor, statement, parameters, context, executemany):
+                statements.append(statement)
+
+            event.listen(temp_db_with_manager.engine, "before_cursor_execute", count)
+            try:
+                names = [manager.get_record(r.id).asset_class_name for r in created]
+            finally:
+                event.remove(
+                    temp_db_with_manager.engine, "before_cursor_execute", count
+                )
+
+            # レコード取得の3回のみで、資産クラスの遅延ロードは発生しない
+            assert len(statements) == 3
+            assert names == ["現金", "株", "投資信託"]
+
+    def test_unknown_asset_class_does_not_requery(self, temp_db_with_manager):
+        """未知の資産クラスIDは再クエリせず、明示的な再読込で反映する."""
+        with temp_db_with_manager.session_scope() as session:
+            manager = AssetManager(session)
+
+            statements = []
+
+            def count(conn, cursor, statement, parameters, context, executemany):
+                statements.append(statement)
+
+            event.listen(temp_db_with_manager.engine, "before_cursor_execute", count)
+            try:
+                names = [manager._asset_class_name(999) for _ in range(3)]
+            finally:
+                event.remove(
+                    temp_db_with_manager.engine, "before_cursor_execute", count
+                )
+
+            assert names == ["", "", ""]
+            assert statements == []
+
+            session.add(AssetClass(id=999, name="crypto", display_name="暗号資産"))
+            session.flush()
+            assert manager._asset_class_name(999) == ""
+            manager.refresh_asset_classes()
+            assert manager._asset_class_name(999) == "暗号資産"
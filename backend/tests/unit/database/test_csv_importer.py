@@ -185,5 +185,157 @@ def test_import_with_missing_columns(db_manager, tmp_path):  # type: ignore[no-u
         assert trans.memo == ""
 
 
+def test_import_reports_invalid_rows(db_manager, tmp_path):  # type: ignore[no-untyped-def]
+    """解析できない日付・金額の行だけをエラーとして記録するテスト."""
+    csv_path = tmp_path / "収入・支出詳細_2025-02-01_2025-02-28.csv"
+    data = {
+        "日付": ["2025-02-01", "不正な日付", "2025-02-03", "2025/02/04"],
+        "金額（円）": ["1000", "-500", "千円", "-300"],
+        "内容": ["給与", "食費", "不明", "交通費"],
+        "計算対象": [1, 1, 1, 0],
+    }
+    pd.DataFrame(data).to_csv(csv_path, index=False, encoding="cp932")
+
+    with db_manager.session_scope() as session:
+        importer = CSVImporter(session)
+        result = importer.import_csv(str(csv_path))
+
+        assert result["imported"] == 2
+        assert [error["row"] for error in result["errors"]] == [1, 2]
+
+        transactions = session.query(Transaction).order_by(Transaction.row_number)
+        assert [(t.row_number, t.amount, t.is_target) for t in transactions] == [
+            (0, Decimal("1000"), 1),
+            (3, Decimal("-300"), 0),
+        ]
+
+
+def test_import_inserts_in_batches(db_manager, tmp_path):  # type: ignore[no-untyped-def]
+    """バッチ上限を超える行数でも全件挿入され、列の既定値が入るテスト."""
+    csv_path = tmp_path / "収入・支出詳細_2025-03-01_2025-03-31.csv"
+    count = 1201
+    data = {
+        "日付": ["2025-03-01"] * count,
+        "金額（円）": [-100] * count,
+        "内容": [f"item{i}" for i in range(count)],
+    }
+    pd.DataFrame(data).to_csv(csv_path, index=False, encoding="cp932")
+
+    with db_manager.session_scope() as session:
+        importer = CSVImporter(session)
+        result = importer.import_csv(str(csv_path))
+
+        assert result == {"imported": count, "skipped": 0, "errors": []}
+        assert session.query(Transaction).count() == count
+
+        last = session.query(Transaction).filter_by(row_number=count - 1).one()
+        assert last.description == f"item{count - 1}"
+        assert last.is_target == 1
+        assert last.is_duplicate == 0
+        assert last.created_at is not None
+
+
+def test_import_reads_in_chunks(db_manager, tmp_path, monkeypatch):  # type: ignore[no-untyped-def]
+    """チャンク分割して読み込んでも行番号と重複スキップが保たれるテスト."""
+    from household_mcp.database import csv_importer
+
+    monkeypatch.setattr(csv_importer, "_READ_CHUNK_SIZE", 3)
+    csv_path = tmp_path / "収入・支出詳細_2025-04-01_2025-04-30.csv"
+    data = {
+        "日付": ["2025-04-01"] * 8,
+        "金額（円）": list(range(-8, 0)),
+        "内容": [f"item{i}" for i in range(8)],
+    }
+    pd.DataFrame(data).head(4).to_csv(csv_path, index=False, encoding="cp932")
+
+    with db_manager.session_scope() as session:
+        importer = CSVImporter(session)
+        assert importer.import_csv(str(csv_path))["imported"] == 4
+
+        pd.DataFrame(data).to_csv(csv_path, index=False, encoding="cp932")
+        result = importer.import_csv(str(csv_path))
+        assert result == {"imported": 4, "skipped": 4, "errors": []}
+
+        transactions = session.query(Transaction).order_by(Transaction.row_number)
+        assert [(t.row_number, t.description) for t in transactions] == [
+            (i, f"item{i}") for i in range(8)
+        ]
+
+
+def test_import_keeps_fractional_amounts(db_manager, tmp_path):  # type: ignore[no-untyped-def]
+    """整数と小数が混在する金額列を正確に保存するテスト."""
+    csv_path = tmp_path / "収入・支出詳細_2025-05-01_2025-05-31.csv"
+    data = {
+        "日付": ["2025-05-01", "2025-05-02", "2025-05-03"],
+        "金額(円)": ["-1000", "12.5", "300000"],
+    }
+    pd.DataFrame(data).to_csv(csv_path, index=False, encoding="cp932")
+
+    with db_manager.session_scope() as session:
+        importer = CSVImporter(session)
+        assert importer.import_csv(str(csv_path))["imported"] == 3
+
+        transactions = session.query(Transaction).order_by(Transaction.row_number)
+        assert [t.amount for t in transactions] == [
+            Decimal("-1000"),
+            Decimal("12.5"),
+            Decimal("300000"),
+        ]
+
+
+def test_import_all_csvs_in_file_order(db_manager, tmp_path):  # type: ignore[no-untyped-def]
+    """ファイル名順に取り込み、エラーにファイル名が付くテスト."""
+    for month in range(1, 6):
+        csv_path = tmp_path / f"収入・支出詳細_2025-0{month}-01_2025-0{month}-31.csv"
+        data = {
+            "日付": [f"2025-0{month}-01", "不正な日付" if month == 3 else "2025-01-02"],
+            "金額（円）": [1000 * month, -500 * month],
+            "内容": [f"収入{month}", f"支出{month}"],
+        }
+        pd.DataFrame(data).to_csv(csv_path, index=False, encoding="cp932")
+
+    with db_manager.session_scope() as session:
+        importer = CSVImporter(session)
+        result = importer.import_all_csvs(str(tmp_path))
+
+        assert result["files_processed"] == 5
+        assert result["total_imported"] == 9
+        assert [(e["file"], e["row"]) for e in result["errors"]] == [
+            ("収入・支出詳細_2025-03-01_2025-03-31.csv", 1)
+        ]
+
+        transactions = session.query(Transaction).order_by(Transaction.id)
+        assert [t.description for t in transactions] == [
+            "収入1",
+            "支出1",
+            "収入2",
+            "支出2",
+            "収入3",
+            "収入4",
+            "支出4",
+            "収入5",
+            "支出5",
+        ]
+
+        again = importer.import_all_csvs(str(tmp_path))
+        assert again["total_imported"] == 0
+        assert again["total_skipped"] == 9
+
+
+def test_import_all_csvs_uses_encoding(db_manager, tmp_path):  # type: ignore[no-untyped-def]
+    """指定したエンコーディングを各ファイルの読み込みに使うテスト."""
+    csv_path = tmp_path / "収入・支出詳細_2025-06-01_2025-06-30.csv"
+    data = {"日付": ["2025-06-01"], "金額（円）": [-1000], "内容": ["食費"]}
+    pd.DataFrame(data).to_csv(csv_path, index=False, encoding="utf-8")
+
+    with db_manager.session_scope() as session:
+        importer = CSVImporter(session)
+        result = importer.import_all_csvs(str(tmp_path), encoding="utf-8")
+
+        assert result["total_imported"] == 1
+        assert result["errors"] == []
+        assert session.query(Transaction).one().description == "食費"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
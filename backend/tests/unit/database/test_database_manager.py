@@ -180,3 +180,35 @@ if __name__ == "__main__":
     print("✓ Duplicate check creation test passed")
 
     print("\nAll tests passed!")
+
+
+@pytest.mark.parametrize("fast", ["1", "0"])
+def test_fresh_database_uses_wal(monkeypatch, fast):  # type: ignore[no-untyped-def]
+    """新規作成した DB は高速化設定の有無にかかわらず WAL モードになるテスト."""
+    monkeypatch.setenv("HOUSEHOLD_SQLITE_FAST", fast)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "test.db")
+        db_manager = DatabaseManager(db_path)
+        db_manager.initialize_database()
+
+        with db_manager.engine.connect() as conn:
+            journal_mode = conn.exec_driver_sql("PRAGMA journal_mode").scalar()
+        assert journal_mode == "wal"
+
+        db_manager.close()
+
+        # WAL は DB ファイルに保存され、新しいマネージャーからも維持される
+        reopened = DatabaseManager(db_path)
+        with reopened.engine.connect() as conn:
+            assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+        reopened.close()
+
+
+def test_lazy_attributes_are_cached():  # type: ignore[no-untyped-def]
+    """遅延インポートした属性がパッケージに保持されるテスト."""
+    import household_mcp.database as database
+
+    assert set(database._LAZY) == set(database.__all__)
+    assert database.CSVImporter is vars(database)["CSVImporter"]
+    with pytest.raises(AttributeError):
+        database.NotDefined  # noqa: B018
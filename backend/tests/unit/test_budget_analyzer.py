@@ -113,3 +113,33 @@ class TestBudgetAnalyzer:
 
         assert result["period"] == "2024-02"
         assert result["transaction_count"] == 1
+
+    def test_monthly_index_skips_unparseable_dates(self, sample_csv_data, tmp_path):
+        """Rows with unparseable dates are excluded from every month."""
+        sample_csv_data.loc[1, "date"] = "not a date"
+        csv_path = tmp_path / "budget.csv"
+        sample_csv_data.to_csv(csv_path, index=False, encoding="utf-8")
+        analyzer = BudgetAnalyzer(csv_path, encoding="utf-8")
+        analyzer.load_data()
+
+        january = analyzer.get_monthly_summary(2024, 1)
+        february = analyzer.get_monthly_summary(2024, 2)
+
+        assert january["transaction_count"] == 2
+        assert january["total_expense"] == 2000
+        assert february["transaction_count"] == 1
+        assert set(analyzer._month_rows) == {(2024, 1), (2024, 2)}
+
+    def test_missing_category_counts_in_totals_only(self, sample_csv_data, tmp_path):
+        """Rows without a category count toward totals but not the breakdown."""
+        sample_csv_data.loc[2, "minor_category"] = None
+        csv_path = tmp_path / "budget.csv"
+        sample_csv_data.to_csv(csv_path, index=False, encoding="utf-8")
+        analyzer = BudgetAnalyzer(csv_path, encoding="utf-8")
+        analyzer.load_data()
+
+        result = analyzer.get_monthly_summary(2024, 1)
+
+        assert result["total_income"] == 300000
+        assert result["total_expense"] == 7000
+        assert result["expense_by_category"] == {"外食": 5000}
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import os
 import time
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -59,3 +61,74 @@ def test_cache_behaviour(tmp_path: Path) -> None:
 def test_load_missing(tmp_path: Path) -> None:
     with pytest.raises(DataSourceError):
         HouseholdDataLoader(src_dir=tmp_path / "not-exist")
+
+
+def test_exists_checks_month_csv(tmp_path: Path) -> None:
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    (data_dir / "収入・支出詳細_2025-07-01_2025-07-31.csv").write_text(
+        "日付,計算対象,金額（円）,大項目,中項目\n", encoding="cp932"
+    )
+    loader = HouseholdDataLoader(src_dir=data_dir)
+
+    assert loader.exists(2025, 7)
+    assert not loader.exists(2025, 8)
+
+
+def _write_month_csv(data_dir: Path, month: int, amount: int = -1000) -> Path:
+    loader = HouseholdDataLoader(src_dir=data_dir)
+    path = loader.month_csv_path(2025, month)
+    path.write_text(
+        "日付,計算対象,金額（円）,大項目,中項目\n"
+        f"2025-{month:02d}-01,1,{amount},食費,自炊\n",
+        encoding="cp932",
+    )
+    return path
+
+
+def test_cache_detects_size_change_within_same_mtime(tmp_path: Path) -> None:
+    path = _write_month_csv(tmp_path, 7, -1000)
+    loader = HouseholdDataLoader(src_dir=tmp_path)
+    loader.load_month(2025, 7)
+
+    # 同じ更新時刻のまま書き換えてもサイズの違いで更新を検知する
+    mtime_ns = path.stat().st_mtime_ns
+    _write_month_csv(tmp_path, 7, -12000)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+    assert loader.load_month(2025, 7)["金額（円）"].sum() == -12000
+    assert loader.cache_stats()["misses"] == 2
+
+
+def test_cache_evicts_least_recently_used_month(tmp_path: Path) -> None:
+    for month in (1, 2, 3):
+        _write_month_csv(tmp_path, month)
+    loader = HouseholdDataLoader(src_dir=tmp_path)
+
+    with patch("household_mcp.dataloader.MONTH_CACHE_SIZE", 2):
+        loader.load_month(2025, 1)
+        loader.load_month(2025, 2)
+        loader.load_month(2025, 1)
+        loader.load_month(2025, 3)
+
+        assert loader.cache_size() == 2
+        loader.load_month(2025, 1)
+        assert loader.cache_stats()["hits"] == 2
+        loader.load_month(2025, 2)
+        assert loader.cache_stats()["misses"] == 4
+
+
+def test_prefetch_months_loads_each_month_once(tmp_path: Path) -> None:
+    for month in (7, 8, 9):
+        _write_month_csv(tmp_path, month)
+    loader = HouseholdDataLoader(src_dir=tmp_path)
+    months = [(2025, 7), (2025, 8), (2025, 9), (2025, 10)]
+
+    with patch("household_mcp.dataloader.os.cpu_count", return_value=4):
+        loader.prefetch_months(months)
+        # 読み込み済みの月は再度読まない（存在しない月は対象外）
+        loader.prefetch_months(months)
+
+    assert loader.cache_stats() == {"hits": 0, "misses": 3, "size": 3}
+    loader.load_many(months[:3])
+    assert loader.cache_stats()["hits"] == 3
@@ -35,6 +35,22 @@ def test_normalize_columns_minimal():
     assert out["金額（円）"].dtype.name.startswith("Int")
 
 
+def test_normalize_columns_month_start_matches_period(tmp_path: Path):
+    loader = HouseholdDataLoader(src_dir=tmp_path)
+    df = pd.DataFrame(
+        {
+            "計算対象": [1, 1, 1],
+            "金額（円）": [-100, 200, -300],
+            "日付": ["2024-02-29", "2023-12-31", "2024-07-01"],
+            "大項目": ["食費", "収入", "住宅"],
+            "中項目": ["外食", "給与", "家賃"],
+        }
+    )
+    out = loader._normalize_columns(df)
+    expected = out["日付"].dt.to_period("M").dt.to_timestamp()
+    pd.testing.assert_series_equal(out["年月"], expected, check_names=False)
+
+
 def test_normalize_columns_missing_required():
     loader = HouseholdDataLoader(src_dir=Path("data"))
     df = pd.DataFrame({"金額（円）": [-100], "日付": ["2024-01-01"]})
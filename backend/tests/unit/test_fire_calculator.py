@@ -4,7 +4,12 @@ from decimal import Decimal
 
 import pytest
 
-from household_mcp.analysis.fire_calculator import FIRECalculator, calculate_fire_index
+from household_mcp.analysis.fire_calculator import (
+    FIRECalculator,
+    _monthly_rate,
+    _simulate_scenario_cached,
+    calculate_fire_index,
+)
 
 
 def test_calculate_fire_target_default_multiplier():
@@ -23,6 +28,27 @@ def test_calculate_fire_target_invalid():
         FIRECalculator.calculate_fire_target(0)
 
 
+def test_calculate_fire_target_cache_keeps_argument_type():
+    assert FIRECalculator.calculate_fire_target(1_000_000.0) == 25_000_000.0
+    result = FIRECalculator.calculate_fire_target(Decimal("1000000"))
+    assert isinstance(result, Decimal)
+    assert result == Decimal("25000000")
+
+
+def test_scenario_monthly_rates_are_cached():
+    calculate_fire_index(
+        Decimal("1000000"), Decimal("50000"), Decimal("30000000"), Decimal("0.05")
+    )
+    hits = _monthly_rate.cache_info().hits
+    scenario_hits = _simulate_scenario_cached.cache_info().hits
+    calculate_fire_index(
+        Decimal("1000000"), Decimal("50000"), Decimal("30000000"), Decimal("0.05")
+    )
+    # 本計算の月利率とシナリオ3件の結果はすべてキャッシュから取得される
+    assert _monthly_rate.cache_info().hits - hits == 1
+    assert _simulate_scenario_cached.cache_info().hits - scenario_hits == 3
+
+
 def test_calculate_progress_rate_and_is_fi_achieved():
     target = FIRECalculator.calculate_fire_target(1_000_000.0)
     # progress rate
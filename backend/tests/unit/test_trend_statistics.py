@@ -1,5 +1,6 @@
 """Unit tests for trend_statistics helper utilities."""
 
+import math
 from typing import Any
 
 import pytest
@@ -44,3 +45,72 @@ def test_calculate_months_to_fi_small():
     months = stats.calculate_months_to_fi(140, 200, 0.05)
     assert isinstance(months, float)
     assert months >= -1
+
+
+def test_average_growth_skips_zero_previous_month():
+    # 0 -> 50 is skipped; remaining rates are +100%, +10% and -100%
+    result = TrendStatistics._calculate_by_average([0.0, 50.0, 100.0, 110.0, 0.0])
+
+    assert result.data_points == 3
+    assert result.growth_rate_decimal == pytest.approx((1.0 + 0.1 - 1.0) / 3, abs=1e-6)
+
+
+def test_average_growth_without_valid_pairs():
+    result = TrendStatistics._calculate_by_average([0.0, 0.0])
+
+    assert result.data_points == 0
+    assert result.monthly_growth_rate == 0.0
+    assert result.confidence == 0.0
+
+
+def test_project_assets_many_matches_scalar_projection():
+    projected = TrendStatistics.project_assets_many(1_234_567.0, 0.0123, [0, 12, 60])
+
+    assert projected == [
+        round(1_234_567.0 * (1.0123**months), 2) for months in (0, 12, 60)
+    ]
+    assert projected[1] == TrendStatistics.project_assets(1_234_567.0, 0.0123, 12)
+    with pytest.raises(ValueError):
+        TrendStatistics.project_assets_many(100.0, 0.01, [12, -1])
+
+
+def test_project_assets_overflow_raises():
+    # 単一月数は Python の float 演算のまま、複数月数でも inf を返さずに例外とする
+    with pytest.raises(OverflowError):
+        TrendStatistics.project_assets(100.0, 1.0, 2000)
+    with pytest.raises(OverflowError):
+        TrendStatistics.project_assets_many(100.0, 1.0, [12, 2000])
+
+
+def test_months_to_fi_precise_for_tiny_growth_rate():
+    # log(1 + rate) では 1 + rate の丸めで相対誤差が 1e-4 程度になる
+    rate = 1e-12
+    months = TrendStatistics.calculate_months_to_fi(100.0, 150.0, rate)
+
+    assert months == pytest.approx(math.log(1.5) / rate, rel=1e-9)
+
+
+def test_moving_average_matches_window_means():
+    values = [100.0, 250.0, 175.5, 300.25, 90.0, 410.0]
+
+    ma = TrendStatistics.calculate_moving_average(values, window=3)
+
+    expected = [sum(values[i - 2 : i + 1]) / 3 for i in range(2, len(values))]
+    assert ma[:2] == [100.0, 100.0]
+    assert ma[2:] == pytest.approx(expected, rel=1e-12)
+
+
+def test_regression_closed_form():
+    # y = 100 + 10x の完全な直線: 傾き 10、初月 100 で月 10%、R² = 1
+    result = TrendStatistics._calculate_by_regression([100.0, 110.0, 120.0, 130.0])
+
+    assert result.growth_rate_decimal == pytest.approx(0.1)
+    assert result.r_squared == 1.0
+    assert result.data_points == 4
+
+
+def test_regression_constant_series_has_zero_confidence():
+    result = TrendStatistics._calculate_by_regression([500.0, 500.0, 500.0])
+
+    assert result.growth_rate_decimal == 0.0
+    assert result.confidence == 0.0
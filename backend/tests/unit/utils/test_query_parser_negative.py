@@ -8,6 +8,7 @@ import pytest
 
 from household_mcp.utils.query_parser import (
     ValidationError,
+    iter_months,
     resolve_trend_query,
     sorted_available_months,
 )
@@ -66,3 +67,16 @@ def test_resolve_trend_query_default_window_clamps() -> None:
     )
     assert query.start == date(2025, 6, 1)
     assert query.end == date(2025, 7, 1)
+
+
+def test_iter_months_crosses_year_boundary() -> None:
+    assert list(iter_months(date(2024, 11, 20), date(2025, 2, 3))) == [
+        (2024, 11),
+        (2024, 12),
+        (2025, 1),
+        (2025, 2),
+    ]
+
+
+def test_iter_months_empty_when_end_before_start() -> None:
+    assert list(iter_months(date(2025, 3, 1), date(2025, 2, 28))) == []